@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Abwesenheitsbericht (Abteilung x Monat)
+
+Synthetische Datenbank wie bench_statistics_engine, zusätzlich längere
+Krankheiten und Urlaube über Monatsgrenzen. Verglichen werden:
+    schleife  pro Eintrag eine Schleife über seine Monate, Arbeitstage
+              pro Abschnitt mit WorkdayCalendar.count, Summen im Dict
+    numpy     export_absence_report.compute_absence_report (Zerlegung mit
+              np.repeat, ein np.bincount)
+
+Beide Zeiten enthalten das Lesen aus der Datenbank. Tage und Kopfzahl
+beider Verfahren müssen übereinstimmen.
+
+Usage: python bench_absence_report.py [--employees 1000] [--years 10]
+"""
+
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_data import create_database  # noqa: E402
+from export_from_db import open_database  # noqa: E402
+from workday_calendar import WorkdayCalendar  # noqa: E402
+from export_absence_report import compute_absence_report, _QUERIES, ARTEN  # noqa: E402
+
+
+def add_long_entries(db_path, first_year, last_year, seed=7):
+    """Krankheiten und Urlaube von 2 bis 12 Wochen, oft über Monats- und Jahresgrenzen"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    ids = [row[0] for row in conn.execute("SELECT id FROM mitarbeiter")]
+    tage = (date(last_year, 12, 31) - date(first_year, 1, 1)).days
+    for ma_id in ids:
+        for _ in range(rng.randint(0, last_year - first_year + 1)):
+            von = date(first_year, 1, 1) + timedelta(days=rng.randint(0, tage))
+            bis = von + timedelta(days=rng.randint(14, 84))
+            tabelle = rng.choice(['krankheit', 'urlaub'])
+            conn.execute(f"INSERT INTO {tabelle} (mitarbeiter_id, von_datum, bis_datum, tage) VALUES (?, ?, ?, ?)",
+                         (ma_id, von.isoformat(), bis.isoformat(), (bis - von).days * 5 // 7))
+    conn.commit()
+    conn.close()
+
+
+def report_loop(conn, von_jahr, bis_jahr):
+    """Naheliegende Umsetzung: Python-Schleifen über Einträge und Monate"""
+    mitarbeiter = conn.execute("""
+        SELECT COALESCE(a.name, ''), m.eintrittsdatum, m.austrittsdatum
+        FROM mitarbeiter m LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV'
+    """).fetchall()
+    namen = sorted({ma[0] for ma in mitarbeiter}, key=lambda name: (name == '', name.casefold()))
+    index = {name: i for i, name in enumerate(namen)}
+    anzahl_monate = (bis_jahr - von_jahr + 1) * 12
+
+    def monatsgrenzen(m):
+        jahr, monat = von_jahr + m // 12, m % 12 + 1
+        ende = date(jahr + monat // 12, monat % 12 + 1, 1) - timedelta(days=1)
+        return date(jahr, monat, 1), ende
+
+    grenzen = [monatsgrenzen(m) for m in range(anzahl_monate)]
+    kopfzahl = np.zeros((len(namen), anzahl_monate), dtype=np.int64)
+    for abteilung, eintritt, austritt in mitarbeiter:
+        eintritt = date.fromisoformat(eintritt)
+        austritt = date.fromisoformat(austritt) if austritt else date.max
+        for m, (anfang, ende) in enumerate(grenzen):
+            if eintritt <= ende and austritt >= anfang:
+                kopfzahl[index[abteilung], m] += 1
+
+    eintraege = [(art, *row) for art, sql in _QUERIES
+                 for row in conn.execute(sql, (f"{bis_jahr}-12-31", f"{von_jahr}-01-01"))]
+    erstes = min([von_jahr] + [int(e[2][:4]) for e in eintraege])
+    letztes = max([bis_jahr] + [int(e[3][:4]) for e in eintraege])
+    calendar = WorkdayCalendar.from_database(conn, erstes, letztes)
+
+    summen = {}
+    for art, abteilung, von, bis, wert in eintraege:
+        von, bis = date.fromisoformat(von), date.fromisoformat(bis)
+        gesamt = calendar.count(von, bis)
+        kalendertage = (bis - von).days + 1
+        for m, (anfang, ende) in enumerate(grenzen):
+            a, b = max(von, anfang), min(bis, ende)
+            if a > b:
+                continue
+            anteil = calendar.count(a, b) / gesamt if gesamt > 0 else ((b - a).days + 1) / kalendertage
+            key = (index[abteilung], m, art)
+            summen[key] = summen.get(key, 0) + wert * anteil
+
+    tage = np.zeros((len(namen), anzahl_monate, len(ARTEN)))
+    for key, value in summen.items():
+        tage[key] = value
+    return tage, kopfzahl
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=1000)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--last-year', type=int, default=2025)
+    args = parser.parse_args()
+
+    bis_jahr = args.last_year
+    von_jahr = bis_jahr - args.years + 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'bench.db'
+        seconds, _ = timed(lambda: create_database(db_path, args.employees, von_jahr, bis_jahr))
+        add_long_entries(db_path, von_jahr, bis_jahr)
+        conn = open_database(db_path)
+        eintraege = sum(conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in ('urlaub', 'krankheit', 'schulung'))
+        print(f"Datenbank: {args.employees} Mitarbeiter x {args.years} Jahre, {eintraege} Einträge ({seconds:.1f} s)")
+
+        t_loop, (loop_tage, loop_kopfzahl) = timed(lambda: report_loop(conn, von_jahr, bis_jahr))
+        t_numpy, bericht = timed(lambda: compute_absence_report(conn, von_jahr, bis_jahr))
+        conn.close()
+
+    identical = np.allclose(loop_tage, bericht.tage) and np.array_equal(loop_kopfzahl, bericht.kopfzahl)
+    print(f"{'Verfahren':<10} {'Zeit (s)':>9} {'Faktor':>8}")
+    print(f"{'schleife':<10} {t_loop:>9.3f} {1:>7.1f}x")
+    print(f"{'numpy':<10} {t_numpy:>9.3f} {t_loop / t_numpy:>7.1f}x")
+    print(f"Ergebnis identisch: {'ja' if identical else 'NEIN'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
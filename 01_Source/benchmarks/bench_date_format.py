@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Datumsformatierung der Mitarbeiter-Detail-PDF
+
+Zeilenaufbau der Abwesenheitstabelle für --records Einträge (Überstunden
+über viele Jahre, ein kleiner Anteil mit fehlerhaftem Datum):
+    strptime   bisheriger Weg: sortieren nach String, strptime/strftime
+               pro Feld mit try/except, Typ-Tabelle pro Eintrag
+    export_dates  format_date / date_sort_key mit Zwischenspeicher
+                  (vor jedem Lauf geleert)
+
+Die Tabellenzeilen beider Verfahren werden verglichen; fehlerhafte
+Daten stehen bei export_dates am Ende statt nach Stringvergleich.
+
+Usage: python bench_date_format.py [--records 100000] [--years 10]
+"""
+
+import io
+import sys
+import time
+import random
+import argparse
+import contextlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import export_dates  # noqa: E402
+from export_dates import format_date, date_sort_key  # noqa: E402
+from export_employee_detail import TYP_LABELS  # noqa: E402
+
+FEHLERHAFT = ["", "2025-02-30", "31.12.24", "2024-13-01", "unbekannt"]
+
+
+def generate_absence(count, years, seed=42, broken_share=0.001):
+    rng = random.Random(seed)
+    start = date(2026 - years, 1, 1)
+    days = years * 365
+    entries = []
+    for _ in range(count):
+        if rng.random() < broken_share:
+            datum = rng.choice(FEHLERHAFT)
+        else:
+            datum = (start + timedelta(days=rng.randint(0, days - 1))).isoformat()
+        typ = rng.choice(['ueberstunden', 'ueberstunden', 'ueberstunden', 'krankheit', 'schulung'])
+        entries.append({'typ': typ, 'datum': datum, 'wert': rng.choice([-2, 1, 1.5, 3.5]), 'notiz': ''})
+    return entries
+
+
+def rows_strptime(absence_data):
+    """Schleife wie bisher in build_employee_elements"""
+    rows = []
+    for entry in sorted(absence_data, key=lambda x: x.get('datum', ''), reverse=True):
+        typ = entry.get('typ', '')
+        datum = entry.get('datum', '')
+        try:
+            datum_formatted = datetime.strptime(datum, '%Y-%m-%d').strftime('%d.%m.%Y')
+        except:  # noqa: E722 - bewusst wie im alten Code
+            datum_formatted = datum
+        typ_labels = {
+            'krankheit': 'Krankheit',
+            'schulung': 'Schulung',
+            'ueberstunden': 'Überstunden'
+        }
+        rows.append((typ_labels.get(typ, typ), datum_formatted))
+    return rows
+
+
+def rows_export_dates(absence_data):
+    """Schleife wie jetzt in build_employee_elements"""
+    rows = []
+    for entry in sorted(absence_data, key=lambda x: date_sort_key(x.get('datum')), reverse=True):
+        typ = entry.get('typ', '')
+        rows.append((TYP_LABELS.get(typ, typ), format_date(entry.get('datum'))))
+    return rows
+
+
+def timed(func, entries):
+    export_dates._convert.cache_clear()
+    export_dates._warn_invalid.cache_clear()
+    with contextlib.redirect_stderr(io.TextIOWrapper(io.BytesIO())):
+        start = time.perf_counter()
+        rows = func(entries)
+        return time.perf_counter() - start, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--years', type=int, default=10)
+    args = parser.parse_args()
+
+    entries = generate_absence(args.records, args.years)
+
+    old_seconds, old_rows = timed(rows_strptime, entries)
+    new_seconds, new_rows = timed(rows_export_dates, entries)
+
+    # Gleiche Zeilen; nur die Position fehlerhafter Daten darf abweichen
+    identical = (sorted(old_rows) == sorted(new_rows)
+                 and [row for row in old_rows if row[1] not in FEHLERHAFT]
+                 == [row for row in new_rows if row[1] not in FEHLERHAFT])
+    broken = sum(1 for entry in entries if date_sort_key(entry['datum']) == '')
+
+    print(f"{args.records} Einträge über {args.years} Jahre, {broken} fehlerhafte Daten")
+    print(f"{'Variante':<14} {'Zeit (ms)':>10} {'Faktor':>7}")
+    print(f"{'strptime':<14} {old_seconds * 1000:>10.1f} {1:>6.1f}x")
+    print(f"{'export_dates':<14} {new_seconds * 1000:>10.1f} {old_seconds / new_seconds:>6.1f}x")
+    print(f"Zeilen identisch: {'ja' if identical else 'NEIN'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
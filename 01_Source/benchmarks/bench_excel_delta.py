@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Delta-Export vs. kompletter Neuexport der Excel-Übersicht
+
+Ausgangspunkt ist eine Übersicht mit --rows Zeilen (normaler Modus). Danach
+ändert sich ein Anteil der Zeilen (--changed, Standard 1 %):
+    komplett            create_excel mit allen neuen Zeilen
+    komplett streaming  create_excel(streaming=True)
+    delta               excel_delta.update_excel gegen die alte Datei
+    delta markiert      dasselbe mit markierten Zellen
+
+Die Werte der Delta-Datei werden gegen den kompletten Export geprüft.
+
+Usage: python bench_excel_delta.py [--rows 10000] [--changed 0.01]
+"""
+
+import io
+import os
+import sys
+import copy
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from openpyxl import load_workbook  # noqa: E402
+
+from export_to_excel import create_excel, SHEET_TITLE  # noqa: E402
+from excel_delta import update_excel  # noqa: E402
+from synthetic_data import iter_overview_rows  # noqa: E402
+
+
+def change_rows(rows, share, seed=42):
+    """Kopie mit geänderten Werten in einem Anteil der Zeilen (Urlaub genommen)"""
+    changed = copy.deepcopy(rows)
+    for i in random.Random(seed).sample(range(len(rows)), max(1, int(len(rows) * share))):
+        changed[i]['urlaub_genommen'] += 1
+        changed[i]['urlaub_rest'] -= 1
+    return changed
+
+
+def sheet_values(path):
+    return list(load_workbook(path, read_only=True)[SHEET_TITLE].iter_rows(values_only=True))
+
+
+def timed(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--changed', type=float, default=0.01, help="Anteil geänderter Zeilen")
+    args = parser.parse_args()
+
+    rows = list(iter_overview_rows(args.rows))
+    new_rows = change_rows(rows, args.changed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = os.path.join(tmp, 'vorher.xlsx')
+        timed(create_excel, rows, previous)
+
+        full = os.path.join(tmp, 'komplett.xlsx')
+        results = [
+            ('komplett', timed(create_excel, new_rows, full)[0]),
+            ('komplett streaming', timed(create_excel, new_rows, os.path.join(tmp, 'streaming.xlsx'), streaming=True)[0]),
+        ]
+        delta = os.path.join(tmp, 'delta.xlsx')
+        seconds, counts = timed(update_excel, previous, new_rows, delta)
+        results.append(('delta', seconds))
+        results.append(('delta markiert', timed(update_excel, previous, new_rows, os.path.join(tmp, 'markiert.xlsx'), highlight=True)[0]))
+
+        identical = sheet_values(delta) == sheet_values(full)
+
+    print(f"{args.rows} Zeilen, {counts['geaendert']} geändert")
+    print(f"{'Variante':<20} {'Zeit (s)':>9}")
+    for name, seconds in results:
+        print(f"{name:<20} {seconds:>9.3f}")
+    print(f"Werte identisch: {'ja' if identical else 'NEIN'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
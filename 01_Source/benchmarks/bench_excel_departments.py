@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Mappe mit einem Blatt pro Abteilung, parallel erzeugt
+
+Misst die Wall-Clock-Zeit von create_excel(departments=True) mit 1, 2, 4
+und 8 Workern gegen den bisherigen Export in ein einziges Blatt
+(Write-Only-Modus, wie ihn main.js für große Exporte nutzt). Der Inhalt
+der Mappen (alle ZIP-Einträge außer der Erstellungszeit) muss für jede
+Worker-Anzahl identisch sein.
+
+Der Gewinn durch mehrere Worker ist durch die Anzahl CPU-Kerne begrenzt;
+auf einem Kern zeigt die Tabelle nur den Pool-Overhead.
+
+Usage: python bench_excel_departments.py [--rows 100000] [--departments 50] [--workers 1 2 4 8]
+"""
+
+import io
+import os
+import sys
+import time
+import hashlib
+import zipfile
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from export_to_excel import create_excel  # noqa: E402
+from synthetic_data import iter_overview_rows  # noqa: E402
+
+
+def content_hash(path):
+    """Hash über Namen und Inhalt aller ZIP-Einträge (ohne docProps/core.xml mit Erstellungszeit)"""
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(path) as archive:
+        for name in sorted(archive.namelist()):
+            if name == 'docProps/core.xml':
+                continue
+            digest.update(name.encode('utf-8'))
+            digest.update(archive.read(name))
+    return digest.hexdigest()
+
+
+def timed(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--departments', type=int, default=50)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    rows = list(iter_overview_rows(args.rows, departments=args.departments))
+    print(f"{args.rows} Zeilen, {args.departments} Abteilungen, {os.cpu_count()} CPU-Kerne")
+    print(f"{'Variante':<22} {'Zeit (s)':>9} {'Speedup':>8}")
+
+    hashes = set()
+    with tempfile.TemporaryDirectory() as tmp:
+        single = timed(create_excel, rows, os.path.join(tmp, 'single.xlsx'), streaming=True)
+        print(f"{'ein Blatt (streaming)':<22} {single:>9.3f} {'':>8}")
+
+        baseline = None
+        for workers in args.workers:
+            path = os.path.join(tmp, f"departments_{workers}.xlsx")
+            seconds = timed(create_excel, rows, path, departments=True, workers=workers)
+            baseline = baseline or seconds
+            hashes.add(content_hash(path))
+            print(f"{f'Abteilungen, {workers} Worker':<22} {seconds:>9.3f} {baseline / seconds:>7.2f}x")
+
+    print(f"Inhalt identisch: {'ja' if len(hashes) == 1 else 'NEIN'}")
+    if len(hashes) != 1:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
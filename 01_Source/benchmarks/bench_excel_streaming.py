@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: normaler vs. Write-Only (streaming) Excel-Export
+
+Jede Messung läuft in einem eigenen Python-Prozess, damit der maximale
+Speicherverbrauch (Peak RSS) pro Modus sauber getrennt ist. Die Zeilen
+werden als Generator erzeugt, so wie sie beim NDJSON-Streaming ankommen.
+
+Usage: python bench_excel_streaming.py [--sizes 1000 10000 100000]
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_data import iter_overview_rows  # noqa: E402
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float('nan')
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux liefert KiB, macOS Bytes
+    return rss / 1024 / 1024 if sys.platform == 'darwin' else rss / 1024
+
+
+def run_single(mode, count, output_path):
+    """Eine Messung im aktuellen Prozess, Ergebnis als JSON auf stdout"""
+    import io
+    import contextlib
+    from export_to_excel import create_excel
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        create_excel(iter_overview_rows(count), output_path, streaming=(mode == 'streaming'))
+    seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        'mode': mode,
+        'rows': count,
+        'seconds': seconds,
+        'rows_per_second': count / seconds,
+        'peak_rss_mb': peak_rss_mb(),
+        'baseline_rss_mb': baseline,
+        'file_size_kb': Path(output_path).stat().st_size / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--single', nargs=2, metavar=('MODE', 'ROWS'), help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args.single[0], int(args.single[1]), args.output)
+        return
+
+    print(f"{'Modus':<10} {'Zeilen':>8} {'Zeit (s)':>9} {'Zeilen/s':>10} {'Peak RSS (MB)':>14} {'Datei (KB)':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.sizes:
+            for mode in ('normal', 'streaming'):
+                output = Path(tmp) / f"{mode}_{count}.xlsx"
+                proc = subprocess.run(
+                    [sys.executable, __file__, '--single', mode, str(count), '--output', str(output)],
+                    check=True, capture_output=True, text=True
+                )
+                r = json.loads(proc.stdout.strip().splitlines()[-1])
+                print(f"{r['mode']:<10} {r['rows']:>8} {r['seconds']:>9.2f} {r['rows_per_second']:>10.0f} "
+                      f"{r['peak_rss_mb']:>14.1f} {r['file_size_kb']:>11.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Einzelprozess pro Export vs. warmer Export-Server
+
+Misst die Latenz typischer Übersichts-Exporte (40-200 Zeilen), einmal mit
+einem frischen Python-Prozess pro Export (bisheriger Weg über main.js) und
+einmal über den langlebigen export_server.py.
+
+Usage: python bench_export_server.py [--runs 5]
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from export_server import encode_job  # noqa: E402
+from synthetic_data import iter_overview_rows  # noqa: E402
+
+
+def bench_cold(script, rows, out_dir, runs):
+    """Ein Python-Prozess pro Export, Eingabe über temporäre JSON-Datei"""
+    input_path = out_dir / 'input.json'
+    input_path.write_text(json.dumps(rows), encoding='utf-8')
+    output_path = out_dir / ('cold' + ('.xlsx' if 'excel' in script else '.pdf'))
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(SCRIPT_DIR / script), str(input_path), str(output_path)],
+            check=True, stdout=subprocess.DEVNULL
+        )
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def read_result(stream):
+    """Nächste Ergebniszeile des Servers, Fortschrittszeilen werden übersprungen"""
+    while True:
+        message = json.loads(stream.readline())
+        if 'event' not in message:
+            return message
+
+
+def bench_warm(job_type, rows, out_dir, runs):
+    """Alle Exporte über einen bereits gestarteten Export-Server"""
+    server = subprocess.Popen(
+        [sys.executable, str(SCRIPT_DIR / 'export_server.py')],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    suffix = '.xlsx' if job_type == 'excel' else '.pdf'
+
+    # Erster Job wird nicht gemessen (Server-Start)
+    server.stdin.write(encode_job({'id': 0, 'type': job_type, 'output': str(out_dir / f"warmup{suffix}"), 'data': rows}))
+    server.stdin.flush()
+    read_result(server.stdout)
+
+    times = []
+    for i in range(1, runs + 1):
+        start = time.perf_counter()
+        server.stdin.write(encode_job({'id': i, 'type': job_type, 'output': str(out_dir / f"warm{suffix}"), 'data': rows}))
+        server.stdin.flush()
+        result = read_result(server.stdout)
+        times.append(time.perf_counter() - start)
+        if not result.get('success'):
+            raise RuntimeError(result.get('error'))
+
+    server.stdin.close()
+    server.wait()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        print(f"{'Export':<8} {'Zeilen':>7} {'Kalt (ms)':>11} {'Warm (ms)':>11} {'Faktor':>7}")
+        for script, job_type in (('export_to_excel.py', 'excel'), ('export_to_pdf.py', 'pdf')):
+            for count in (40, 200):
+                rows = list(iter_overview_rows(count))
+                cold = min(bench_cold(script, rows, out_dir, args.runs))
+                warm = min(bench_warm(job_type, rows, out_dir, args.runs))
+                print(f"{job_type:<8} {count:>7} {cold * 1000:>11.1f} {warm * 1000:>11.1f} {cold / warm:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
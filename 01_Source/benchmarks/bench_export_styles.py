@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Style-Zuweisung pro Zelle vs. gemeinsame NamedStyles
+
+Profiliert den Zeilen-Workload von create_excel (ohne Speichern):
+    bisher       Border/Fill/Font/Alignment pro Zelle zuweisen; openpyxl
+                 hasht die Objekte und sucht sie im Workbook
+    namedstyle   cell.style = Name aus export_styles (ein Tupel-Kopie pro Zelle)
+
+Gemessen werden Zeit, Python-Funktionsaufrufe pro Zelle (beim bisherigen
+Weg vor allem Serialisable.__iter__/__hash__/__eq__, die für jeden Hash
+und Vergleich temporäre Tupel und Strings allozieren) und der Peak der
+Speicher-Allokationen (tracemalloc).
+
+Usage: python bench_export_styles.py [--rows 5000]
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from openpyxl import Workbook  # noqa: E402
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side  # noqa: E402
+
+from export_styles import register_excel_styles, EXCEL_HEADER_STYLE, EXCEL_DATA_STYLE  # noqa: E402
+from export_to_excel import COLUMNS  # noqa: E402
+
+# Style-Objekte wie im bisherigen export_to_excel.py
+HEADER_FILL = PatternFill(start_color="1F538D", end_color="1F538D", fill_type="solid")
+HEADER_FONT = Font(color="FFFFFF", bold=True, size=12)
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+from synthetic_data import iter_overview_rows  # noqa: E402
+
+
+def fill_per_cell(ws, rows):
+    for col, (header, _, _, _) in enumerate(COLUMNS, 1):
+        cell = ws.cell(row=1, column=col, value=header)
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGNMENT
+        cell.border = THIN_BORDER
+    for row_idx, entry in enumerate(rows, 2):
+        for col, (_, key, default, _) in enumerate(COLUMNS, 1):
+            ws.cell(row=row_idx, column=col, value=entry.get(key, default)).border = THIN_BORDER
+
+
+def fill_named(ws, rows):
+    for col, (header, _, _, _) in enumerate(COLUMNS, 1):
+        ws.cell(row=1, column=col, value=header).style = EXCEL_HEADER_STYLE
+    for row_idx, entry in enumerate(rows, 2):
+        for col, (_, key, default, _) in enumerate(COLUMNS, 1):
+            ws.cell(row=row_idx, column=col, value=entry.get(key, default)).style = EXCEL_DATA_STYLE
+
+
+def profile(fill, count):
+    rows = list(iter_overview_rows(count))
+
+    # Zeit
+    wb = Workbook()
+    register_excel_styles(wb)
+    start = time.perf_counter()
+    fill(wb.active, rows)
+    seconds = time.perf_counter() - start
+
+    # Python-Funktionsaufrufe
+    wb = Workbook()
+    register_excel_styles(wb)
+    calls = [0]
+
+    def tracer(frame, event, arg):
+        if event == 'call':
+            calls[0] += 1
+
+    sys.setprofile(tracer)
+    fill(wb.active, rows)
+    sys.setprofile(None)
+
+    # Allokations-Peak
+    wb = Workbook()
+    register_excel_styles(wb)
+    tracemalloc.start()
+    fill(wb.active, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, calls[0], peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000)
+    args = parser.parse_args()
+
+    cells = args.rows * len(COLUMNS)
+    print(f"{args.rows} Zeilen, {cells} Zellen")
+    print(f"{'Variante':<12} {'Zeit (s)':>9} {'Aufrufe':>14} {'pro Zelle':>10} {'Peak (MB)':>10}")
+    for name, fill in (('bisher', fill_per_cell), ('namedstyle', fill_named)):
+        seconds, calls, peak = profile(fill, args.rows)
+        print(f"{name:<12} {seconds:>9.3f} {calls:>14} {calls / cells:>10.1f} {peak / 1024 / 1024:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: TrueType-Schriften in den PDF-Exporten
+
+Jeder Lauf ist ein eigener Prozess, wie beim Aufruf aus der App; die
+Schriften werden also jedes Mal neu registriert. Verglichen werden:
+    helvetica  eingebaute Schriften (TEAMFLOW_PDF_FONT=Helvetica)
+    ttf kalt   TrueType, Metrik-Cache leer (Datei wird eingelesen)
+    ttf warm   TrueType, Metrik-Cache aus dem vorigen Lauf
+
+Pro Lauf ein Detail-PDF (ein Mitarbeiter) und eine Übersicht. Angezeigt
+werden die Zeit für die Schriften (pdf_fonts), die Zeit bis zum fertigen
+Detail-PDF (ab Registrieren der Schriften, inklusive Importe der Exporter),
+die Dauer des ganzen Prozesses und die Dateigrößen.
+
+Usage: python bench_pdf_fonts.py [--rows 2000] [--repeat 5]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+import subprocess
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+
+def run_child(rows, out_dir):
+    """Im Kindprozess: Schriften registrieren, beide PDFs erzeugen, Zeiten als JSON ausgeben"""
+    from synthetic_data import iter_overview_rows, iter_detail_payloads
+    from export_fonts import pdf_fonts
+
+    start = time.perf_counter()
+    pdf_fonts()
+    t_fonts = time.perf_counter() - start
+
+    from export_employee_detail import create_employee_detail_pdf
+    from export_to_pdf import create_pdf
+
+    payload = next(iter_detail_payloads(1))
+    detail_path, overview_path = Path(out_dir) / 'detail.pdf', Path(out_dir) / 'uebersicht.pdf'
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        create_employee_detail_pdf(payload['employee'], payload['vacation'], payload['absence'], str(detail_path))
+        t_detail = time.perf_counter() - start
+        create_pdf(list(iter_overview_rows(rows)), str(overview_path), workers=1)
+    print(json.dumps({
+        'fonts': t_fonts,
+        'detail': t_detail,
+        'detail_size': detail_path.stat().st_size,
+        'overview_size': overview_path.stat().st_size,
+    }))
+
+
+def measure(env, rows, out_dir):
+    """Ein Kindprozess, zusätzlich seine Gesamtdauer"""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, __file__, '--child', out_dir, '--rows', str(rows)],
+                            env=env, capture_output=True, text=True, check=True)
+    values = json.loads(result.stdout)
+    values['wall'] = time.perf_counter() - start
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=2000, help="Zeilen der Übersicht")
+    parser.add_argument('--repeat', type=int, default=5, help="Läufe pro Variante (Median)")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.rows, args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = {**os.environ, 'TEAMFLOW_EXPORT_CACHE': '0'}
+        cache = str(Path(tmp) / 'fonts')
+        variants = {
+            'helvetica': lambda: {**base, 'TEAMFLOW_PDF_FONT': 'Helvetica'},
+            'ttf kalt': lambda: {**base, 'TEAMFLOW_FONT_CACHE': str(Path(tmp) / f'kalt-{time.perf_counter_ns()}')},
+            'ttf warm': lambda: {**base, 'TEAMFLOW_FONT_CACHE': cache},
+        }
+        measure(variants['ttf warm'](), args.rows, tmp)
+
+        results = {}
+        for name, env in variants.items():
+            runs = sorted((measure(env(), args.rows, tmp) for _ in range(args.repeat)), key=lambda r: r['wall'])
+            results[name] = runs[len(runs) // 2]
+
+    print(f"Übersicht: {args.rows} Zeilen, Median aus {args.repeat} Prozessen")
+    print(f"{'Variante':<10} {'Schriften (ms)':>15} {'Detail-PDF (ms)':>16} {'Prozess (s)':>12} "
+          f"{'Detail (KB)':>12} {'Übersicht (KB)':>15}")
+    for name, r in results.items():
+        print(f"{name:<10} {r['fonts'] * 1000:>15.1f} {r['detail'] * 1000:>16.1f} {r['wall']:>12.2f} "
+              f"{r['detail_size'] / 1024:>12.1f} {r['overview_size'] / 1024:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
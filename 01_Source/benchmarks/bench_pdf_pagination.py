@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: seitenweise Tabellenblöcke vs. eine große Tabelle im Übersichts-PDF
+
+Jede Messung läuft in einem eigenen Python-Prozess. Gemessen werden die
+Zeit, der Peak RSS und dessen Anstieg durch den Export (Peak RSS minus
+Stand vor dem Export): bei paginiert hält der Prozess nur die Zeilen, die
+Tabellen der Seiten entstehen erst beim Setzen.
+
+Usage: python bench_pdf_pagination.py [--sizes 500 5000 50000]
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_data import iter_overview_rows  # noqa: E402
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float('nan')
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == 'darwin' else rss / 1024
+
+
+def run_single(mode, count, output_path):
+    import io
+    import contextlib
+    from export_to_pdf import create_pdf
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        create_pdf(iter_overview_rows(count), output_path, paginate=(mode == 'paginiert'))
+    seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        'mode': mode,
+        'rows': count,
+        'seconds': seconds,
+        'peak_rss_mb': peak_rss_mb(),
+        'baseline_rss_mb': baseline,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 5000, 50000])
+    parser.add_argument('--single', nargs=2, metavar=('MODE', 'ROWS'), help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args.single[0], int(args.single[1]), args.output)
+        return
+
+    print(f"{'Modus':<12} {'Zeilen':>8} {'Zeit (s)':>9} {'Peak RSS (MB)':>14} {'Anstieg (MB)':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.sizes:
+            results = {}
+            for mode in ('bisher', 'paginiert'):
+                output = Path(tmp) / f"{mode}_{count}.pdf"
+                proc = subprocess.run(
+                    [sys.executable, __file__, '--single', mode, str(count), '--output', str(output)],
+                    check=True, capture_output=True, text=True
+                )
+                r = json.loads(proc.stdout.strip().splitlines()[-1])
+                results[mode] = r
+                print(f"{r['mode']:<12} {r['rows']:>8} {r['seconds']:>9.2f} {r['peak_rss_mb']:>14.1f} "
+                      f"{r['peak_rss_mb'] - r['baseline_rss_mb']:>13.1f}")
+            speedup = results['bisher']['seconds'] / results['paginiert']['seconds']
+            print(f"{'-> Faktor':<12} {count:>8} {speedup:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: paralleles Rendern der Übersichts-PDF
+
+create_pdf mit 1 (Einzelprozess), 2, 4 und 8 Workern auf denselben
+synthetischen Zeilen. Gemessen wird der gesamte Export einschließlich
+Start des Prozess-Pools. Alle Läufe werden im invarianten Modus von
+reportlab erzeugt (ohne Zeitstempel) und müssen byte-gleich mit dem
+Einzelprozess sein.
+
+Der Gewinn ist durch die CPU-Kerne begrenzt und durch den Anteil, der im
+Hauptprozess bleibt (Zeilen lesen, Seiten komprimieren und schreiben).
+
+Usage: python bench_pdf_parallel.py [--rows 20000] [--workers 1,2,4,8]
+"""
+
+import io
+import os
+import sys
+import time
+import hashlib
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from reportlab import rl_config  # noqa: E402
+
+from synthetic_data import iter_overview_rows  # noqa: E402
+from export_to_pdf import create_pdf  # noqa: E402
+
+
+def timed(rows, path, workers):
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        start = time.perf_counter()
+        create_pdf(rows, path, workers=workers)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--workers', default='1,2,4,8', help="Worker-Anzahlen, kommagetrennt")
+    args = parser.parse_args()
+
+    rl_config.invariant = 1
+    rows = list(iter_overview_rows(args.rows))
+    counts = [int(count) for count in args.workers.split(',')]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in counts:
+            path = os.path.join(tmp, f"uebersicht_{workers}.pdf")
+            seconds = timed(rows, path, workers)
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            results.append((workers, seconds, os.path.getsize(path), digest))
+
+    baseline = results[0]
+    identical = all(digest == baseline[3] for *_, digest in results)
+    print(f"{args.rows} Zeilen, {os.cpu_count()} CPUs")
+    print(f"{'Worker':>6} {'Zeit (s)':>9} {'Faktor':>7} {'Effizienz':>10} {'Datei (KB)':>11}")
+    for workers, seconds, size, _ in results:
+        speedup = baseline[1] / seconds
+        print(f"{workers:>6} {seconds:>9.3f} {speedup:>6.2f}x {speedup / workers * baseline[0]:>9.0%} {size / 1024:>11.1f}")
+    print(f"Ausgabe identisch: {'ja' if identical else 'NEIN'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
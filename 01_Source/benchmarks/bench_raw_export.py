@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Rohdaten-Export (CSV, Parquet, Arrow) vs. Excel-Übersicht
+
+    xlsx            create_excel (normaler Modus)
+    xlsx streaming  create_excel(streaming=True)
+    csv             export_raw.create_csv
+    parquet         export_raw.create_columnar(fmt='parquet')
+    arrow           export_raw.create_columnar(fmt='arrow')
+
+Die Rohdaten werden zurückgelesen und gegen die Eingabezeilen geprüft.
+
+Usage: python bench_raw_export.py [--rows 100000]
+"""
+
+import io
+import os
+import csv
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from export_to_excel import create_excel  # noqa: E402
+from export_raw import create_raw, FIELDS  # noqa: E402
+from synthetic_data import iter_overview_rows  # noqa: E402
+
+
+def expected_columns(rows):
+    return {key: [row.get(key, default) for row in rows] for key, default, _ in FIELDS}
+
+
+def read_back(path):
+    """Spalten der Rohdaten-Datei als Dict von Listen (CSV-Zahlen als float)"""
+    suffix = Path(path).suffix
+    if suffix == '.csv':
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            columns = list(zip(*reader))
+        return {
+            key: list(values) if is_text else [float(value) for value in values]
+            for key, values, (_, _, is_text) in zip(header, columns, FIELDS)
+        }
+    if suffix == '.parquet':
+        import pyarrow.parquet as pq
+        return pq.read_table(path).to_pydict()
+    import pyarrow.feather as feather
+    return feather.read_table(path).to_pydict()
+
+
+def timed(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    rows = list(iter_overview_rows(args.rows))
+    expected = expected_columns(rows)
+
+    results = []
+    identical = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, filename, func, kwargs in (
+            ('xlsx', 'normal.xlsx', create_excel, {}),
+            ('xlsx streaming', 'streaming.xlsx', create_excel, {'streaming': True}),
+            ('csv', 'roh.csv', create_raw, {}),
+            ('parquet', 'roh.parquet', create_raw, {}),
+            ('arrow', 'roh.arrow', create_raw, {}),
+        ):
+            path = os.path.join(tmp, filename)
+            seconds = timed(func, rows, path, **kwargs)
+            checked = ''
+            if func is create_raw:
+                same = read_back(path) == expected
+                identical &= same
+                checked = 'ja' if same else 'NEIN'
+            results.append((name, seconds, os.path.getsize(path), checked))
+
+    baseline = results[0][1]
+    print(f"{args.rows} Zeilen")
+    print(f"{'Format':<16} {'Zeit (s)':>9} {'Faktor':>7} {'Datei (KB)':>11} {'Geprüft':>8}")
+    for name, seconds, size, checked in results:
+        print(f"{name:<16} {seconds:>9.3f} {baseline / seconds:>6.1f}x {size / 1024:>11.1f} {checked:>8}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
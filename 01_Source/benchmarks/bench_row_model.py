@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Dict-Zeilen gegen typisierte Zeilen (export_rows)
+
+Für --rows Übersichtszeilen als NDJSON:
+    Speicher   dekodierte Zeilen im Speicher (tracemalloc), als Dicts,
+               als OverviewRow (object_pairs_hook) und spaltenweise als
+               OverviewColumns
+    Dekodieren json.loads pro Zeile bzw. ein JSONDecoder mit from_pairs
+    Zeilenaufbau  Werte je Format wie bisher über dict.get pro Feld und
+               jetzt über Attribut/Position (PDF-Tabellenzeile,
+               Excel-Zeile)
+
+Zeiten sind das Minimum aus --repeat Läufen. Die aufgebauten Zeilen beider
+Verfahren werden verglichen.
+
+Usage: python bench_row_model.py [--rows 100000] [--repeat 3]
+"""
+
+import gc
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_data import iter_overview_rows  # noqa: E402
+from export_columns import COLUMNS, ID_KEY  # noqa: E402
+from export_rows import OverviewRow, OverviewColumns  # noqa: E402
+from export_to_pdf import _table_row  # noqa: E402
+
+
+def decode_dicts(lines):
+    return [json.loads(line) for line in lines]
+
+
+def decode_rows(lines):
+    """Wie export_input.iter_ndjson mit row_type=OverviewRow"""
+    decode = json.JSONDecoder(object_pairs_hook=OverviewRow.from_pairs).decode
+    return [decode(line) for line in lines]
+
+
+def decode_columns(lines):
+    return OverviewColumns(decode_rows(lines))
+
+
+def timed(func, data, repeat):
+    """(beste Zeit, Ergebnis) aus repeat Läufen"""
+    best = None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = func(data)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def measure(func, lines, repeat):
+    """(Sekunden, Bytes des Ergebnisses) für func(lines)"""
+    seconds, _ = timed(func, lines, repeat)
+
+    gc.collect()
+    tracemalloc.start()
+    result = func(lines)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return seconds, size
+
+
+def pdf_rows_dict(data):
+    """Tabellenzeilen wie bisher in create_pdf"""
+    return [[
+        entry.get('mitarbeiter', ''),
+        entry.get('abteilung', ''),
+        str(entry.get('urlaub_anspruch', 0)),
+        str(entry.get('urlaub_uebertrag', 0)),
+        str(entry.get('urlaub_verfuegbar', 0)),
+        str(entry.get('urlaub_genommen', 0)),
+        str(entry.get('urlaub_rest', 0)),
+        str(entry.get('krankheit', 0)),
+        str(entry.get('schulung', 0)),
+        str(entry.get('ueberstunden', 0))
+    ] for entry in data]
+
+
+def pdf_rows_typed(rows):
+    return [_table_row(row) for row in rows]
+
+
+def sheet_rows_dict(data):
+    """Werte einer Excel-Zeile wie bisher in create_excel_streaming (Spalten, dann ID)"""
+    fields = [(key, default) for _, key, default, _ in COLUMNS] + [(ID_KEY, None)]
+    return [[entry.get(key, default) for key, default in fields] for entry in data]
+
+
+def sheet_rows_typed(rows):
+    return [row[1:] + row[:1] for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    lines = [json.dumps(row, ensure_ascii=False) for row in iter_overview_rows(args.rows)]
+
+    memory = [
+        ('Dicts', *measure(decode_dicts, lines, args.repeat)),
+        ('OverviewRow', *measure(decode_rows, lines, args.repeat)),
+        ('OverviewColumns', *measure(decode_columns, lines, args.repeat)),
+    ]
+
+    dicts = decode_dicts(lines)
+    rows = decode_rows(lines)
+    builds = []
+    identical = True
+    for name, old_func, new_func in [
+        ('PDF-Zeile', pdf_rows_dict, pdf_rows_typed),
+        ('Excel-Zeile', sheet_rows_dict, sheet_rows_typed),
+    ]:
+        old_seconds, old_result = timed(old_func, dicts, args.repeat)
+        new_seconds, new_result = timed(new_func, rows, args.repeat)
+        identical = identical and list(map(list, old_result)) == list(map(list, new_result))
+        builds.append((name, old_seconds, new_seconds))
+
+    base_size = memory[0][2]
+    print(f"{args.rows} Zeilen")
+    print(f"{'Dekodieren':<16} {'Zeit (ms)':>10} {'Speicher (MB)':>14} {'Faktor':>7}")
+    for name, seconds, size in memory:
+        print(f"{name:<16} {seconds * 1000:>10.1f} {size / 1e6:>14.1f} {base_size / size:>6.1f}x")
+    print()
+    print(f"{'Zeilenaufbau':<16} {'dict (ms)':>10} {'typisiert (ms)':>15} {'Faktor':>7}")
+    for name, old_seconds, new_seconds in builds:
+        print(f"{name:<16} {old_seconds * 1000:>10.1f} {new_seconds * 1000:>15.1f} {old_seconds / new_seconds:>6.1f}x")
+    print(f"Zeilen identisch: {'ja' if identical else 'NEIN'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
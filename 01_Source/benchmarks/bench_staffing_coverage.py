@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Besetzungsanalyse über alle Abwesenheiten
+
+Synthetische Datenbank wie bench_absence_report (kurze und lange
+Abwesenheiten, Standard gut 100.000 Zeiträume), ausgewertet über alle
+Jahre. Verglichen werden:
+    schleife  pro Zeitraum und Tag eine Menge abwesender Mitarbeiter,
+              danach pro Tag und Mitarbeiter Soll und Anwesenheit
+    sweep     export_staffing_coverage.compute_staffing_coverage
+              (Verschmelzen, Differenz-Array, cumsum)
+
+Beide Zeiten enthalten das Lesen aus der Datenbank. Soll und Anwesenheit
+beider Verfahren müssen übereinstimmen; die Zeit für den Konfliktbericht
+(Excel) wird zusätzlich angezeigt.
+
+Usage: python bench_staffing_coverage.py [--employees 2700] [--years 10] [--minimum 250]
+"""
+
+import io
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_data import create_database  # noqa: E402
+from bench_absence_report import add_long_entries  # noqa: E402
+from export_from_db import open_database  # noqa: E402
+from workday_calendar import WorkdayCalendar, STANDARD_MODELL, load_work_models  # noqa: E402
+from export_staffing_coverage import compute_staffing_coverage, create_staffing_excel, _QUERIES  # noqa: E402
+
+
+def coverage_loop(conn, von, bis, abteilungen):
+    """Naheliegende Umsetzung: Python-Schleifen über Zeiträume, Tage und Mitarbeiter"""
+    erster, letzter = date.fromisoformat(von), date.fromisoformat(bis)
+    anzahl_tage = (letzter - erster).days + 1
+    tage = [(erster + timedelta(days=t)).isoformat() for t in range(anzahl_tage)]
+
+    abwesend = {}
+    for query in _QUERIES:
+        for ma_id, a, b in conn.execute(query, (bis, von)):
+            tag = max(date.fromisoformat(a), erster)
+            ende = min(date.fromisoformat(b), letzter)
+            while tag <= ende:
+                abwesend.setdefault(ma_id, set()).add((tag - erster).days)
+                tag += timedelta(days=1)
+
+    calendar = WorkdayCalendar.from_database(conn, erster.year, letzter.year)
+    modelle = load_work_models(conn)
+    index = {name: i for i, name in enumerate(abteilungen)}
+    soll = np.zeros((len(abteilungen), anzahl_tage))
+    anwesend = np.zeros((len(abteilungen), anzahl_tage))
+    for ma_id, abteilung, eintritt, austritt in conn.execute("""
+        SELECT m.id, COALESCE(a.name, ''), m.eintrittsdatum, m.austrittsdatum
+        FROM mitarbeiter m LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV'
+    """):
+        werte = calendar.day_values(von, bis, modelle.get(ma_id, STANDARD_MODELL)).tolist()
+        fehlt = abwesend.get(ma_id, ())
+        zeile = index[abteilung]
+        for t, tag in enumerate(tage):
+            if tag < eintritt or (austritt and tag > austritt):
+                continue
+            soll[zeile, t] += werte[t]
+            if t not in fehlt:
+                anwesend[zeile, t] += werte[t]
+    return soll, anwesend
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=2700)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--last-year', type=int, default=2025)
+    parser.add_argument('--minimum', type=float, default=250, help="Mindestbesetzung für den Konfliktbericht")
+    args = parser.parse_args()
+
+    von_jahr = args.last_year - args.years + 1
+    von, bis = f"{von_jahr}-01-01", f"{args.last_year}-12-31"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'bench.db'
+        seconds, _ = timed(lambda: create_database(db_path, args.employees, von_jahr, args.last_year))
+        add_long_entries(db_path, von_jahr, args.last_year)
+        conn = open_database(db_path)
+        print(f"Datenbank: {args.employees} Mitarbeiter x {args.years} Jahre ({seconds:.1f} s)")
+
+        t_sweep, analyse = timed(lambda: compute_staffing_coverage(conn, von, bis, args.minimum))
+        t_loop, (loop_soll, loop_anwesend) = timed(lambda: coverage_loop(conn, von, bis, analyse.abteilungen))
+        conn.close()
+
+        with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+            t_excel, _ = timed(lambda: create_staffing_excel(analyse, str(Path(tmp) / 'besetzung.xlsx')))
+
+    identical = np.array_equal(loop_soll, analyse.soll) and np.array_equal(loop_anwesend, analyse.anwesend)
+    print(f"{analyse.zeitraeume} Zeiträume, {len(analyse.tage)} Tage, {len(analyse.konflikte)} Konflikte")
+    print(f"{'Verfahren':<10} {'Zeit (s)':>9} {'Faktor':>8}")
+    print(f"{'schleife':<10} {t_loop:>9.3f} {1:>7.1f}x")
+    print(f"{'sweep':<10} {t_sweep:>9.3f} {t_loop / t_sweep:>7.1f}x")
+    print(f"Konfliktbericht (Excel): {t_excel:.3f} s")
+    print(f"Ergebnis identisch: {'ja' if identical else 'NEIN'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Jahresstatistik für alle Mitarbeiter und Jahre
+
+Vergleicht auf einer synthetischen Datenbank (Schema aus main.js):
+    pro Mitarbeiter  Einzelabfragen und rekursiver Übertrag, wie
+                     DataManager.getAlleStatistiken sie stellt (Referenz,
+                     hier nachgebildet)
+    pro Jahr         export_from_db.iter_overview_rows einmal pro Jahr
+                     (compute_statistics für jeweils ein Jahr)
+    numpy            statistics_engine.compute_statistics für alle Jahre
+
+Alle Verfahren müssen dieselben Zahlen liefern.
+
+Usage: python bench_statistics_engine.py [--employees 1000] [--years 10]
+"""
+
+import sys
+import math
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from export_from_db import open_database, iter_overview_rows  # noqa: E402
+from statistics_engine import compute_statistics, iter_overview_rows as engine_overview_rows, SPALTEN, MAX_UEBERTRAG  # noqa: E402
+from synthetic_data import create_database  # noqa: E402
+
+
+def anteiliger_urlaub(urlaubstage_jahr, eintrittsdatum, jahr):
+    """Wie DataManager.berechneAnteiligenUrlaub (Math.round(x * 2) / 2 rundet 0.5 auf)"""
+    if jahr != int(eintrittsdatum[:4]):
+        return urlaubstage_jahr
+    verbleibende_monate = 12 - int(eintrittsdatum[5:7]) + 1
+    return math.floor(urlaubstage_jahr / 12 * verbleibende_monate * 2 + 0.5) / 2
+
+
+def per_employee_overview(conn, jahr):
+    """Abfragemuster von DataManager.getAlleStatistiken (eine Abfrage pro Wert)"""
+    def scalar(sql, params):
+        return conn.execute(sql, params).fetchone()[0]
+
+    def uebertrag(ma, jahr, tiefe=0):
+        manuell = conn.execute(
+            "SELECT uebertrag_tage FROM uebertrag_manuell WHERE mitarbeiter_id = ? AND jahr = ?", (ma['id'], jahr)
+        ).fetchone()
+        if manuell:
+            return manuell[0]
+        if tiefe > 50 or jahr - 1 < int(ma['eintrittsdatum'][:4]):
+            return 0
+        vorjahr = jahr - 1
+        rest = (anteiliger_urlaub(ma['urlaubstage_jahr'], ma['eintrittsdatum'], vorjahr)
+                + uebertrag(ma, vorjahr, tiefe + 1) - genommen(ma['id'], vorjahr))
+        return min(max(rest, 0), MAX_UEBERTRAG)
+
+    def genommen(ma_id, jahr):
+        return scalar("SELECT COALESCE(SUM(tage), 0) FROM urlaub WHERE mitarbeiter_id = ? AND strftime('%Y', von_datum) = ?",
+                      (ma_id, str(jahr)))
+
+    rows = []
+    for ma in conn.execute("""
+        SELECT m.*, a.name AS abteilung_name FROM mitarbeiter m
+        LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV' AND (m.austrittsdatum IS NULL OR CAST(strftime('%Y', m.austrittsdatum) AS INTEGER) >= ?)
+        ORDER BY m.nachname, m.vorname
+    """, (jahr,)).fetchall():
+        anspruch = anteiliger_urlaub(ma['urlaubstage_jahr'], ma['eintrittsdatum'], jahr)
+        u = uebertrag(ma, jahr)
+        g = genommen(ma['id'], jahr)
+        rows.append({
+            'mitarbeiter': f"{ma['vorname']} {ma['nachname']}",
+            'abteilung': ma['abteilung_name'],
+            'urlaub_anspruch': anspruch,
+            'urlaub_uebertrag': u,
+            'urlaub_verfuegbar': anspruch + u,
+            'urlaub_genommen': g,
+            'urlaub_rest': anspruch + u - g,
+            'krankheit': scalar("SELECT COALESCE(SUM(tage), 0) FROM krankheit WHERE mitarbeiter_id = ? AND strftime('%Y', von_datum) = ?",
+                                (ma['id'], str(jahr))),
+            'schulung': scalar("SELECT COALESCE(SUM(dauer_tage), 0) FROM schulung WHERE mitarbeiter_id = ? AND strftime('%Y', datum) = ?",
+                               (ma['id'], str(jahr))),
+            'ueberstunden': scalar("SELECT COALESCE(SUM(stunden), 0) FROM ueberstunden WHERE mitarbeiter_id = ? AND strftime('%Y', datum) <= ?",
+                                   (ma['id'], str(jahr))),
+        })
+    return rows
+
+
+def count_differences(expected, actual):
+    if len(expected) != len(actual):
+        return abs(len(expected) - len(actual))
+    return sum(
+        1
+        for a, b in zip(expected, actual)
+        for spalte in SPALTEN
+        if abs(a.get(spalte) - b.get(spalte)) > 1e-9
+    ) + sum(1 for a, b in zip(expected, actual) if a.get('mitarbeiter') != b.get('mitarbeiter'))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=1000)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--last-year', type=int, default=2025)
+    args = parser.parse_args()
+
+    bis_jahr = args.last_year
+    von_jahr = bis_jahr - args.years + 1
+    jahre = range(von_jahr, bis_jahr + 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'bench.db'
+        seconds, _ = timed(lambda: create_database(db_path, args.employees, von_jahr, bis_jahr))
+        print(f"Datenbank: {args.employees} Mitarbeiter x {args.years} Jahre ({seconds:.1f} s)")
+
+        conn = open_database(db_path)
+        t_employee, employee_rows = timed(lambda: {j: per_employee_overview(conn, j) for j in jahre})
+        t_year, year_rows = timed(lambda: {j: list(iter_overview_rows(conn, j)) for j in jahre})
+
+        def run_engine():
+            statistik = compute_statistics(conn, von_jahr, bis_jahr)
+            return {j: list(engine_overview_rows(statistik, j)) for j in jahre}
+        t_engine, engine_rows = timed(run_engine)
+        conn.close()
+
+    diffs_year = sum(count_differences(employee_rows[j], year_rows[j]) for j in jahre)
+    diffs_engine = sum(count_differences(employee_rows[j], engine_rows[j]) for j in jahre)
+
+    print(f"{'Verfahren':<16} {'Zeit (s)':>9} {'Faktor':>8} {'Abweichungen':>13}")
+    print(f"{'pro Mitarbeiter':<16} {t_employee:>9.3f} {1:>7.1f}x {'-':>13}")
+    print(f"{'pro Jahr':<16} {t_year:>9.3f} {t_employee / t_year:>7.1f}x {diffs_year:>13}")
+    print(f"{'numpy':<16} {t_engine:>9.3f} {t_employee / t_engine:>7.1f}x {diffs_engine:>13}")
+
+    if diffs_year or diffs_engine:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Arbeitstage zählen per Tagesschleife vs. Kalenderindex
+
+Die Tagesschleife entspricht berechneUrlaubstageAsync (dialog-base.js),
+der Index ist workday_calendar.WorkdayCalendar (Präfixsummen).
+
+Usage: python bench_workday_calendar.py [--entries 100000]
+"""
+
+import sys
+import time
+import random
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from workday_calendar import WorkdayCalendar, standard_feiertage, STANDARD_MODELL  # noqa: E402
+
+ERSTES_JAHR = 2015
+LETZTES_JAHR = 2026
+WERTE = {'VOLL': 1.0, 'HALB': 0.5, 'FREI': 0.0}
+
+
+def generate_entries(count, seed=42):
+    rng = random.Random(seed)
+    start = date(ERSTES_JAHR, 1, 1)
+    tage_gesamt = (date(LETZTES_JAHR, 12, 1) - start).days
+    entries = []
+    for _ in range(count):
+        von = start + timedelta(days=rng.randint(0, tage_gesamt))
+        bis = von + timedelta(days=rng.randint(0, 20))
+        entries.append((von.isoformat(), bis.isoformat()))
+    return entries
+
+
+def count_loop(entries, feiertage, modell):
+    """Ein Tag nach dem anderen, wie im Urlaubsdialog"""
+    result = []
+    for von, bis in entries:
+        tage = 0
+        current = date.fromisoformat(von)
+        ende = date.fromisoformat(bis)
+        while current <= ende:
+            if current.isoformat() not in feiertage:
+                tage += WERTE[modell[current.weekday()]]
+            current += timedelta(days=1)
+        result.append(tage)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=100000)
+    args = parser.parse_args()
+
+    feiertage = [f[0] for jahr in range(ERSTES_JAHR, LETZTES_JAHR + 1) for f in standard_feiertage(jahr)]
+    modell = ('VOLL', 'VOLL', 'HALB', 'VOLL', 'FREI', 'FREI', 'FREI')
+    entries = generate_entries(args.entries)
+    von = [e[0] for e in entries]
+    bis = [e[1] for e in entries]
+
+    start = time.perf_counter()
+    erwartet = count_loop(entries, set(feiertage), modell)
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calendar = WorkdayCalendar(feiertage, ERSTES_JAHR, LETZTES_JAHR)
+    t_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    berechnet = calendar.count_many(von, bis, modell)
+    calendar.count_many(von, bis, STANDARD_MODELL)
+    t_index = (time.perf_counter() - start) / 2
+
+    abweichungen = sum(1 for a, b in zip(erwartet, berechnet) if a != b)
+    print(f"{args.entries} Einträge, {LETZTES_JAHR - ERSTES_JAHR + 1} Jahre")
+    print(f"{'Tagesschleife':<22} {t_loop:>8.3f} s")
+    print(f"{'Index aufbauen':<22} {t_build:>8.3f} s")
+    print(f"{'Index zählen':<22} {t_index:>8.3f} s  ({t_loop / t_index:.0f}x)")
+    print(f"Abweichungen: {abweichungen}")
+
+    if abweichungen:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
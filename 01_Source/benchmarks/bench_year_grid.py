@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Jahresplaner per Zellschleife vs. Raster + bedingte Formatierung
+
+    zellen   jeder Tag eines Zeitraums wird einzeln als Zelle mit Füllfarbe
+             geschrieben (naheliegende Umsetzung)
+    raster   export_year_grid: numpy-Raster, Läufe als Bereiche einer
+             bedingten Formatierung pro Farbe
+
+Gemessen werden Zeit (inkl. Speichern) und Dateigröße.
+
+Usage: python bench_year_grid.py [--employees 500] [--entries 12]
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from openpyxl import Workbook  # noqa: E402
+from openpyxl.styles import PatternFill  # noqa: E402
+
+from export_year_grid import (  # noqa: E402
+    rasterize, create_year_grid_excel, FIRST_ROW, FIRST_DAY_COLUMN, SCHULUNG, URLAUB, KRANKHEIT,
+)
+from export_styles import VACATION_COLOR, SICKNESS_COLOR, TRAINING_COLOR  # noqa: E402
+
+JAHR = 2025
+TAGE = 365
+FARBEN = {SCHULUNG: TRAINING_COLOR, URLAUB: VACATION_COLOR, KRANKHEIT: SICKNESS_COLOR}
+
+
+def generate_entries(employees, per_employee, seed=42):
+    """(mitarbeiter, code, erster_tag, letzter_tag), Codes in aufsteigender Priorität sortiert"""
+    rng = random.Random(seed)
+    entries = []
+    for ma in range(employees):
+        for _ in range(per_employee):
+            start = rng.randint(0, TAGE - 1)
+            entries.append((ma, rng.choice([SCHULUNG, URLAUB, URLAUB, KRANKHEIT]), start, min(start + rng.randint(0, 14), TAGE - 1)))
+    entries.sort(key=lambda e: e[1])
+    return entries
+
+
+def export_cells(entries, employees, output_path):
+    """Jeder Tag eine eigene Zelle mit Füllfarbe"""
+    wb = Workbook()
+    ws = wb.active
+    fills = {code: PatternFill(start_color=color, end_color=color, fill_type='solid') for code, color in FARBEN.items()}
+    for ma in range(employees):
+        ws.cell(row=FIRST_ROW + ma, column=1, value=f"Mitarbeiter {ma}")
+    for ma, code, von, bis in entries:
+        for tag in range(von, bis + 1):
+            ws.cell(row=FIRST_ROW + ma, column=FIRST_DAY_COLUMN + tag).fill = fills[code]
+    wb.save(output_path)
+
+
+def export_grid(entries, employees, output_path):
+    """Raster wie in export_year_grid.load_year_grid, dann create_year_grid_excel"""
+    grid = np.zeros((employees, TAGE), dtype=np.uint8)
+    for code in (SCHULUNG, URLAUB, KRANKHEIT):
+        selected = np.array([(ma, von, bis) for ma, c, von, bis in entries if c == code]).reshape(-1, 3)
+        grid[rasterize(selected[:, 0], selected[:, 1], selected[:, 2], grid.shape)] = code
+    wochentage = (np.arange(TAGE) + date(JAHR, 1, 1).weekday()) % 7
+    planer = SimpleNamespace(
+        jahr=JAHR,
+        mitarbeiter=[(f"Mitarbeiter {ma}", "Abteilung") for ma in range(employees)],
+        grid=grid,
+        feiertage=np.zeros(TAGE, dtype=bool),
+        veranstaltungen=np.zeros(TAGE, dtype=bool),
+        wochenende=wochentage >= 5,
+    )
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        create_year_grid_excel(planer, output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=500)
+    parser.add_argument('--entries', type=int, default=12, help="Zeiträume pro Mitarbeiter")
+    args = parser.parse_args()
+
+    entries = generate_entries(args.employees, args.entries)
+    tage = sum(bis - von + 1 for _, _, von, bis in entries)
+    print(f"{args.employees} Mitarbeiter x {TAGE} Tage, {len(entries)} Zeiträume, {tage} markierte Tage")
+    print(f"{'Variante':<10} {'Zeit (s)':>9} {'Datei (KB)':>11}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, export in (('zellen', export_cells), ('raster', export_grid)):
+            path = os.path.join(tmp, f"{name}.xlsx")
+            start = time.perf_counter()
+            export(entries, args.employees, path)
+            seconds = time.perf_counter() - start
+            print(f"{name:<10} {seconds:>9.3f} {os.path.getsize(path) / 1024:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Prüfung: Import-Zeit der Exporter beim Kaltstart
+
+Jeder Fall läuft in einem frischen Interpreter mit -X importtime. Gezählt
+wird die kumulierte Zeit aller Module, die der Fall zusätzlich zu einem
+leeren Interpreter (python -c pass) importiert, einschließlich der Arbeit
+auf Modulebene (z.B. Styles und Schriften der PDF-Exporte). Fälle:
+    exporters  import exporters (Registry und Kommandozeile)
+    csv        Exporter für csv laden   (export_raw)
+    xlsx       Exporter für xlsx laden  (export_to_excel, openpyxl)
+    pdf        Exporter für pdf laden   (export_to_pdf, reportlab)
+    detail     Exporter für detail laden (export_employee_detail)
+
+Pro Fall gilt ein Budget in ms und eine Liste von Paketen, die nicht
+geladen werden dürfen (z.B. openpyxl beim PDF-Export). Gewertet wird die
+schnellste von --repeat Wiederholungen, der erste Lauf schreibt dabei die
+.pyc-Dateien. Auf langsamen Rechnern skaliert --scale alle Budgets.
+Endet mit Exit-Code 1, wenn ein Budget überschritten oder ein verbotenes
+Paket geladen wurde.
+
+Usage: python check_import_time.py [--repeat 5] [--scale 1.0] [--cases exporters,pdf]
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+
+HEAVY = ('openpyxl', 'reportlab', 'pyarrow', 'numpy')
+
+# Fall -> (Python-Code, Budget in ms, verbotene Pakete)
+CASES = {
+    'exporters': ("import exporters", 60, HEAVY),
+    'csv': ("import exporters; exporters.load_exporter('csv')", 80, HEAVY),
+    'xlsx': ("import exporters; exporters.load_exporter('xlsx')", 500, ('reportlab', 'pyarrow')),
+    'pdf': ("import exporters; exporters.load_exporter('pdf')", 400, ('openpyxl', 'pyarrow')),
+    'detail': ("import exporters; exporters.load_exporter('detail')", 400, ('openpyxl', 'pyarrow')),
+}
+
+
+def import_times(code):
+    """{modul: (ebene, kumuliert in us)} aus der -X importtime-Ausgabe eines frischen Interpreters"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=SCRIPT_DIR,
+                            env={**os.environ, 'PYTHONPATH': str(SCRIPT_DIR)},
+                            capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        level = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        modules[name.strip()] = (level, int(cumulative))
+    return modules
+
+
+def measure(code, baseline):
+    """(ms, module): Summe der obersten Ebene ohne die Module des leeren Interpreters"""
+    modules = import_times(code)
+    total = sum(cumulative for name, (level, cumulative) in modules.items()
+                if level == 0 and name not in baseline)
+    return total / 1000, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help="Wiederholungen pro Fall (Minimum zählt)")
+    parser.add_argument('--scale', type=float, default=1.0, help="Faktor für alle Budgets")
+    parser.add_argument('--cases', default=','.join(CASES), help="Fälle, kommagetrennt")
+    args = parser.parse_args()
+
+    cases = [case.strip() for case in args.cases.split(',') if case.strip()]
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        parser.error(f"Unbekannte Fälle: {', '.join(unknown)}")
+
+    baseline = set(import_times('pass'))
+    failed = False
+    print(f"{'Fall':<10} {'Import (ms)':>12} {'Budget (ms)':>12} {'Module':>7}  Ergebnis")
+    for case in cases:
+        code, budget, forbidden = CASES[case]
+        runs = [measure(code, baseline) for _ in range(args.repeat)]
+        ms, modules = min(runs, key=lambda run: run[0])
+        budget *= args.scale
+        loaded = sorted({name.split('.')[0] for name in modules} & set(forbidden))
+
+        problems = []
+        if ms > budget:
+            problems.append("Budget überschritten")
+        if loaded:
+            problems.append(f"lädt {', '.join(loaded)}")
+        failed = failed or bool(problems)
+        print(f"{case:<10} {ms:>12.1f} {budget:>12.0f} {len(set(modules) - baseline):>7}  "
+              f"{'; '.join(problems) or 'ok'}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
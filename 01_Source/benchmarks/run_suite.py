@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark-Suite: Durchsatz und Speicher der Export-Funktionen
+
+Misst auf synthetischen Daten (synthetic_data.py) für jede Größe:
+    excel            create_excel
+    excel_streaming  create_excel(streaming=True)
+    pdf              create_pdf
+    detail           create_employee_detail_pdf, eine PDF pro Mitarbeiter
+                     (höchstens --details Mitarbeiter)
+
+Jeder Fall läuft in einem frischen Prozess, damit Spitzen-Speicher und
+Import-Caches nicht vom vorherigen Fall abhängen. Die Daten werden vor
+der Messung erzeugt; gemessen wird die schnellste von --repeat
+Wiederholungen und der Anstieg des Spitzen-Speichers durch den Export.
+
+Die Ergebnisse werden als JSON geschrieben (mit Commit, Python-Version
+und Plattform), sodass Läufe verschiedener Versionen offline verglichen
+werden können: --compare <alt.json> zeigt den Faktor je Fall, mit
+--max-slowdown endet der Lauf mit Exit-Code 1, wenn ein Fall um mehr
+als diesen Faktor langsamer geworden ist.
+
+Usage: python run_suite.py [--sizes 10,100,1000,10000] [--cases excel,pdf]
+                           [--output ergebnis.json] [--compare alt.json]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import contextlib
+import subprocess
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPT_DIR = BENCH_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_data import iter_overview_rows, iter_detail_payloads, DEFAULT_SEED  # noqa: E402
+
+CASES = ('excel', 'excel_streaming', 'pdf', 'detail')
+DEFAULT_SIZES = '10,100,1000,10000'
+DEFAULT_OUTPUT = 'suite_results.json'
+RESULT_VERSION = 1
+
+
+def _export(case, data, tmp_dir):
+    """Führt einen Export aus und gibt (anzahl, bytes) zurück"""
+    if case == 'detail':
+        from export_employee_detail import create_employee_detail_pdf
+        size = 0
+        for i, payload in enumerate(data):
+            path = os.path.join(tmp_dir, f"detail_{i}.pdf")
+            create_employee_detail_pdf(payload['employee'], payload['vacation'], payload['absence'], path)
+            size += os.path.getsize(path)
+            os.remove(path)
+        return len(data), size
+
+    if case == 'pdf':
+        from export_to_pdf import create_pdf
+        path = os.path.join(tmp_dir, 'uebersicht.pdf')
+        create_pdf(data, path)
+    else:
+        from export_to_excel import create_excel
+        path = os.path.join(tmp_dir, 'uebersicht.xlsx')
+        create_excel(data, path, streaming=case == 'excel_streaming')
+    return len(data), os.path.getsize(path)
+
+
+def run_case(case, employees, seed, repeat, details):
+    """Misst einen Fall (läuft im eigenen Prozess)"""
+    from export_profile import peak_rss_mb
+
+    if case == 'detail':
+        data = list(iter_detail_payloads(min(employees, details), seed=seed))
+    else:
+        data = list(iter_overview_rows(employees, seed=seed))
+    # Imports und Style-Caches vor der Messung
+    with tempfile.TemporaryDirectory() as tmp_dir, contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        _export(case, data[:1], tmp_dir)
+    rss_before = peak_rss_mb()
+
+    times = []
+    with tempfile.TemporaryDirectory() as tmp_dir, contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count, size = _export(case, data, tmp_dir)
+            times.append(time.perf_counter() - start)
+
+    seconds = min(times)
+    peak = peak_rss_mb()
+    return {
+        'case': case,
+        'employees': employees,
+        'items': count,
+        'seconds': round(seconds, 4),
+        'items_per_s': round(count / seconds, 1) if seconds else None,
+        'peak_rss_mb': peak,
+        'rss_delta_mb': round(peak - rss_before, 1) if peak is not None and rss_before is not None else None,
+        'output_kb': round(size / 1024, 1),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _metadata(args):
+    return {
+        'version': RESULT_VERSION,
+        'erstellt': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'plattform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'details': args.details,
+    }
+
+
+def compare(results, baseline_path):
+    """Faktor alt/neu je (Fall, Größe); > 1 heißt schneller geworden"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    old = {(r['case'], r['employees']): r for r in baseline['results']}
+    factors = []
+    print(f"\nVergleich mit {baseline_path} (Commit {baseline['meta'].get('commit')})")
+    print(f"{'Fall':<16} {'Größe':>7} {'alt (s)':>9} {'neu (s)':>9} {'Faktor':>7}")
+    for result in results:
+        previous = old.get((result['case'], result['employees']))
+        if previous is None:
+            continue
+        factor = previous['seconds'] / result['seconds']
+        factors.append((result, factor))
+        print(f"{result['case']:<16} {result['employees']:>7} {previous['seconds']:>9.3f} "
+              f"{result['seconds']:>9.3f} {factor:>6.2f}x")
+    return factors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="Mitarbeiterzahlen, kommagetrennt (10 bis 100000)")
+    parser.add_argument('--cases', default=','.join(CASES), help="Fälle, kommagetrennt")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--repeat', type=int, default=1, help="Wiederholungen je Fall (schnellste zählt)")
+    parser.add_argument('--details', type=int, default=200, help="Höchstzahl Detail-PDFs je Größe")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="JSON-Ergebnisdatei")
+    parser.add_argument('--compare', help="Frühere Ergebnisdatei zum Vergleich")
+    parser.add_argument('--max-slowdown', type=float, help="Exit-Code 1, wenn ein Fall um mehr als diesen Faktor langsamer ist")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    cases = [case.strip() for case in args.cases.split(',')]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"Unbekannte Fälle: {', '.join(sorted(unknown))}")
+
+    results = []
+    context = multiprocessing.get_context('spawn')
+    print(f"{'Fall':<16} {'Größe':>7} {'Zeit (s)':>9} {'pro s':>9} {'RSS (MB)':>9} {'+RSS':>7} {'Datei (KB)':>11}")
+    for employees in sizes:
+        for case in cases:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(run_case, case, employees, args.seed, args.repeat, args.details).result()
+            results.append(result)
+            print(f"{case:<16} {employees:>7} {result['seconds']:>9.3f} {result['items_per_s']:>9.1f} "
+                  f"{result['peak_rss_mb'] or 0:>9.1f} {result['rss_delta_mb'] or 0:>7.1f} {result['output_kb']:>11.1f}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'meta': _metadata(args), 'results': results}, f, ensure_ascii=False, indent=1)
+    print(f"Ergebnisse: {args.output}")
+
+    if args.compare:
+        factors = compare(results, args.compare)
+        if args.max_slowdown and any(1 / factor > args.max_slowdown for _, factor in factors):
+            print(f"Langsamer als erlaubt (Faktor {args.max_slowdown})")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+/**
+ * Paritätsprüfung: scripts/statistics_engine.py vs. DataManager.getAlleStatistiken
+ *
+ * Berechnet die Übersicht für jedes Jahr einmal mit dem DataManager
+ * (wie im Renderer) und einmal mit der vektorisierten Python-Statistik
+ * und vergleicht alle Spalten.
+ *
+ * better-sqlite3 ist für Electron gebaut, daher mit Electron als Node starten:
+ *   ELECTRON_RUN_AS_NODE=1 npx electron benchmarks/statistics_parity.js <datenbank> <von_jahr> [bis_jahr]
+ */
+
+const path = require('path');
+const { spawnSync } = require('child_process');
+const Database = require('better-sqlite3');
+const TeamFlowDataManager = require('../src/js/data-manager.js');
+
+const SPALTEN = [
+  'urlaub_anspruch', 'urlaub_uebertrag', 'urlaub_verfuegbar', 'urlaub_genommen',
+  'urlaub_rest', 'krankheit', 'schulung', 'ueberstunden'
+];
+const TOLERANZ = 1e-9;
+
+/**
+ * Adapter mit der Schnittstelle von TeamFlowDatabase (database.js)
+ */
+function createDatabaseAdapter(db) {
+  return {
+    query: async (sql, params = []) => ({ success: true, data: db.prepare(sql).all(...params) }),
+    get: async (sql, params = []) => ({ success: true, data: db.prepare(sql).get(...params) })
+  };
+}
+
+/**
+ * Übersicht eines Jahres wie in renderer.js exportToExcel
+ */
+async function jsOverview(adapter, jahr) {
+  const dataManager = new TeamFlowDataManager(adapter, jahr);
+  const stats = await dataManager.getAlleStatistiken();
+  return stats.map(stat => ({
+    mitarbeiter: `${stat.mitarbeiter.vorname} ${stat.mitarbeiter.nachname}`,
+    abteilung: stat.mitarbeiter.abteilung_name,
+    urlaub_anspruch: stat.urlaubsanspruch,
+    urlaub_uebertrag: stat.uebertrag_vorjahr,
+    urlaub_verfuegbar: stat.urlaub_verfuegbar,
+    urlaub_genommen: stat.urlaub_genommen,
+    urlaub_rest: stat.urlaub_rest,
+    krankheit: stat.krankheitstage,
+    schulung: stat.schulungstage,
+    ueberstunden: stat.ueberstunden
+  }));
+}
+
+function pythonOverview(dbPath, vonJahr, bisJahr) {
+  const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
+  const script = path.join(__dirname, '..', 'scripts', 'statistics_engine.py');
+  const result = spawnSync(pythonCmd, [script, dbPath, String(vonJahr), String(bisJahr)], {
+    encoding: 'utf8',
+    maxBuffer: 1024 * 1024 * 1024
+  });
+  if (result.status !== 0) {
+    throw new Error(`statistics_engine.py fehlgeschlagen: ${result.stderr}`);
+  }
+  return JSON.parse(result.stdout);
+}
+
+async function main() {
+  const [dbPath, vonArg, bisArg] = process.argv.slice(2);
+  if (!dbPath || !vonArg) {
+    console.error('Usage: statistics_parity.js <datenbank> <von_jahr> [bis_jahr]');
+    process.exit(1);
+  }
+  const vonJahr = parseInt(vonArg, 10);
+  const bisJahr = bisArg ? parseInt(bisArg, 10) : vonJahr;
+
+  const db = new Database(dbPath, { readonly: true });
+  const adapter = createDatabaseAdapter(db);
+
+  // DataManager protokolliert jede Initialisierung
+  const log = console.log;
+  console.log = () => {};
+
+  const python = pythonOverview(dbPath, vonJahr, bisJahr);
+  let abweichungen = 0;
+  let zeilen = 0;
+
+  for (let jahr = vonJahr; jahr <= bisJahr; jahr++) {
+    const jsRows = await jsOverview(adapter, jahr);
+    const pyRows = python[String(jahr)] || [];
+
+    if (jsRows.length !== pyRows.length) {
+      log(`❌ ${jahr}: ${jsRows.length} Zeilen (JS) vs. ${pyRows.length} Zeilen (Python)`);
+      abweichungen++;
+      continue;
+    }
+
+    jsRows.forEach((jsRow, index) => {
+      const pyRow = pyRows[index];
+      zeilen++;
+      if (jsRow.mitarbeiter !== pyRow.mitarbeiter || jsRow.abteilung !== pyRow.abteilung) {
+        log(`❌ ${jahr} Zeile ${index}: ${jsRow.mitarbeiter} vs. ${pyRow.mitarbeiter}`);
+        abweichungen++;
+        return;
+      }
+      for (const spalte of SPALTEN) {
+        if (Math.abs(jsRow[spalte] - pyRow[spalte]) > TOLERANZ) {
+          log(`❌ ${jahr} ${jsRow.mitarbeiter} ${spalte}: ${jsRow[spalte]} (JS) vs. ${pyRow[spalte]} (Python)`);
+          abweichungen++;
+        }
+      }
+    });
+  }
+
+  db.close();
+  log(`${zeilen} Zeilen in ${bisJahr - vonJahr + 1} Jahren verglichen, ${abweichungen} Abweichungen`);
+  process.exit(abweichungen === 0 ? 0 : 1);
+}
+
+main().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetische TeamFlow-Daten für Benchmarks
+
+Erzeugt die drei Eingabeformen der Export-Scripts:
+    Übersicht    Zeilen für create_excel / create_pdf (wie
+                 export_from_db.iter_overview_rows)
+    Einträge     Urlaubs- und Abwesenheitseinträge eines Mitarbeiters
+                 ({von, bis, tage, notiz} bzw. {typ, datum, wert, notiz})
+    Detail       {employee, vacation, absence} für
+                 create_employee_detail_pdf (wie iter_detail_payloads)
+    Datenbank    SQLite-Datei mit dem Schema aus main.js für die
+                 Benchmarks der Statistik (create_database)
+
+Jeder Mitarbeiter hat einen eigenen Zufallsgenerator aus (seed, Index).
+Die Daten sind damit reproduzierbar, unabhängig von der Gesamtzahl und
+passen über die Formen hinweg zusammen: die Übersichtszeile enthält die
+Summen der Einträge desselben Mitarbeiters. Alle iter_*-Funktionen sind
+Generatoren, auch 100.000 Mitarbeiter liegen nie komplett im Speicher.
+Mit departments=N verteilen sich die Übersichtszeilen gleichmäßig auf
+"Abteilung 0" bis "Abteilung N-1" statt auf die gewichteten ABTEILUNGEN.
+
+Usage: python synthetic_data.py [--employees 10] [--shape overview|entries|detail]
+       (gibt die Daten als NDJSON aus, z.B. als stdin für die Export-Scripts)
+"""
+
+import re
+import sys
+import json
+import random
+import sqlite3
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_SEED = 42
+DEFAULT_YEAR = 2025
+
+VORNAMEN = [
+    "Anna", "Ben", "Clara", "David", "Elif", "Felix", "Greta", "Hannes", "Ida", "Jonas",
+    "Katharina", "Lukas", "Marie", "Niklas", "Özlem", "Paul", "Quirin", "Rosa", "Sören", "Tanja",
+]
+NACHNAMEN = [
+    "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker", "Schulz", "Hoffmann",
+    "Schäfer", "Koch", "Bauer", "Richter", "Klein", "Wolf", "Schröder", "Neumann", "Schwarz", "Zimmermann",
+]
+# Abteilungen mit Gewicht (große und kleine Abteilungen wie in echten Betrieben)
+ABTEILUNGEN = [
+    ("Produktion", 30), ("Vertrieb", 15), ("Lager & Logistik", 12), ("Verwaltung", 10), ("Buchhaltung", 8),
+    ("Einkauf", 6), ("IT", 6), ("Personal", 4), ("Qualitätssicherung", 5), ("Geschäftsführung", 1),
+]
+NOTIZEN = ["", "", "", "Sommerurlaub", "Brückentag", "Familienfeier", "Umzug",
+           "Resturlaub aus dem Vorjahr, mit Teamleitung abgestimmt und im Kalender eingetragen"]
+SCHULUNGEN = ["Erste Hilfe", "Staplerschein", "Brandschutz", "Excel für Fortgeschrittene", "Datenschutz"]
+
+
+def _rng(seed, index):
+    return random.Random(seed * 1_000_003 + index)
+
+
+def _employee(rng, index, departments=None):
+    abteilungen, gewichte = zip(*ABTEILUNGEN)
+    name = f"{rng.choice(VORNAMEN)} {rng.choice(NACHNAMEN)}"
+    if departments is None:
+        abteilung = rng.choices(abteilungen, gewichte)[0]
+    else:
+        abteilung = f"Abteilung {rng.randrange(departments)}"
+    return {
+        'mitarbeiter_id': f"MA{index:06d}",
+        'name': name,
+        'abteilung': abteilung,
+        'anspruch': rng.choice([24, 26, 28, 30, 30, 30]),
+        'uebertrag': rng.choice([0, 0, 0, 1, 2, 3, 5, 8, 10]),
+    }
+
+
+def _entries(rng, jahr, per_employee):
+    """(vacation, absence) eines Mitarbeiters, neueste zuerst"""
+    start = date(jahr, 1, 1)
+    vacation = []
+    for _ in range(max(0, int(rng.gauss(per_employee, per_employee / 3)))):
+        dauer = rng.choice([1, 1, 2, 3, 5, 5, 10, 15])
+        von = start + timedelta(days=rng.randint(0, 365 - dauer))
+        vacation.append({
+            'von': von.isoformat(),
+            'bis': (von + timedelta(days=dauer - 1)).isoformat(),
+            'tage': rng.choice([dauer, dauer, 0.5]) if dauer == 1 else dauer,
+            'notiz': rng.choice(NOTIZEN),
+        })
+
+    absence = []
+    for _ in range(int(rng.expovariate(1 / 2))):
+        absence.append({'typ': 'krankheit', 'datum': (start + timedelta(days=rng.randint(0, 364))).isoformat(),
+                        'wert': rng.choice([1, 1, 2, 3, 5, 10]), 'notiz': ''})
+    for _ in range(rng.randint(0, 2)):
+        absence.append({'typ': 'schulung', 'datum': (start + timedelta(days=rng.randint(0, 364))).isoformat(),
+                        'wert': rng.choice([0.5, 1, 2]), 'notiz': '', 'titel': rng.choice(SCHULUNGEN)})
+    for _ in range(rng.randint(0, 12)):
+        absence.append({'typ': 'ueberstunden', 'datum': (start + timedelta(days=rng.randint(0, 364))).isoformat(),
+                        'wert': rng.choice([-4, -2, 1, 1.5, 2, 3.5, 8]), 'notiz': rng.choice(NOTIZEN[:4])})
+
+    vacation.sort(key=lambda e: e['von'], reverse=True)
+    absence.sort(key=lambda e: e['datum'], reverse=True)
+    return vacation, absence
+
+
+def _summe(absence, typ):
+    return sum(entry['wert'] for entry in absence if entry['typ'] == typ)
+
+
+def _employee_data(seed, index, jahr, per_employee, departments=None):
+    rng = _rng(seed, index)
+    employee = _employee(rng, index, departments)
+    vacation, absence = _entries(rng, jahr, per_employee)
+    return employee, vacation, absence
+
+
+def iter_entry_lists(employees, seed=DEFAULT_SEED, jahr=DEFAULT_YEAR, per_employee=6):
+    """(mitarbeiter_id, vacation, absence) pro Mitarbeiter"""
+    for index in range(employees):
+        employee, vacation, absence = _employee_data(seed, index, jahr, per_employee)
+        yield employee['mitarbeiter_id'], vacation, absence
+
+
+def iter_overview_rows(employees, seed=DEFAULT_SEED, jahr=DEFAULT_YEAR, per_employee=6, departments=None):
+    """Übersichtszeilen mit den Summen aus iter_entry_lists (departments: Anzahl Abteilungen)"""
+    for index in range(employees):
+        employee, vacation, absence = _employee_data(seed, index, jahr, per_employee, departments)
+        verfuegbar = employee['anspruch'] + employee['uebertrag']
+        genommen = sum(entry['tage'] for entry in vacation)
+        yield {
+            'mitarbeiter_id': employee['mitarbeiter_id'],
+            'mitarbeiter': employee['name'],
+            'abteilung': employee['abteilung'],
+            'urlaub_anspruch': employee['anspruch'],
+            'urlaub_uebertrag': employee['uebertrag'],
+            'urlaub_verfuegbar': verfuegbar,
+            'urlaub_genommen': genommen,
+            'urlaub_rest': verfuegbar - genommen,
+            'krankheit': _summe(absence, 'krankheit'),
+            'schulung': _summe(absence, 'schulung'),
+            'ueberstunden': _summe(absence, 'ueberstunden'),
+        }
+
+
+def iter_detail_payloads(employees, seed=DEFAULT_SEED, jahr=DEFAULT_YEAR, per_employee=6):
+    """Payloads {employee, vacation, absence} für die Detail-PDF"""
+    for index in range(employees):
+        employee, vacation, absence = _employee_data(seed, index, jahr, per_employee)
+        verfuegbar = employee['anspruch'] + employee['uebertrag']
+        genommen = sum(entry['tage'] for entry in vacation)
+        yield {
+            'employee': {
+                'name': employee['name'],
+                'department': employee['abteilung'],
+                'year': jahr,
+                'entitlement': employee['anspruch'],
+                'carryover': employee['uebertrag'],
+                'available': verfuegbar,
+                'taken': genommen,
+                'remaining': verfuegbar - genommen,
+            },
+            'vacation': vacation,
+            'absence': absence,
+        }
+
+
+def create_database(db_path, employees, first_year, last_year, seed=DEFAULT_SEED):
+    """Synthetische Datenbank mit den CREATE-Anweisungen aus main.js"""
+    schema = re.findall(r'db\.exec\(`\s*(CREATE (?:TABLE|INDEX)[^`]*)`\)', (ROOT_DIR / 'main.js').read_text(encoding='utf-8'))
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    for statement in schema:
+        conn.execute(statement)
+
+    for name in ('Buchhaltung', 'Verkauf', 'Werkstatt', 'Lager', 'Verwaltung'):
+        conn.execute("INSERT INTO abteilungen (name, farbe) VALUES (?, '#1F538D')", (name,))
+
+    for i in range(employees):
+        ma_id = f"MA{i:05d}"
+        eintritt = rng.randint(first_year - 5, last_year)
+        austritt = f"{rng.randint(eintritt, last_year)}-06-30" if rng.random() < 0.1 else None
+        conn.execute("""
+            INSERT INTO mitarbeiter (id, abteilung_id, vorname, nachname, eintrittsdatum, austrittsdatum, urlaubstage_jahr)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (ma_id, rng.randint(1, 5), f"Vorname{i}", f"Nachname{i % 700}",
+              f"{eintritt}-{rng.randint(1, 12):02d}-01", austritt, rng.choice([24, 28, 30])))
+
+        for jahr in range(max(eintritt, first_year - 5), last_year + 1):
+            for _ in range(rng.randint(1, 6)):
+                monat, tag = rng.randint(1, 12), rng.randint(1, 25)
+                conn.execute("INSERT INTO urlaub (mitarbeiter_id, von_datum, bis_datum, tage) VALUES (?, ?, ?, ?)",
+                             (ma_id, f"{jahr}-{monat:02d}-{tag:02d}", f"{jahr}-{monat:02d}-{tag + 3:02d}", rng.choice([0.5, 1, 3, 5])))
+            for _ in range(rng.randint(0, 2)):
+                monat, tag = rng.randint(1, 12), rng.randint(1, 25)
+                datum = f"{jahr}-{monat:02d}-{tag:02d}"
+                conn.execute("INSERT INTO krankheit (mitarbeiter_id, von_datum, bis_datum, tage) VALUES (?, ?, ?, 2)", (ma_id, datum, datum))
+                conn.execute("INSERT INTO schulung (mitarbeiter_id, datum, dauer_tage, titel) VALUES (?, ?, 1, 'Schulung')", (ma_id, datum))
+                conn.execute("INSERT INTO ueberstunden (mitarbeiter_id, datum, stunden) VALUES (?, ?, ?)", (ma_id, datum, rng.choice([-4, 2, 3.5])))
+            if rng.random() < 0.03:
+                conn.execute("INSERT INTO uebertrag_manuell (mitarbeiter_id, jahr, uebertrag_tage) VALUES (?, ?, ?)",
+                             (ma_id, jahr, rng.choice([0, 5, 10])))
+
+    conn.commit()
+    conn.close()
+
+
+def _iter_entry_records(employees, **kwargs):
+    for ma_id, vacation, absence in iter_entry_lists(employees, **kwargs):
+        yield {'mitarbeiter_id': ma_id, 'vacation': vacation, 'absence': absence}
+
+
+SHAPES = {
+    'overview': iter_overview_rows,
+    'entries': _iter_entry_records,
+    'detail': iter_detail_payloads,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=10)
+    parser.add_argument('--shape', choices=sorted(SHAPES), default='overview')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--jahr', type=int, default=DEFAULT_YEAR)
+    args = parser.parse_args()
+
+    for record in SHAPES[args.shape](args.employees, seed=args.seed, jahr=args.jahr):
+        sys.stdout.buffer.write((json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8'))
+
+
+if __name__ == '__main__':
+    main()
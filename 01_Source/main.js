@@ -3,6 +3,7 @@ const path = require('path');
 const fs = require('fs');
 const Database = require('better-sqlite3');
 const { spawn } = require('child_process');
+const { Readable } = require('stream');
 
 let mainWindow;
 let db;
@@ -850,79 +851,330 @@ ipcMain.handle('present-file', async (event, filePath) => {
  * Erstellt Excel/PDF im Export-Ordner neben der .exe
  */
 
-// Excel-Export
-ipcMain.handle('export:excel', async (event, data) => {
-  logger.info('📊 Excel-Export gestartet', { entries: data.length });
-  
-  try {
-    const exportDir = getExportPath();
-    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
-    const tempJsonPath = path.join(exportDir, `temp_${timestamp}.json`);
-    const outputPath = path.join(exportDir, `Urlaub_${timestamp}.xlsx`);
+/**
+ * Langlebiger Python-Prozess für Exporte (scripts/export_server.py)
+ * openpyxl/reportlab werden nur einmal geladen, statt bei jedem Export
+ * einen neuen Interpreter zu starten.
+ *
+ * Protokoll: Jobs als 4 Byte Länge (big-endian) + UTF-8 JSON über stdin,
+ * Ergebnisse als eine JSON-Zeile pro Job über stdout. Mehrere Jobs laufen
+ * gleichzeitig; dazwischen kommen Fortschrittszeilen {"event": "progress", "id", ...}.
+ * Abbruch über einen Job {"id", "type": "cancel"}.
+ */
+class ExportServer {
+  constructor() {
+    this.child = null;
+    this.pending = new Map();
+    this.nextId = 1;
+    this.buffer = '';
+  }
+
+  start() {
+    if (this.child) return;
+
+    const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
+    const scriptPath = getScriptPath('export_server.py');
+    logger.info('🐍 Starte Export-Server', { script: scriptPath });
+
+    const child = spawn(pythonCmd, [scriptPath], { cwd: path.dirname(scriptPath) });
+    this.child = child;
+    this.buffer = '';
+
+    child.stdout.setEncoding('utf8');
+    child.stdout.on('data', (text) => this._onStdout(text));
+
+    child.stderr.on('data', (data) => {
+      logger.debug('Python:', data.toString());
+    });
+
+    child.stdin.on('error', (error) => {
+      logger.warn('⚠️ Export-Server stdin Fehler', { error: error.message });
+    });
+
+    child.on('error', (error) => {
+      logger.error('❌ Export-Server Fehler', { error: error.message });
+      this._reset(child, error.message);
+    });
+
+    child.on('exit', (code) => {
+      logger.warn('⚠️ Export-Server beendet', { code });
+      this._reset(child, `Export-Server beendet (Exit Code ${code})`);
+    });
+  }
+
+  _onStdout(text) {
+    this.buffer += text;
+
+    let newlineIndex;
+    while ((newlineIndex = this.buffer.indexOf('\n')) >= 0) {
+      const line = this.buffer.slice(0, newlineIndex).trim();
+      this.buffer = this.buffer.slice(newlineIndex + 1);
+      if (!line) continue;
+
+      let result;
+      try {
+        result = JSON.parse(line);
+      } catch (error) {
+        logger.warn('⚠️ Ungültige Antwort vom Export-Server', { line });
+        continue;
+      }
+
+      const job = this.pending.get(result.id);
+      if (!job) continue;
+
+      if (result.event === 'progress') {
+        if (job.onProgress) job.onProgress(result);
+        continue;
+      }
+
+      this.pending.delete(result.id);
+      job.resolve(result);
+    }
+  }
+
+  _reset(child, reason) {
+    // Nur reagieren, wenn das Event vom aktuellen Prozess stammt
+    if (this.child !== child) return;
+
+    this.child = null;
+    for (const job of this.pending.values()) {
+      job.resolve({ success: false, error: reason, serverFailed: true });
+    }
+    this.pending.clear();
+  }
+
+  _send(message) {
+    const payload = Buffer.from(JSON.stringify(message), 'utf-8');
+    const header = Buffer.alloc(4);
+    header.writeUInt32BE(payload.length, 0);
+    this.child.stdin.write(Buffer.concat([header, payload]));
+  }
+
+  /**
+   * Führt einen Export-Job aus
+   * @param {Function} onProgress - erhält {event: 'progress', id, rows?, pages?}
+   * @returns {Promise<{success: boolean, path?: string, error?: string, cancelled?: boolean, serverFailed?: boolean}>}
+   */
+  run(type, data, outputPath, options = {}, onProgress = null) {
+    this.start();
+
+    const id = this.nextId++;
+    return new Promise((resolve) => {
+      this.pending.set(id, { resolve, onProgress });
+      this._send({ id, type, output: outputPath, data, options });
+    });
+  }
+
+  /**
+   * Bricht einen laufenden oder wartenden Job ab (id aus den Fortschrittsmeldungen)
+   * @returns {boolean} false, wenn der Job nicht (mehr) läuft
+   */
+  cancel(id) {
+    if (!this.child || !this.pending.has(id)) return false;
+    this._send({ id, type: 'cancel' });
+    return true;
+  }
+
+  stop() {
+    if (!this.child) return;
+
+    const child = this.child;
+    this.child = null;
+    child.stdin.end();
+    logger.info('🛑 Export-Server gestoppt');
+  }
+}
+
+const exportServer = new ExportServer();
+
+// Ab dieser Zeilenanzahl wird Excel im Write-Only-Modus erstellt
+const EXCEL_STREAMING_THRESHOLD = 5000;
+
+app.on('will-quit', () => {
+  exportServer.stop();
+});
+
+/**
+ * Erzeugt die NDJSON-Zeilen für die Eingabe eines Export-Scripts
+ * Übersichten: eine Zeile pro Eintrag
+ * Mitarbeiter-Detail: {"employee"}, {"vacation"} und {"absence"} Datensätze
+ */
+function* exportNdjsonLines(jobType, data) {
+  if (jobType === 'employeeDetailPdf') {
+    yield JSON.stringify({ employee: data.employee || {} }) + '\n';
+    for (const entry of data.vacation || []) {
+      yield JSON.stringify({ vacation: entry }) + '\n';
+    }
+    for (const entry of data.absence || []) {
+      yield JSON.stringify({ absence: entry }) + '\n';
+    }
+    return;
+  }
+
+  for (const entry of data) {
+    yield JSON.stringify(entry) + '\n';
+  }
+}
+
+/**
+ * Startet ein Python-Script als eigenen Prozess
+ * @param {string} scriptName - Dateiname in scripts/
+ * @param {string[]} args - Argumente für das Script
+ * @param {object} options - cwd, input (Readable für stdin), onProgress (Fortschritts-Callback)
+ */
+function spawnPythonScript(scriptName, args, { cwd, input = null, onProgress = null } = {}) {
+  const scriptPath = getScriptPath(scriptName);
+  logger.info('🐍 Führe Python-Script aus', { script: scriptPath });
+
+  const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
+  return new Promise((resolve) => {
+    // Ohne Shell, damit Pfade mit Leerzeichen korrekt übergeben werden
+    const child = spawn(pythonCmd, [scriptPath, ...args], { cwd });
     
-    // 1. JSON schreiben
-    fs.writeFileSync(tempJsonPath, JSON.stringify(data, null, 2), 'utf-8');
-    logger.info('✅ JSON geschrieben', { path: tempJsonPath });
+    let stderr = '';
+    let stdoutBuffer = '';
     
-    // 2. Python-Script Pfad ermitteln
-    const isDev = !app.isPackaged;
-    const scriptDir = isDev ? path.join(__dirname, 'scripts') : path.join(process.resourcesPath, 'scripts');
-    const scriptPath = path.join(scriptDir, 'export_to_excel.py');
+    child.stdout.setEncoding('utf8');
+    child.stdout.on('data', (text) => {
+      logger.debug('Python:', text);
+
+      // Fortschritt und Profil (TEAMFLOW_PROFILE) kommen als JSON-Zeile {"event": ...}
+      stdoutBuffer += text;
+      let newlineIndex;
+      while ((newlineIndex = stdoutBuffer.indexOf('\n')) >= 0) {
+        const line = stdoutBuffer.slice(0, newlineIndex).trim();
+        stdoutBuffer = stdoutBuffer.slice(newlineIndex + 1);
+        if (!line.startsWith('{')) continue;
+        try {
+          const message = JSON.parse(line);
+          if (message.event === 'progress' && onProgress) onProgress(message);
+          if (message.event === 'profile') logger.info('⏱️ Export-Profil', message);
+        } catch (error) {
+          // Keine Ereigniszeile
+        }
+      }
+    });
     
-    logger.info('🐍 Führe Python-Script aus', { script: scriptPath });
+    child.stderr.on('data', (data) => {
+      const text = data.toString();
+      stderr += text;
+      logger.warn('Python stderr:', text);
+    });
+
+    child.stdin.on('error', (error) => {
+      logger.warn('⚠️ Python stdin Fehler', { error: error.message });
+    });
     
-    // 3. Python ausführen
-    const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
-    const result = await new Promise((resolve) => {
-      const child = spawn(pythonCmd, [scriptPath, tempJsonPath, outputPath], { 
-        shell: true,
-        cwd: exportDir
-      });
-      
-      let stdout = '';
-      let stderr = '';
-      
-      child.stdout.on('data', (data) => {
-        const text = data.toString();
-        stdout += text;
-        logger.debug('Python:', text);
-      });
-      
-      child.stderr.on('data', (data) => {
-        const text = data.toString();
-        stderr += text;
-        logger.warn('Python stderr:', text);
-      });
-      
-      child.on('close', (code) => {
-        if (code === 0) {
-          logger.success('✅ Excel erfolgreich erstellt', { path: outputPath });
-          resolve({ success: true, path: outputPath });
-        } else {
-          logger.error('❌ Python-Script fehlgeschlagen', { code, stderr });
-          resolve({ success: false, error: `Exit Code ${code}: ${stderr}` });
-        }
-      });
-      
-      child.on('error', (error) => {
-        logger.error('❌ Python-Prozess Fehler', { error: error.message });
-        resolve({ success: false, error: error.message });
-      });
+    child.on('close', (code) => {
+      if (code === 0) {
+        resolve({ success: true });
+      } else {
+        logger.error('❌ Python-Script fehlgeschlagen', { code, stderr });
+        resolve({ success: false, error: `Exit Code ${code}: ${stderr}` });
+      }
     });
     
-    // 4. Temporäre JSON löschen
-    try {
-      fs.unlinkSync(tempJsonPath);
-      logger.info('🗑️ Temporäre JSON gelöscht');
-    } catch (err) {
-      logger.warn('⚠️ Konnte temp JSON nicht löschen', { error: err.message });
+    child.on('error', (error) => {
+      logger.error('❌ Python-Prozess Fehler', { error: error.message });
+      resolve({ success: false, error: error.message });
+    });
+
+    if (input) {
+      // Mit Backpressure in stdin schreiben
+      input.pipe(child.stdin);
+    } else {
+      child.stdin.end();
     }
+  });
+}
+
+// Format der gemeinsamen Export-CLI (scripts/exporters.py) je Job-Typ
+const EXPORT_CLI_FORMATS = {
+  excel: 'xlsx',
+  pdf: 'pdf',
+  employeeDetailPdf: 'detail'
+};
+
+/**
+ * Fallback: Führt ein Export-Script als eigenen Python-Prozess aus
+ * (wird nur genutzt, wenn der Export-Server nicht verfügbar ist)
+ * Die Daten werden als NDJSON über stdin gestreamt, keine temporäre Datei.
+ */
+async function runExportScript(jobType, scriptName, data, outputPath, options = {}, onProgress = null) {
+  // Boolesche Optionen werden zu CLI-Flags (z.B. streaming -> --streaming),
+  // Text-Optionen zu Flag und Wert (z.B. format -> --format xlsx)
+  const flags = Object.keys(options).flatMap(key => {
+    if (options[key] === true) return [`--${key}`];
+    if (typeof options[key] === 'string') return [`--${key}`, options[key]];
+    return [];
+  });
+
+  const result = await spawnPythonScript(scriptName, [...flags, '-', outputPath], {
+    cwd: path.dirname(outputPath),
+    input: Readable.from(exportNdjsonLines(jobType, data)),
+    onProgress
+  });
+
+  return result.success ? { success: true, path: outputPath } : result;
+}
+
+/**
+ * Führt einen Export aus: bevorzugt über den Export-Server,
+ * bei Server-Problemen als einzelner Python-Prozess (exporters.py)
+ */
+async function runExport(jobType, data, outputPath, options = {}, onProgress = null) {
+  const result = await exportServer.run(jobType, data, outputPath, options, onProgress);
+
+  if (result.success) {
+    logger.info('📦 Export-Job abgeschlossen', { type: jobType, dauer_ms: result.dauer_ms, cache: result.cache });
+    return { success: true, path: outputPath };
+  }
+
+  if (result.cancelled) {
+    logger.info('🛑 Export-Job abgebrochen', { type: jobType, id: result.id });
+    return { success: false, cancelled: true, error: result.error };
+  }
+
+  if (!result.serverFailed) {
+    logger.error('❌ Export-Job fehlgeschlagen', { type: jobType, error: result.error });
+    return { success: false, error: result.error };
+  }
+
+  logger.warn('⚠️ Export-Server nicht verfügbar, nutze Einzelprozess', { error: result.error });
+  return runExportScript(jobType, 'exporters.py', data, outputPath,
+    { format: EXPORT_CLI_FORMATS[jobType], ...options }, onProgress);
+}
+
+/**
+ * Öffnet den Export-Ordner nach erfolgreichem Export
+ */
+async function openExportDir(exportDir) {
+  const { shell } = require('electron');
+  await shell.openPath(exportDir);
+  logger.info('📂 Export-Ordner geöffnet');
+}
+
+// Excel-Export
+ipcMain.handle('export:excel', async (event, data, exportOptions = {}) => {
+  logger.info('📊 Excel-Export gestartet', { entries: data.length, departments: exportOptions.departments === true });
+  
+  try {
+    const exportDir = getExportPath();
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+    const outputPath = path.join(exportDir, `Urlaub_${timestamp}.xlsx`);
+    
+    // Große Exporte im Write-Only-Modus (konstanter Speicher),
+    // auf Wunsch ein Blatt pro Abteilung (parallel erzeugt)
+    const options = {
+      streaming: data.length >= EXCEL_STREAMING_THRESHOLD,
+      departments: exportOptions.departments === true
+    };
+    const result = await runExport('excel', data, outputPath, options,
+      (progress) => event.sender.send('export:progress', { ...progress, type: 'excel' }));
     
-    // 5. Ordner öffnen bei Erfolg
     if (result.success) {
-      const { shell } = require('electron');
-      await shell.openPath(exportDir);
-      logger.info('📂 Export-Ordner geöffnet');
+      logger.success('✅ Excel erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
     }
     
     return result;
@@ -940,72 +1192,14 @@ ipcMain.handle('export:pdf', async (event, data) => {
   try {
     const exportDir = getExportPath();
     const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
-    const tempJsonPath = path.join(exportDir, `temp_${timestamp}.json`);
     const outputPath = path.join(exportDir, `Urlaub_${timestamp}.pdf`);
     
-    // 1. JSON schreiben
-    fs.writeFileSync(tempJsonPath, JSON.stringify(data, null, 2), 'utf-8');
-    logger.info('✅ JSON geschrieben', { path: tempJsonPath });
-    
-    // 2. Python-Script Pfad ermitteln
-    const isDev = !app.isPackaged;
-    const scriptDir = isDev ? path.join(__dirname, 'scripts') : path.join(process.resourcesPath, 'scripts');
-    const scriptPath = path.join(scriptDir, 'export_to_pdf.py');
-    
-    logger.info('🐍 Führe Python-Script aus', { script: scriptPath });
+    const result = await runExport('pdf', data, outputPath, {},
+      (progress) => event.sender.send('export:progress', { ...progress, type: 'pdf' }));
     
-    // 3. Python ausführen
-    const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
-    const result = await new Promise((resolve) => {
-      const child = spawn(pythonCmd, [scriptPath, tempJsonPath, outputPath], { 
-        shell: true,
-        cwd: exportDir
-      });
-      
-      let stdout = '';
-      let stderr = '';
-      
-      child.stdout.on('data', (data) => {
-        const text = data.toString();
-        stdout += text;
-        logger.debug('Python:', text);
-      });
-      
-      child.stderr.on('data', (data) => {
-        const text = data.toString();
-        stderr += text;
-        logger.warn('Python stderr:', text);
-      });
-      
-      child.on('close', (code) => {
-        if (code === 0) {
-          logger.success('✅ PDF erfolgreich erstellt', { path: outputPath });
-          resolve({ success: true, path: outputPath });
-        } else {
-          logger.error('❌ Python-Script fehlgeschlagen', { code, stderr });
-          resolve({ success: false, error: `Exit Code ${code}: ${stderr}` });
-        }
-      });
-      
-      child.on('error', (error) => {
-        logger.error('❌ Python-Prozess Fehler', { error: error.message });
-        resolve({ success: false, error: error.message });
-      });
-    });
-    
-    // 4. Temporäre JSON löschen
-    try {
-      fs.unlinkSync(tempJsonPath);
-      logger.info('🗑️ Temporäre JSON gelöscht');
-    } catch (err) {
-      logger.warn('⚠️ Konnte temp JSON nicht löschen', { error: err.message });
-    }
-    
-    // 5. Ordner öffnen bei Erfolg
     if (result.success) {
-      const { shell } = require('electron');
-      await shell.openPath(exportDir);
-      logger.info('📂 Export-Ordner geöffnet');
+      logger.success('✅ PDF erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
     }
     
     return result;
@@ -1016,11 +1210,6 @@ ipcMain.handle('export:pdf', async (event, data) => {
   }
 });
 
-// ========================================
-// IPC-HANDLER FÜR MITARBEITER-DETAIL PDF-EXPORT
-// Füge diesen Code zu deinen anderen IPC-Handlern in main.js hinzu
-// ========================================
-
 // Mitarbeiter-Detail PDF-Export
 ipcMain.handle('export:employeeDetailPdf', async (event, data) => {
   logger.info('📄 Mitarbeiter-Detail PDF-Export gestartet', { employee: data.employee.name });
@@ -1029,78 +1218,234 @@ ipcMain.handle('export:employeeDetailPdf', async (event, data) => {
     const exportDir = getExportPath();
     const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
     const employeeName = data.employee.name.replace(/[^a-zA-Z0-9]/g, '_');
-    const tempJsonPath = path.join(exportDir, `temp_${timestamp}.json`);
     const outputPath = path.join(exportDir, `Mitarbeiter_${employeeName}_${timestamp}.pdf`);
     
-    // 1. JSON schreiben
-    fs.writeFileSync(tempJsonPath, JSON.stringify(data, null, 2), 'utf-8');
-    logger.info('✅ JSON geschrieben', { path: tempJsonPath });
+    const result = await runExport('employeeDetailPdf', data, outputPath, {},
+      (progress) => event.sender.send('export:progress', { ...progress, type: 'employeeDetailPdf' }));
     
-    // 2. Python-Script Pfad ermitteln
-    const isDev = !app.isPackaged;
-    const scriptDir = isDev ? path.join(__dirname, 'scripts') : path.join(process.resourcesPath, 'scripts');
-    const scriptPath = path.join(scriptDir, 'export_employee_detail.py');
+    if (result.success) {
+      logger.success('✅ PDF erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
+    }
     
-    logger.info('🐍 Führe Python-Script aus', { script: scriptPath });
+    return result;
     
-    // 3. Python ausführen
-    const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
-    const result = await new Promise((resolve) => {
-      const child = spawn(pythonCmd, [scriptPath, tempJsonPath, outputPath], { 
-        shell: true,
-        cwd: exportDir
-      });
-      
-      let stdout = '';
-      let stderr = '';
-      
-      child.stdout.on('data', (data) => {
-        const text = data.toString();
-        stdout += text;
-        logger.debug('Python:', text);
-      });
-      
-      child.stderr.on('data', (data) => {
-        const text = data.toString();
-        stderr += text;
-        logger.warn('Python stderr:', text);
-      });
-      
-      child.on('close', (code) => {
-        if (code === 0) {
-          logger.success('✅ PDF erfolgreich erstellt', { path: outputPath });
-          resolve({ success: true, path: outputPath });
-        } else {
-          logger.error('❌ Python-Script fehlgeschlagen', { code, stderr });
-          resolve({ success: false, error: `Exit Code ${code}: ${stderr}` });
-        }
-      });
-      
-      child.on('error', (error) => {
-        logger.error('❌ Python-Prozess Fehler', { error: error.message });
-        resolve({ success: false, error: error.message });
-      });
+  } catch (error) {
+    logger.error('❌ PDF-Export fehlgeschlagen', { error: error.message });
+    return { success: false, error: error.message };
+  }
+});
+
+// Laufenden Export-Job abbrechen (id aus export:progress)
+ipcMain.handle('export:cancel', async (event, id) => {
+  const cancelled = exportServer.cancel(id);
+  logger.info('🛑 Export-Abbruch angefordert', { id, cancelled });
+  return { success: cancelled };
+});
+
+// Mitarbeiter-Detail PDF-Export für viele Mitarbeiter (z.B. Jahresabschluss)
+// data: { payloads: [{ employee, vacation, absence }, ...], separate: boolean }
+ipcMain.handle('export:employeeDetailBatch', async (event, data) => {
+  const payloads = data.payloads || [];
+  logger.info('📄 Mitarbeiter-Detail Batch-Export gestartet', { employees: payloads.length, separate: !!data.separate });
+  
+  try {
+    const exportDir = getExportPath();
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+    const outputPath = data.separate
+      ? path.join(exportDir, `Mitarbeiter_${timestamp}`)
+      : path.join(exportDir, `Mitarbeiter_Alle_${timestamp}.pdf`);
+    
+    // Batch läuft als eigener Prozess, damit Fortschritt gemeldet werden kann
+    const result = await runExportScript(
+      'employeeDetailBatch',
+      'export_employee_batch.py',
+      payloads,
+      outputPath,
+      { separate: !!data.separate },
+      (progress) => event.sender.send('export:progress', progress)
+    );
+    
+    if (result.success) {
+      logger.success('✅ Batch-Export erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
+    }
+    
+    return result;
+    
+  } catch (error) {
+    logger.error('❌ Batch-Export fehlgeschlagen', { error: error.message });
+    return { success: false, error: error.message };
+  }
+});
+
+// Export direkt aus der Datenbank (ohne Renderer-Berechnung und IPC-Payload)
+// data: { jahr, format: 'xlsx' | 'pdf' | 'details', abteilung?, separate? }
+ipcMain.handle('export:fromDatabase', async (event, data) => {
+  logger.info('🗄️ Datenbank-Export gestartet', data);
+  
+  try {
+    const exportDir = getExportPath();
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+    const jahr = parseInt(data.jahr, 10);
+    
+    let outputPath;
+    if (data.format === 'details') {
+      outputPath = data.separate
+        ? path.join(exportDir, `Mitarbeiter_${jahr}_${timestamp}`)
+        : path.join(exportDir, `Mitarbeiter_Alle_${jahr}_${timestamp}.pdf`);
+    } else {
+      const extension = ['pdf', 'csv', 'parquet', 'arrow'].includes(data.format) ? data.format : 'xlsx';
+      outputPath = path.join(exportDir, `Urlaub_${jahr}_${timestamp}.${extension}`);
+    }
+    
+    const args = [getDatabasePath(), String(jahr), outputPath];
+    if (data.abteilung && data.abteilung !== 'Alle') args.push('--abteilung', data.abteilung);
+    if (data.format === 'details') args.push('--details');
+    if (data.separate) args.push('--separate');
+    if (data.departments) args.push('--departments');
+    
+    const result = await spawnPythonScript('export_from_db.py', args, {
+      cwd: exportDir,
+      onProgress: (progress) => event.sender.send('export:progress', progress)
     });
     
-    // 4. Temporäre JSON löschen
-    try {
-      fs.unlinkSync(tempJsonPath);
-      logger.info('🗑️ Temporäre JSON gelöscht');
-    } catch (err) {
-      logger.warn('⚠️ Konnte temp JSON nicht löschen', { error: err.message });
+    if (result.success) {
+      logger.success('✅ Datenbank-Export erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
+      return { success: true, path: outputPath };
+    }
+    
+    return result;
+    
+  } catch (error) {
+    logger.error('❌ Datenbank-Export fehlgeschlagen', { error: error.message });
+    return { success: false, error: error.message };
+  }
+});
+
+// Mitarbeiter-Dossier (alle Jahre) direkt aus der Datenbank
+// data: { mitarbeiterId, name?, bisJahr? }
+ipcMain.handle('export:employeeDossier', async (event, data) => {
+  logger.info('🗂️ Mitarbeiter-Dossier-Export gestartet', data);
+  
+  try {
+    const exportDir = getExportPath();
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+    const employeeName = (data.name || String(data.mitarbeiterId)).replace(/[^a-zA-Z0-9]/g, '_');
+    const outputPath = path.join(exportDir, `Dossier_${employeeName}_${timestamp}.pdf`);
+    
+    const args = [getDatabasePath(), String(data.mitarbeiterId), outputPath];
+    if (data.bisJahr) args.push('--bis-jahr', String(parseInt(data.bisJahr, 10)));
+    
+    const result = await spawnPythonScript('export_employee_dossier.py', args, { cwd: exportDir });
+    
+    if (result.success) {
+      logger.success('✅ Mitarbeiter-Dossier erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
+      return { success: true, path: outputPath };
     }
     
-    // 5. Ordner öffnen bei Erfolg
+    return result;
+    
+  } catch (error) {
+    logger.error('❌ Mitarbeiter-Dossier-Export fehlgeschlagen', { error: error.message });
+    return { success: false, error: error.message };
+  }
+});
+
+// Jahresplaner (Gantt-Raster) direkt aus der Datenbank
+ipcMain.handle('export:yearGrid', async (event, data) => {
+  logger.info('🗓️ Jahresplaner-Export gestartet', data);
+  
+  try {
+    const exportDir = getExportPath();
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+    const jahr = parseInt(data.jahr, 10);
+    const outputPath = path.join(exportDir, `Jahresplaner_${jahr}_${timestamp}.xlsx`);
+    
+    const args = [getDatabasePath(), String(jahr), outputPath];
+    if (data.abteilung && data.abteilung !== 'Alle') args.push('--abteilung', data.abteilung);
+    
+    const result = await spawnPythonScript('export_year_grid.py', args, { cwd: exportDir });
+    
     if (result.success) {
-      const { shell } = require('electron');
-      await shell.openPath(exportDir);
-      logger.info('📂 Export-Ordner geöffnet');
+      logger.success('✅ Jahresplaner erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
+      return { success: true, path: outputPath };
     }
     
     return result;
     
   } catch (error) {
-    logger.error('❌ PDF-Export fehlgeschlagen', { error: error.message });
+    logger.error('❌ Jahresplaner-Export fehlgeschlagen', { error: error.message });
+    return { success: false, error: error.message };
+  }
+});
+
+// Abwesenheitsbericht (Abteilung x Monat) direkt aus der Datenbank
+// data: { vonJahr, bisJahr?, abteilung?, format: 'xlsx' | 'pdf' }
+ipcMain.handle('export:absenceReport', async (event, data) => {
+  logger.info('📊 Abwesenheitsbericht-Export gestartet', data);
+  
+  try {
+    const exportDir = getExportPath();
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+    const vonJahr = parseInt(data.vonJahr, 10);
+    const bisJahr = data.bisJahr ? parseInt(data.bisJahr, 10) : vonJahr;
+    const format = data.format === 'pdf' ? 'pdf' : 'xlsx';
+    const zeitraum = bisJahr !== vonJahr ? `${vonJahr}-${bisJahr}` : `${vonJahr}`;
+    const outputPath = path.join(exportDir, `Abwesenheitsbericht_${zeitraum}_${timestamp}.${format}`);
+    
+    const args = [getDatabasePath(), String(vonJahr), outputPath, '--bis-jahr', String(bisJahr)];
+    if (data.abteilung && data.abteilung !== 'Alle') args.push('--abteilung', data.abteilung);
+    
+    const result = await spawnPythonScript('export_absence_report.py', args, { cwd: exportDir });
+    
+    if (result.success) {
+      logger.success('✅ Abwesenheitsbericht erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
+      return { success: true, path: outputPath };
+    }
+    
+    return result;
+    
+  } catch (error) {
+    logger.error('❌ Abwesenheitsbericht-Export fehlgeschlagen', { error: error.message });
     return { success: false, error: error.message };
   }
-});
\ No newline at end of file
+});
+
+// Besetzungsanalyse: Tage unter Mindestbesetzung pro Abteilung
+// data: { von, bis, minimum?, abteilungMinimum?: { name: n }, abteilung?, format: 'xlsx' | 'pdf' }
+ipcMain.handle('export:staffingCoverage', async (event, data) => {
+  logger.info('👥 Besetzungsanalyse gestartet', data);
+  
+  try {
+    const exportDir = getExportPath();
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+    const format = data.format === 'pdf' ? 'pdf' : 'xlsx';
+    const outputPath = path.join(exportDir, `Besetzungsanalyse_${data.von}_${data.bis}_${timestamp}.${format}`);
+    
+    const args = [getDatabasePath(), data.von, data.bis, outputPath];
+    if (data.minimum !== undefined && data.minimum !== null) args.push('--minimum', String(data.minimum));
+    for (const [name, minimum] of Object.entries(data.abteilungMinimum || {})) {
+      args.push('--abteilung-minimum', `${name}=${minimum}`);
+    }
+    if (data.abteilung && data.abteilung !== 'Alle') args.push('--abteilung', data.abteilung);
+    
+    const result = await spawnPythonScript('export_staffing_coverage.py', args, { cwd: exportDir });
+    
+    if (result.success) {
+      logger.success('✅ Besetzungsanalyse erfolgreich erstellt', { path: outputPath });
+      await openExportDir(exportDir);
+      return { success: true, path: outputPath };
+    }
+    
+    return result;
+    
+  } catch (error) {
+    logger.error('❌ Besetzungsanalyse fehlgeschlagen', { error: error.message });
+    return { success: false, error: error.message };
+  }
+});
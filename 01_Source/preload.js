@@ -11,9 +11,21 @@ contextBridge.exposeInMainWorld('electronAPI', {
   getAppPath: (name) => ipcRenderer.invoke('app:getPath', name),
   getAppVersion: () => ipcRenderer.invoke('app:getVersion'),
   getDatabasePath: () => ipcRenderer.invoke('app:getDatabasePath'),
-  exportExcel: (data) => ipcRenderer.invoke('export:excel', data),
+  exportExcel: (data, options) => ipcRenderer.invoke('export:excel', data, options),
   exportPdf: (data) => ipcRenderer.invoke('export:pdf', data),
   exportEmployeeDetailPdf: (data) => ipcRenderer.invoke('export:employeeDetailPdf', data),
+  exportEmployeeDetailBatch: (data) => ipcRenderer.invoke('export:employeeDetailBatch', data),
+  exportFromDatabase: (data) => ipcRenderer.invoke('export:fromDatabase', data),
+  exportYearGrid: (data) => ipcRenderer.invoke('export:yearGrid', data),
+  exportEmployeeDossier: (data) => ipcRenderer.invoke('export:employeeDossier', data),
+  exportAbsenceReport: (data) => ipcRenderer.invoke('export:absenceReport', data),
+  exportStaffingCoverage: (data) => ipcRenderer.invoke('export:staffingCoverage', data),
+  cancelExport: (id) => ipcRenderer.invoke('export:cancel', id),
+  onExportProgress: (callback) => {
+    const listener = (event, progress) => callback(progress);
+    ipcRenderer.on('export:progress', listener);
+    return () => ipcRenderer.removeListener('export:progress', listener);
+  },
 
 
   db: {
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Delta-Export für die Excel-Übersicht
+
+Statt die Übersicht komplett neu zu erzeugen, wird eine frühere Datei von
+export_to_excel.py mit den neuen Zeilen abgeglichen (über die ausgeblendete
+Spalte mit der Mitarbeiter-ID) und nur ihr Sheet-XML gepatcht:
+
+    unverändert   Zeile bleibt byte-genau erhalten
+    geändert      Zeile wird neu geschrieben, optional mit markierten Zellen
+    entfernt      Zeile entfällt, folgende Zeilen rücken nach
+    neu           Zeile wird am Ende angehängt
+
+Das Workbook wird dabei nicht über openpyxl geladen; alle anderen Teile der
+Datei werden unverändert übernommen, styles.xml nur um die Markierung
+ergänzt. Markierungen eines früheren Delta-Exports werden zurückgesetzt,
+sodass immer nur die Änderungen des letzten Abgleichs markiert sind.
+"""
+
+import os
+import re
+import sys
+import html
+import zipfile
+import tempfile
+import posixpath
+from pathlib import Path
+from xml.etree import ElementTree
+
+from openpyxl.utils import get_column_letter
+
+from export_columns import COLUMNS, ID_KEY, ID_HEADER
+from export_rows import overview_rows
+from export_profile import span
+from export_to_excel import ID_COLUMN, SHEET_TITLE, cell_xml
+from export_styles import CHANGED_COLOR
+
+
+NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+SHEET_DATA_RE = re.compile(rb'<sheetData\s*/>|<sheetData>(.*?)</sheetData>', re.DOTALL)
+ROW_RE = re.compile(rb'<row\b[^>]*?(?:/>|>.*?</row>)', re.DOTALL)
+ROW_NUMBER_RE = re.compile(rb'(<row\b[^>]*?\br=")(\d+)')
+CELL_RE = re.compile(rb'<c r="([A-Z]+)\d+"([^>]*?)(?:/>|>(.*?)</c>)', re.DOTALL)
+# Attributreihenfolge r, s, t wie bei openpyxl und Excel: Typ und Wert in einem Durchlauf
+CELL_VALUE_RE = re.compile(
+    rb'<c r="([A-Z]+)\d+"(?: s="\d+")?(?: t="(\w+)")?(?:/>|>(?:<v>([^<]*)</v>|<is>(.*?)</is>)?</c>)', re.DOTALL)
+CELL_REF_RE = re.compile(rb'(<c r="[A-Z]+)\d+')
+TYPE_RE = re.compile(rb'\bt="([^"]*)"')
+TEXT_RE = re.compile(rb'<t(?:\s[^>]*)?>(.*?)</t>', re.DOTALL)
+VALUE_RE = re.compile(rb'<v>(.*?)</v>', re.DOTALL)
+STYLE_ID_RE = re.compile(rb' s="(\d+)"')
+DIMENSION_RE = re.compile(rb'<dimension ref="([A-Z]+\d+):([A-Z]+)\d+"/>')
+FILLS_RE = re.compile(rb'<fills count="(\d+)">(.*?)</fills>', re.DOTALL)
+CELL_XFS_RE = re.compile(rb'<cellXfs count="(\d+)">(.*?)</cellXfs>', re.DOTALL)
+XF_RE = re.compile(rb'<xf\b[^>]*?(?:/>|>.*?</xf>)', re.DOTALL)
+FILL_ID_RE = re.compile(rb'\bfillId="\d+"')
+
+CHANGED_FILL = (
+    f'<fill><patternFill patternType="solid"><fgColor rgb="00{CHANGED_COLOR.upper()}"/>'
+    f'<bgColor rgb="00{CHANGED_COLOR.upper()}"/></patternFill></fill>'
+).encode('ascii')
+
+
+def _sheet_part(archive, title):
+    """Pfad des Sheet-XML zum Blattnamen (über workbook.xml und dessen Relationships)"""
+    workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+    rels = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(f'{NS_PKG_REL}Relationship')}
+    for sheet in workbook.iter(f'{NS_MAIN}sheet'):
+        if sheet.get('name') == title:
+            target = targets[sheet.get(f'{NS_REL}id')]
+            # openpyxl schreibt absolute, Excel relative Ziele
+            return target.lstrip('/') if target.startswith('/') else posixpath.normpath(f"xl/{target}")
+    raise ValueError(f"Blatt '{title}' nicht in der vorherigen Datei gefunden")
+
+
+def _shared_strings(archive):
+    try:
+        data = archive.read('xl/sharedStrings.xml')
+    except KeyError:
+        return []
+    root = ElementTree.fromstring(data)
+    return [''.join(t.text or '' for t in si.iter(f'{NS_MAIN}t')) for si in root.iter(f'{NS_MAIN}si')]
+
+
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _unescape(raw):
+    text = raw.decode('utf-8')
+    return html.unescape(text) if '&' in text else text
+
+
+def _cell_value(cell_type, raw, inline, strings):
+    if cell_type == b'inlineStr':
+        return _unescape(b''.join(TEXT_RE.findall(inline)))
+    if raw is None:
+        return None
+    if cell_type == b's':
+        return strings[int(raw)]
+    if cell_type == b'b':
+        return raw == b'1'
+    if cell_type in (b'str', b'e'):
+        return _unescape(raw)
+    return _number(raw)
+
+
+def _parse_row(chunk, strings):
+    """Zellwerte einer Zeile als {spalte: wert}"""
+    cells = CELL_VALUE_RE.findall(chunk)
+    if len(cells) == chunk.count(b'<c '):
+        return {column.decode('ascii'): _cell_value(cell_type, raw or None, inline, strings)
+                for column, cell_type, raw, inline in cells}
+
+    # Andere Attribute oder Reihenfolge: allgemeiner (langsamerer) Weg
+    result = {}
+    for column, attrs, body in CELL_RE.findall(chunk):
+        cell_type = TYPE_RE.search(attrs)
+        value = VALUE_RE.search(body)
+        result[column.decode('ascii')] = _cell_value(
+            cell_type.group(1) if cell_type else b'n', value.group(1) if value else None, body, strings)
+    return result
+
+
+def _row_styles(chunk):
+    """Style-IDs einer Zeile als {spalte: style} (ohne s-Attribut: '0')"""
+    styles = {}
+    for column, attrs, _ in CELL_RE.findall(chunk):
+        style = STYLE_ID_RE.search(attrs)
+        styles[column.decode('ascii')] = style.group(1).decode('ascii') if style else '0'
+    return styles
+
+
+def _same(old, new):
+    """Vergleich wie in der Datei gespeichert: leer gleich None, Zahlen numerisch"""
+    if old in (None, '') or new in (None, ''):
+        return old in (None, '') and new in (None, '')
+    if isinstance(old, bool) or isinstance(new, bool):
+        return old is new
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+        return float(old) == float(new)
+    return old == new
+
+
+class HighlightStyles:
+    """
+    Markierte Varianten der Zell-Styles in styles.xml
+
+    Eine markierte Variante ist das xf des Basis-Styles mit der
+    Markierungsfüllung. Füllung und Varianten aus einem früheren
+    Delta-Export werden wiederverwendet und lassen sich über unmarked()
+    auf ihren Basis-Style zurückführen.
+    """
+
+    def __init__(self, styles_xml):
+        fills = FILLS_RE.search(styles_xml)
+        xfs = CELL_XFS_RE.search(styles_xml)
+        if fills is None or xfs is None:
+            raise ValueError("styles.xml ohne <fills> oder <cellXfs>")
+
+        fill_list = re.findall(rb'<fill>.*?</fill>|<fill/>', fills.group(2), re.DOTALL)
+        if CHANGED_FILL in fill_list:
+            fill_id = fill_list.index(CHANGED_FILL)
+            self.fills_xml = fills.group(0)
+        else:
+            fill_id = len(fill_list)
+            self.fills_xml = f'<fills count="{fill_id + 1}">'.encode('ascii') + fills.group(2) + CHANGED_FILL + b'</fills>'
+
+        self.styles_xml = styles_xml
+        self.fill_attr = f'fillId="{fill_id}"'.encode('ascii')
+        self.xfs = XF_RE.findall(xfs.group(2))
+        self.marked_ids = {str(i) for i, xf in enumerate(self.xfs) if self.fill_attr in xf}
+        self._bases = {self._mark(xf): str(i) for i, xf in enumerate(self.xfs) if str(i) not in self.marked_ids}
+
+    def _mark(self, xf):
+        if FILL_ID_RE.search(xf):
+            marked = FILL_ID_RE.sub(self.fill_attr, xf, count=1)
+        else:
+            marked = xf.replace(b'<xf ', b'<xf ' + self.fill_attr + b' ', 1)
+        if b'applyFill=' not in marked:
+            marked = marked.replace(b'<xf ', b'<xf applyFill="1" ', 1)
+        return marked
+
+    def unmarked(self, style_id):
+        """Basis-Style einer markierten Variante (sonst style_id selbst)"""
+        if style_id in self.marked_ids:
+            return self._bases.get(self.xfs[int(style_id)], '0')
+        return style_id
+
+    def marked(self, style_id):
+        """ID der markierten Variante, wird bei Bedarf angelegt"""
+        variant = self._mark(self.xfs[int(style_id)])
+        if variant not in self.xfs:
+            self.xfs.append(variant)
+            self.marked_ids.add(str(len(self.xfs) - 1))
+        return str(self.xfs.index(variant))
+
+    def to_xml(self):
+        xfs_block = f'<cellXfs count="{len(self.xfs)}">'.encode('ascii') + b''.join(self.xfs) + b'</cellXfs>'
+        styles_xml = FILLS_RE.sub(lambda m: self.fills_xml, self.styles_xml, count=1)
+        return CELL_XFS_RE.sub(lambda m: xfs_block, styles_xml, count=1)
+
+
+def _renumber(chunk, row_number):
+    number = str(row_number).encode('ascii')
+    chunk = ROW_NUMBER_RE.sub(lambda m: m.group(1) + number, chunk, count=1)
+    return CELL_REF_RE.sub(lambda m: m.group(1) + number, chunk)
+
+
+def _umask():
+    """Aktuelle umask des Prozesses (nur lesbar, indem man sie setzt)"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def update_excel(previous_path, data, output_path, highlight=False):
+    """
+    Aktualisiert eine frühere Übersicht auf die Zeilen in data
+
+    data braucht pro Zeile eine eindeutige 'mitarbeiter_id'. previous_path
+    und output_path dürfen gleich sein (Patch an Ort und Stelle). Gibt die
+    Anzahl unveränderter, geänderter, neuer und entfernter Zeilen zurück.
+    """
+    fields = [(get_column_letter(col), key, default) for col, (_, key, default, _) in enumerate(COLUMNS, 1)]
+    id_letter = get_column_letter(ID_COLUMN)
+    fields.append((id_letter, ID_KEY, None))
+
+    # Werte je Mitarbeiter-ID in der Reihenfolge von fields (Spalten, dann ID)
+    rows = {}
+    for row in overview_rows(data):
+        key = row[0]
+        if key in (None, ''):
+            raise ValueError(f"Zeile ohne {ID_KEY}: {row.mitarbeiter}")
+        if key in rows:
+            raise ValueError(f"{ID_KEY} doppelt: {key}")
+        rows[key] = row[1:] + row[:1]
+
+    with zipfile.ZipFile(previous_path) as archive:
+        sheet_path = _sheet_part(archive, SHEET_TITLE)
+        sheet_xml = archive.read(sheet_path)
+        styles_xml = archive.read('xl/styles.xml')
+        strings = _shared_strings(archive)
+
+    sheet_data = SHEET_DATA_RE.search(sheet_xml)
+    chunks = ROW_RE.findall(sheet_data.group(1) or b'')
+    if not chunks or _parse_row(chunks[0], strings).get(id_letter) != ID_HEADER:
+        raise ValueError("Vorherige Datei enthält keine Mitarbeiter-IDs, bitte einmal komplett exportieren")
+    if len(chunks) < 2:
+        raise ValueError("Vorherige Datei enthält keine Datenzeilen, bitte einmal komplett exportieren")
+
+    # Styles der ersten Datenzeile (ohne Markierung) gelten für neu geschriebene Zeilen
+    highlights = HighlightStyles(styles_xml)
+    template = _row_styles(chunks[1])
+    styles = {letter: highlights.unmarked(template.get(letter, '0')) for letter, _, _ in fields}
+
+    def row_xml(row_number, values, changed):
+        parts = [f'<row r="{row_number}">']
+        for (letter, _, _), value in zip(fields, values):
+            style = highlights.marked(styles[letter]) if highlight and letter in changed else styles[letter]
+            parts.append(cell_xml(f"{letter}{row_number}", value, style))
+        parts.append('</row>')
+        return ''.join(parts).encode('utf-8')
+
+    # Markierungen früherer Abgleiche (neue Varianten entstehen erst beim Schreiben)
+    previously_marked = set(highlights.marked_ids)
+    counts = {'unveraendert': 0, 'geaendert': 0, 'neu': 0, 'entfernt': 0}
+    output = [chunks[0]]
+    seen = set()
+    for chunk in chunks[1:]:
+        old = _parse_row(chunk, strings)
+        key = old.get(id_letter)
+        new_values = rows.get(key)
+        if new_values is None or key in seen:
+            counts['entfernt'] += 1
+            continue
+        seen.add(key)
+
+        row_number = len(output) + 1
+        old_values = tuple(old.get(letter) for letter, _, _ in fields)
+        changed = set()
+        if old_values != new_values:
+            changed = {letter for (letter, _, _), a, b in zip(fields, old_values, new_values) if not _same(a, b)}
+        was_marked = previously_marked and any(
+            style.decode('ascii') in previously_marked for style in STYLE_ID_RE.findall(chunk))
+        if changed:
+            counts['geaendert'] += 1
+            output.append(row_xml(row_number, new_values, changed))
+        elif was_marked:
+            counts['unveraendert'] += 1
+            output.append(row_xml(row_number, new_values, set()))
+        else:
+            counts['unveraendert'] += 1
+            number = ROW_NUMBER_RE.search(chunk)
+            output.append(chunk if number and int(number.group(2)) == row_number else _renumber(chunk, row_number))
+
+    for key, new_values in rows.items():
+        if key not in seen:
+            counts['neu'] += 1
+            output.append(row_xml(len(output) + 1, new_values, {letter for letter, _, _ in fields}))
+
+    old_last_row = int(ROW_NUMBER_RE.search(chunks[-1]).group(2))
+    last_row = len(output)
+    patched = sheet_xml[:sheet_data.start()] + b'<sheetData>' + b''.join(output) + b'</sheetData>' + sheet_xml[sheet_data.end():]
+    patched = DIMENSION_RE.sub(lambda m: b'<dimension ref="' + m.group(1) + b':' + m.group(2) + str(last_row).encode('ascii') + b'"/>', patched, count=1)
+    if last_row != old_last_row:
+        # Rahmen-Formatierung des Streaming-Modus (A2:J<letzte Zeile>) mitziehen
+        patched = re.sub(rb'(sqref="[A-Z]+2:[A-Z]+)' + str(old_last_row).encode('ascii') + rb'"',
+                         lambda m: m.group(1) + str(last_row).encode('ascii') + b'"', patched)
+
+    # Neue Datei neben dem Ziel schreiben und atomar ersetzen
+    target = Path(output_path).resolve()
+    fd, tmp_path = tempfile.mkstemp(suffix='.xlsx', dir=target.parent)
+    os.close(fd)
+    # mkstemp legt die Datei mit 0600 an; Rechte wie bei einer normal erstellten Datei
+    os.chmod(tmp_path, 0o666 & ~_umask())
+    try:
+        with span('file_write'), zipfile.ZipFile(previous_path) as source, \
+                zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as out:
+            for item in source.infolist():
+                if item.filename == sheet_path:
+                    content = patched
+                elif item.filename == 'xl/styles.xml' and highlight:
+                    content = highlights.to_xml()
+                else:
+                    content = source.read(item.filename)
+                out.writestr(item, content, compress_type=zipfile.ZIP_DEFLATED)
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    sys.stdout.buffer.write(
+        f"Excel aktualisiert: {output_path} ({counts['geaendert']} geaendert, {counts['neu']} neu, "
+        f"{counts['entfernt']} entfernt, {counts['unveraendert']} unveraendert)\n".encode('utf-8')
+    )
+    return counts
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Abwesenheitsbericht für TeamFlow (Abteilung x Monat)
+Abwesenheitstage pro Abteilung und Monat, getrennt nach Urlaub, Krankheit
+und Schulung, dazu die Quote bezogen auf die Kopfzahl:
+    Tage / (Mitarbeiter der Abteilung x Arbeitstage des Monats)
+Ausgabe als Excel (Farbskala pro Art) oder PDF (eine Seite pro Jahr), das
+Format kommt aus der Dateiendung.
+
+Alle Einträge des Zeitraums werden einmal gelesen und mit numpy in
+Monatsabschnitte zerlegt (np.repeat über die Anzahl berührter Monate).
+Die gespeicherten Tage eines Eintrags werden nach Arbeitstagen (Mo-Fr
+ohne Feiertage, WorkdayCalendar) auf seine Monate verteilt, die Summe
+bleibt also erhalten; Einträge ohne Arbeitstag (z.B. nur Wochenende)
+werden nach Kalendertagen verteilt. Gruppiert wird mit einem einzigen
+np.bincount über (Abteilung, Monat, Art).
+
+Mitarbeiter wie in der Statistik (Status AKTIV); sie zählen in jedem
+Monat zwischen Eintritt und Austritt zur Kopfzahl ihrer Abteilung.
+Schulungen dauern wie im Jahresplaner floor(dauer_tage) Kalendertage,
+mindestens aber einen Tag.
+
+Usage: python export_absence_report.py <datenbank> <von_jahr> <output.xlsx|.pdf> [--bis-jahr JAHR] [--abteilung NAME]
+"""
+
+import sys
+import sqlite3
+import argparse
+from pathlib import Path
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+
+from export_from_db import open_database
+from workday_calendar import WorkdayCalendar
+from export_styles import VACATION_COLOR, SICKNESS_COLOR, TRAINING_COLOR
+
+
+# Arten in der dritten Achse von tage/quote: (Bezeichnung, Farbe)
+ARTEN = [("Urlaub", VACATION_COLOR), ("Krankheit", SICKNESS_COLOR), ("Schulung", TRAINING_COLOR)]
+URLAUB, KRANKHEIT, SCHULUNG = range(len(ARTEN))
+
+MONATE_KURZ = ['Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez']
+
+NO_DEPARTMENT = "Keine Abteilung"
+TOTAL_LABEL = "Gesamt"
+
+# Austritt offen: weit genug in der Zukunft für jeden Berichtszeitraum
+OFFENES_ENDE = np.datetime64('9999-12-31', 'D')
+
+_QUERIES = [
+    (URLAUB, """
+        SELECT COALESCE(a.name, ''), e.von_datum, e.bis_datum, COALESCE(e.tage, 0)
+        FROM urlaub e
+        JOIN mitarbeiter m ON e.mitarbeiter_id = m.id
+        LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV' AND e.von_datum <= ? AND e.bis_datum >= ?
+    """),
+    (KRANKHEIT, """
+        SELECT COALESCE(a.name, ''), e.von_datum, e.bis_datum, COALESCE(e.tage, 0)
+        FROM krankheit e
+        JOIN mitarbeiter m ON e.mitarbeiter_id = m.id
+        LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV' AND e.von_datum <= ? AND e.bis_datum >= ?
+    """),
+    (SCHULUNG, """
+        SELECT abteilung, datum, bis_datum, wert FROM (
+            SELECT COALESCE(a.name, '') AS abteilung, e.datum, COALESCE(e.dauer_tage, 0) AS wert,
+                   date(e.datum, '+' || (MAX(CAST(e.dauer_tage AS INTEGER), 1) - 1) || ' days') AS bis_datum
+            FROM schulung e
+            JOIN mitarbeiter m ON e.mitarbeiter_id = m.id
+            LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+            WHERE m.status = 'AKTIV'
+        ) WHERE datum <= ? AND bis_datum >= ?
+    """),
+]
+
+
+def split_by_month(von, bis, erster_monat, anzahl_monate):
+    """
+    Zerlegt Zeiträume [von, bis] (datetime64[D], inklusive) in Monatsabschnitte
+
+    Abschnitte außerhalb der anzahl_monate Monate ab erster_monat
+    (datetime64[M]) entfallen. Gibt Arrays (eintrag, monat, abschnitt_von,
+    abschnitt_bis) zurück; monat ist der Index relativ zu erster_monat.
+    """
+    bereich_von = erster_monat.astype('datetime64[D]')
+    bereich_bis = (erster_monat + anzahl_monate).astype('datetime64[D]') - 1
+    von_c = np.maximum(von, bereich_von)
+    bis_c = np.minimum(bis, bereich_bis)
+    eintraege = np.flatnonzero(von_c <= bis_c)
+
+    erster = (von_c[eintraege].astype('datetime64[M]') - erster_monat).astype(np.int64)
+    letzter = (bis_c[eintraege].astype('datetime64[M]') - erster_monat).astype(np.int64)
+    anzahl = letzter - erster + 1
+
+    # Abschnitt k eines Eintrags liegt im Monat erster + k
+    eintrag = np.repeat(eintraege, anzahl)
+    beginn = np.repeat(np.cumsum(anzahl) - anzahl, anzahl)
+    monat = np.repeat(erster, anzahl) + np.arange(len(eintrag)) - beginn
+
+    monatsanfang = (erster_monat + monat).astype('datetime64[D]')
+    monatsende = (erster_monat + monat + 1).astype('datetime64[D]') - 1
+    return eintrag, monat, np.maximum(von_c[eintrag], monatsanfang), np.minimum(bis_c[eintrag], monatsende)
+
+
+def distribute_days(von, bis, tage, eintrag, abschnitt_von, abschnitt_bis, calendar):
+    """
+    Tage jedes Eintrags anteilig auf seine Abschnitte
+
+    Anteil = Arbeitstage des Abschnitts / Arbeitstage des ganzen Eintrags,
+    ohne Arbeitstag im Eintrag nach Kalendertagen.
+    """
+    arbeitstage = calendar.count_many(von, bis)
+    abschnitt_arbeitstage = calendar.count_many(abschnitt_von, abschnitt_bis)
+    kalendertage = (bis - von).astype(np.int64) + 1
+    abschnitt_kalendertage = (abschnitt_bis - abschnitt_von).astype(np.int64) + 1
+
+    gesamt = arbeitstage[eintrag]
+    anteil = np.where(
+        gesamt > 0,
+        abschnitt_arbeitstage / np.where(gesamt > 0, gesamt, 1),
+        abschnitt_kalendertage / kalendertage[eintrag],
+    )
+    return tage[eintrag] * anteil
+
+
+def _year(datum):
+    return int(datum.astype('datetime64[Y]').astype(np.int64)) + 1970
+
+
+def _quote(tage, soll):
+    """tage / soll elementweise, 0 bei soll 0"""
+    return np.divide(tage, soll, out=np.zeros(np.broadcast(tage, soll).shape), where=soll > 0)
+
+
+def compute_absence_report(conn, von_jahr, bis_jahr=None, abteilung=None):
+    """
+    Abwesenheiten pro Abteilung und Monat für von_jahr..bis_jahr
+
+    Rückgabe (SimpleNamespace):
+        monate:      Liste (jahr, monat) der Spalten
+        abteilungen: Namen der Zeilen (alphabetisch, ohne Abteilung zuletzt)
+        tage:        Tage (Abteilung x Monat x Art), Arten wie ARTEN
+        kopfzahl:    beschäftigte Mitarbeiter (Abteilung x Monat)
+        arbeitstage: Arbeitstage pro Monat (Mo-Fr ohne Feiertage)
+        quote:       tage / (kopfzahl x arbeitstage), Anteil 0..1
+    """
+    bis_jahr = bis_jahr or von_jahr
+    erster_monat = np.datetime64(f"{von_jahr:04d}-01", 'M')
+    anzahl_monate = (bis_jahr - von_jahr + 1) * 12
+    bereich = (f"{bis_jahr:04d}-12-31", f"{von_jahr:04d}-01-01")
+    nur_abteilung = abteilung if abteilung and abteilung != 'Alle' else None
+
+    mitarbeiter = conn.execute("""
+        SELECT COALESCE(a.name, ''), m.eintrittsdatum, m.austrittsdatum
+        FROM mitarbeiter m
+        LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV'
+    """).fetchall()
+    if nur_abteilung is not None:
+        mitarbeiter = [ma for ma in mitarbeiter if ma[0] == nur_abteilung]
+
+    namen = sorted({ma[0] for ma in mitarbeiter}, key=lambda name: (name == '', name.casefold()))
+    index = {name: i for i, name in enumerate(namen)}
+
+    # Kopfzahl: beschäftigt, wenn Eintritt <= Monatsende und Austritt >= Monatsanfang
+    monatsanfang = (erster_monat + np.arange(anzahl_monate)).astype('datetime64[D]')
+    monatsende = (erster_monat + np.arange(1, anzahl_monate + 1)).astype('datetime64[D]') - 1
+    kopfzahl = np.zeros((len(namen), anzahl_monate), dtype=np.int64)
+    if mitarbeiter:
+        abteilung_ma = np.array([index[ma[0]] for ma in mitarbeiter], dtype=np.int64)
+        eintritt = np.array([ma[1] for ma in mitarbeiter], dtype='datetime64[D]')
+        austritt = np.array([ma[2] or OFFENES_ENDE for ma in mitarbeiter], dtype='datetime64[D]')
+        beschaeftigt = (eintritt[:, None] <= monatsende[None, :]) & (austritt[:, None] >= monatsanfang[None, :])
+        zeile, spalte = np.nonzero(beschaeftigt)
+        kopfzahl = np.bincount(abteilung_ma[zeile] * anzahl_monate + spalte,
+                               minlength=len(namen) * anzahl_monate).reshape(len(namen), anzahl_monate)
+
+    # Alle Einträge einer Art nach der anderen lesen, danach gemeinsam verarbeiten
+    eintraege = []
+    for art, sql in _QUERIES:
+        eintraege.extend((art, *row) for row in conn.execute(sql, bereich)
+                         if row[0] in index and (nur_abteilung is None or row[0] == nur_abteilung))
+
+    tage = np.zeros((len(namen), anzahl_monate, len(ARTEN)))
+    if eintraege:
+        art, abteilung_name, von, bis, wert = zip(*eintraege)
+        von = np.array(von, dtype='datetime64[D]')
+        bis = np.array(bis, dtype='datetime64[D]')
+        art = np.array(art, dtype=np.int64)
+        abteilung_e = np.array([index[name] for name in abteilung_name], dtype=np.int64)
+        wert = np.array(wert, dtype=np.float64)
+
+        gueltig = von <= bis
+        von, bis, art, abteilung_e, wert = von[gueltig], bis[gueltig], art[gueltig], abteilung_e[gueltig], wert[gueltig]
+
+        eintrag, monat, abschnitt_von, abschnitt_bis = split_by_month(von, bis, erster_monat, anzahl_monate)
+        calendar = WorkdayCalendar.from_database(conn, min(_year(von.min()), von_jahr), max(_year(bis.max()), bis_jahr))
+        anteil = distribute_days(von, bis, wert, eintrag, abschnitt_von, abschnitt_bis, calendar)
+
+        schluessel = (abteilung_e[eintrag] * anzahl_monate + monat) * len(ARTEN) + art[eintrag]
+        tage = np.bincount(schluessel, weights=anteil, minlength=tage.size).reshape(tage.shape)
+    else:
+        calendar = WorkdayCalendar.from_database(conn, von_jahr, bis_jahr)
+
+    arbeitstage = calendar.count_many(monatsanfang, monatsende)
+    soll = kopfzahl * arbeitstage[None, :]
+
+    return SimpleNamespace(
+        von_jahr=von_jahr,
+        bis_jahr=bis_jahr,
+        abteilung=nur_abteilung,
+        monate=[(von_jahr + m // 12, m % 12 + 1) for m in range(anzahl_monate)],
+        abteilungen=namen,
+        tage=tage,
+        kopfzahl=kopfzahl,
+        arbeitstage=arbeitstage,
+        quote=_quote(tage, soll[:, :, None]),
+    )
+
+
+def _labels(bericht):
+    return [name or NO_DEPARTMENT for name in bericht.abteilungen]
+
+
+def _aggregate(bericht, spalten, axis):
+    """
+    Tage und Quote je Art, summiert über axis (0: Abteilungen, 1: Monate)
+
+    Nur die Monate in spalten; die Quote ist nach Soll-Arbeitstagen gewichtet.
+    """
+    tage = bericht.tage[:, spalten].sum(axis=axis)
+    soll = np.asarray((bericht.kopfzahl[:, spalten] * bericht.arbeitstage[spalten]).sum(axis=axis))
+    return tage, _quote(tage, soll[..., None])
+
+
+def create_absence_report_excel(bericht, output_path):
+    """
+    Schreibt den Bericht als Excel-Datei
+
+    Blatt "Quote": pro Art ein Block Abteilung x Monat mit Farbskala
+    (weiß bis Farbe der Art, Maximum des Blocks). Blatt "Tage": die Tage
+    pro Art sowie Kopfzahl und Arbeitstage. Gibt die Anzahl der
+    Abteilungen zurück.
+    """
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+    from openpyxl.formatting.rule import ColorScaleRule
+    from openpyxl.utils import get_column_letter
+    from export_styles import register_excel_styles, EXCEL_HEADER_STYLE, EXCEL_DATA_STYLE
+
+    labels = _labels(bericht)
+    kopf = ["Abteilung"] + [f"{MONATE_KURZ[monat - 1]} {jahr}" for jahr, monat in bericht.monate]
+    letzte_spalte = get_column_letter(len(kopf))
+    gesamt_tage, gesamt_quote = _aggregate(bericht, slice(None), 0)
+
+    wb = Workbook()
+    register_excel_styles(wb)
+    quote_ws = wb.active
+    quote_ws.title = "Quote"
+    tage_ws = wb.create_sheet("Tage")
+
+    def block(ws, row, titel, zeilen, number_format):
+        """Titel, Kopfzeile und Datenzeilen (label, werte); gibt (erste, letzte Datenzeile) zurück"""
+        ws.cell(row=row, column=1, value=titel).font = Font(bold=True, size=12)
+        for col, header in enumerate(kopf, 1):
+            ws.cell(row=row + 1, column=col, value=header).style = EXCEL_HEADER_STYLE
+        erste = row + 2
+        for row_idx, (label, werte) in enumerate(zeilen, erste):
+            ws.cell(row=row_idx, column=1, value=label).style = EXCEL_DATA_STYLE
+            for col, value in enumerate(werte, 2):
+                cell = ws.cell(row=row_idx, column=col, value=value)
+                cell.style = EXCEL_DATA_STYLE
+                cell.number_format = number_format
+        return erste, erste + len(zeilen) - 1
+
+    row = 1
+    for art, (name, color) in enumerate(ARTEN):
+        zeilen = [(label, bericht.quote[i, :, art].tolist()) for i, label in enumerate(labels)]
+        zeilen.append((TOTAL_LABEL, gesamt_quote[:, art].tolist()))
+        erste, letzte = block(quote_ws, row, f"{name}: Anteil an den Soll-Arbeitstagen", zeilen, '0.0%')
+        # Farbskala nur über die Abteilungen, die Gesamtzeile bleibt neutral
+        if letzte > erste:
+            quote_ws.conditional_formatting.add(
+                f"B{erste}:{letzte_spalte}{letzte - 1}",
+                ColorScaleRule(start_type='num', start_value=0, start_color='FFFFFF', end_type='max', end_color=color))
+        for cell in quote_ws[letzte]:
+            cell.font = Font(bold=True)
+        row = letzte + 2
+
+    row = 1
+    for art, (name, _) in enumerate(ARTEN):
+        zeilen = [(label, bericht.tage[i, :, art].tolist()) for i, label in enumerate(labels)]
+        zeilen.append((TOTAL_LABEL, gesamt_tage[:, art].tolist()))
+        _, letzte = block(tage_ws, row, f"{name} (Tage)", zeilen, '0.0')
+        row = letzte + 2
+    zeilen = [(label, bericht.kopfzahl[i].tolist()) for i, label in enumerate(labels)]
+    zeilen.append((TOTAL_LABEL, bericht.kopfzahl.sum(axis=0).tolist()))
+    zeilen.append(("Arbeitstage", bericht.arbeitstage.tolist()))
+    block(tage_ws, row, "Mitarbeiter und Arbeitstage", zeilen, '0')
+
+    for ws in (quote_ws, tage_ws):
+        ws.column_dimensions['A'].width = 25
+        for col in range(2, len(kopf) + 1):
+            ws.column_dimensions[get_column_letter(col)].width = 10
+        ws.freeze_panes = 'B1'
+
+    wb.save(output_path)
+    sys.stdout.buffer.write(f"Abwesenheitsbericht erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return len(labels)
+
+
+def _heat_color(wert, maximum, color):
+    """Farbe zwischen Weiß (0) und color (maximum), linear"""
+    from reportlab.lib import colors
+
+    ziel = colors.HexColor(f"#{color}")
+    anteil = min(wert / maximum, 1.0) if maximum > 0 else 0.0
+    return colors.Color(1 + (ziel.red - 1) * anteil, 1 + (ziel.green - 1) * anteil, 1 + (ziel.blue - 1) * anteil)
+
+
+def _percent(wert):
+    return f"{wert * 100:.1f}"
+
+
+def create_absence_report_pdf(bericht, output_path):
+    """
+    Schreibt den Bericht als PDF (A4 quer, eine Seite pro Jahr)
+
+    Pro Art eine Tabelle Abteilung x Monat mit der Quote in Prozent und
+    der Jahresquote; die Zellen sind wie in Excel von Weiß bis zur Farbe
+    der Art eingefärbt, das Maximum gilt für den ganzen Bericht.
+    """
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import cm
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer, PageBreak
+    from export_styles import pdf_styles
+
+    styles = pdf_styles()
+    labels = _labels(bericht)
+    maxima = bericht.quote.max(axis=(0, 1)) if bericht.quote.size else np.zeros(len(ARTEN))
+    titel = "Abwesenheitsbericht" + (f": {bericht.abteilung}" if bericht.abteilung else "")
+
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=landscape(A4),
+        topMargin=1*cm,
+        bottomMargin=1*cm,
+        leftMargin=1*cm,
+        rightMargin=1*cm,
+        pageCompression=1,
+    )
+    col_widths = [4.5*cm] + [1.55*cm] * 12 + [1.7*cm]
+
+    elements = []
+    for jahr in range(bericht.von_jahr, bericht.bis_jahr + 1):
+        if elements:
+            elements.append(PageBreak())
+        elements.append(Paragraph(f"{titel} {jahr}", styles.overview_title))
+        spalten = slice((jahr - bericht.von_jahr) * 12, (jahr - bericht.von_jahr + 1) * 12)
+        _, jahresquote = _aggregate(bericht, spalten, 1)
+        _, gesamt_monat = _aggregate(bericht, spalten, 0)
+        _, gesamt_jahr = _aggregate(bericht, spalten, (0, 1))
+
+        for art, (name, color) in enumerate(ARTEN):
+            table_data = [[f"{name} (%)"] + MONATE_KURZ + ["Jahr"]]
+            commands = []
+            for i, label in enumerate(labels):
+                werte = bericht.quote[i, spalten, art]
+                table_data.append([label] + [_percent(wert) for wert in werte] + [_percent(jahresquote[i, art])])
+                commands.extend(
+                    ('BACKGROUND', (col, i + 1), (col, i + 1), _heat_color(wert, maxima[art], color))
+                    for col, wert in enumerate(werte.tolist(), 1) if wert > 0
+                )
+            table_data.append([TOTAL_LABEL] + [_percent(wert) for wert in gesamt_monat[:, art]]
+                              + [_percent(gesamt_jahr[art])])
+
+            table = Table(table_data, colWidths=col_widths, repeatRows=1)
+            table.setStyle(styles.heatmap_table)
+            table.setStyle(commands)
+            elements.append(table)
+            elements.append(Spacer(1, 0.3*cm))
+
+    elements.append(Paragraph(
+        "Quote = Abwesenheitstage / (Mitarbeiter x Arbeitstage Mo-Fr ohne Feiertage); "
+        f"erstellt am {datetime.now().strftime('%d.%m.%Y um %H:%M Uhr')}", styles.footer))
+
+    doc.build(elements)
+    sys.stdout.buffer.write(f"Abwesenheitsbericht erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return len(labels)
+
+
+def create_absence_report(bericht, output_path):
+    """Bericht im Format der Dateiendung (.xlsx oder .pdf)"""
+    suffix = Path(output_path).suffix.lower()
+    if suffix == '.pdf':
+        return create_absence_report_pdf(bericht, output_path)
+    if suffix == '.xlsx':
+        return create_absence_report_excel(bericht, output_path)
+    raise ValueError(f"Unbekanntes Format: {output_path} (erlaubt: .xlsx, .pdf)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TeamFlow-Abwesenheitsbericht (Abteilung x Monat) aus der Datenbank")
+    parser.add_argument('database', help="Pfad zur TeamFlow-Datenbank")
+    parser.add_argument('von_jahr', type=int, help="Erstes Jahr des Berichts")
+    parser.add_argument('output', help="Ausgabedatei (.xlsx oder .pdf)")
+    parser.add_argument('--bis-jahr', type=int, help="Letztes Jahr (Standard: von_jahr)")
+    parser.add_argument('--abteilung', help="Nur diese Abteilung")
+    args = parser.parse_args()
+
+    if args.bis_jahr is not None and args.bis_jahr < args.von_jahr:
+        sys.stderr.buffer.write("FEHLER: --bis-jahr liegt vor von_jahr\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        conn = open_database(args.database)
+    except sqlite3.Error as e:
+        sys.stderr.buffer.write(f"FEHLER beim Öffnen der Datenbank: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        bericht = compute_absence_report(conn, args.von_jahr, args.bis_jahr, args.abteilung)
+        create_absence_report(bericht, args.output)
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Erstellen des Abwesenheitsberichts: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
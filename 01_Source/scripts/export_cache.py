@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ergebnis-Cache für TeamFlow-Exporte
+
+Der Schlüssel ist ein SHA-256 über Export-Typ, Template-Version, Optionen
+und die kanonisierten Eingabezeilen (JSON mit sortierten Schlüsseln). Gibt
+es für den Schlüssel schon eine Ausgabe, wird sie per Hardlink (oder Kopie)
+an den Zielpfad gelegt, statt das Dokument neu zu erzeugen.
+
+Der Cache speichert Kopien, nie Links auf eine ausgelieferte Datei, und
+vor einem neuen Export wird der Zielpfad entfernt statt überschrieben.
+So kann ein Export nie den Inhalt einer Datei ändern, die noch als
+Hardlink an einem Cache-Eintrag hängt. Ein Treffer wird zusätzlich über
+den SHA-256 des Inhalts geprüft (z.B. falls die ausgelieferte Datei
+direkt bearbeitet wurde).
+
+Der Cache liegt im Benutzer-Cache von TeamFlow (Windows:
+%LOCALAPPDATA%\TeamFlow\exports, sonst ~/.cache/teamflow/exports), nicht
+im Export-Ordner, und wird über manifest.json verwaltet (überlebt
+Neustarts). Verdrängt wird nach LRU, begrenzt durch Gesamtgröße und
+Anzahl Einträge. Liegt er auf einem anderen Laufwerk als die Ausgabe,
+werden Treffer kopiert statt verlinkt.
+
+Mehrere Prozesse (z.B. die Worker des Export-Servers) teilen sich den
+Cache. Jede Änderung am Manifest läuft unter der Sperrdatei manifest.lock:
+das Manifest wird neu gelesen, die eigene Änderung eingearbeitet und über
+eine eigene temporäre Datei ersetzt, so geht kein Eintrag eines anderen
+Prozesses verloren. Fehler des Caches brechen keinen Export ab, sie
+werden als WARNUNG gemeldet.
+
+Gecacht werden nur Exporte aus einer Liste von Zeilen. Bei gestreamter
+Eingabe (Generator, z.B. NDJSON von stdin) und im Streaming-Modus von
+Excel wird direkt exportiert: der Schlüssel bräuchte alle Zeilen vorab,
+die Zeilen sollen aber schon beim Lesen geschrieben werden.
+
+Anderer Ordner mit TEAMFLOW_EXPORT_CACHE=<pfad>, abschalten mit
+TEAMFLOW_EXPORT_CACHE=0.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import contextlib
+from pathlib import Path
+
+from export_profile import span
+
+
+CACHE_DIR_NAME = 'exports'
+MANIFEST_NAME = 'manifest.json'
+LOCK_NAME = 'manifest.lock'
+CACHE_ENV = 'TEAMFLOW_EXPORT_CACHE'
+
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+MAX_CACHE_ENTRIES = 100
+
+# Sperre des Manifests: Wartezeit, danach gilt eine Sperrdatei als verwaist
+LOCK_TIMEOUT = 10
+LOCK_STALE = 60
+
+
+def cache_enabled():
+    return os.environ.get(CACHE_ENV, '1') != '0'
+
+
+def app_cache_dir():
+    """Benutzer-Cache von TeamFlow (auch für die Schrift-Metriken, siehe export_fonts)"""
+    if os.name == 'nt':
+        return Path(os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local') / 'TeamFlow'
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'teamflow'
+
+
+def export_cache_dir():
+    """Ordner des Ergebnis-Caches (TEAMFLOW_EXPORT_CACHE=<pfad> oder im Benutzer-Cache)"""
+    configured = os.environ.get(CACHE_ENV, '')
+    if configured not in ('', '0', '1'):
+        return Path(configured)
+    return app_cache_dir() / CACHE_DIR_NAME
+
+
+def canonical_json(value):
+    """Kanonische JSON-Darstellung (sortierte Schlüssel, ohne Leerzeichen)"""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def rows_digest(rows, header):
+    """SHA-256 über den Kopf (Typ, Version, Optionen) und die kanonisierten Zeilen"""
+    digest = hashlib.sha256(canonical_json(header).encode('utf-8'))
+    for row in rows:
+        # Typisierte Zeilen (namedtuple) als Objekt, nicht als Liste
+        if isinstance(row, tuple):
+            row = row._asdict()
+        digest.update(canonical_json(row).encode('utf-8') + b'\n')
+    return digest.hexdigest()
+
+
+def file_digest(path):
+    """SHA-256 des Dateiinhalts"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _remove(path):
+    """Entfernt path, falls vorhanden (nur den Verzeichniseintrag, nie den Inhalt eines Hardlinks)"""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def _link_or_copy(source, target):
+    """Hardlink, bei Fehlern (anderes Laufwerk, FAT, ...) Kopie"""
+    _remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def _warn(message):
+    sys.stderr.buffer.write(f"WARNUNG: {message}\n".encode('utf-8'))
+    sys.stderr.flush()
+
+
+class ExportCache:
+    """Größenbegrenzter LRU-Cache fertiger Export-Dateien"""
+
+    def __init__(self, cache_dir, max_bytes=MAX_CACHE_BYTES, max_entries=MAX_CACHE_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.manifest_path = self.cache_dir / MANIFEST_NAME
+        self.lock_path = self.cache_dir / LOCK_NAME
+        self.manifest = self._load_manifest()
+
+    @classmethod
+    def default(cls):
+        """Cache im Benutzer-Cache (siehe export_cache_dir)"""
+        return cls(export_cache_dir())
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault('entries', {})
+        manifest.setdefault('hits', 0)
+        manifest.setdefault('misses', 0)
+        return manifest
+
+    def _save_manifest(self, manifest):
+        """Atomar über eine eigene temporäre Datei schreiben (nur unter der Sperre aufrufen)"""
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_dir, prefix='manifest.',
+                                         suffix='.tmp', delete=False) as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        try:
+            os.replace(f.name, self.manifest_path)
+        finally:
+            _remove(f.name)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Sperrdatei für das Manifest; eine verwaiste Sperre (abgebrochener Prozess) wird entfernt"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except (FileExistsError, PermissionError):
+                with contextlib.suppress(OSError):
+                    if time.time() - self.lock_path.stat().st_mtime > LOCK_STALE:
+                        _remove(self.lock_path)
+                        continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Cache-Manifest gesperrt: {self.lock_path}")
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            _remove(self.lock_path)
+
+    def _update(self, change):
+        """
+        Ändert das Manifest: unter der Sperre neu laden, change(manifest)
+        anwenden, verdrängen und schreiben
+
+        Änderungen anderer Prozesse seit dem Laden bleiben so erhalten.
+        """
+        with self._locked():
+            manifest = self._load_manifest()
+            change(manifest)
+            self._evict(manifest)
+            self._save_manifest(manifest)
+        self.manifest = manifest
+
+    def _entry_path(self, key, entry):
+        return self.cache_dir / f"{key}{entry['suffix']}"
+
+    def lookup(self, key, output_path):
+        """
+        Legt eine vorhandene Ausgabe an output_path ab
+
+        Gibt den Manifest-Eintrag bei einem Treffer zurück, sonst None.
+        Einträge, deren Datei fehlt oder deren Inhalt nicht mehr zum
+        gespeicherten SHA-256 passt, werden verworfen.
+        """
+        entry = self.manifest['entries'].get(key)
+        if entry is not None:
+            cached = self._entry_path(key, entry)
+            try:
+                valid = cached.stat().st_size == entry['size'] and file_digest(cached) == entry.get('sha256')
+            except OSError:
+                valid = False
+
+            if valid:
+                _link_or_copy(cached, output_path)
+                self._update(lambda manifest: self._count_hit(manifest, key))
+                return entry
+
+        self._update(lambda manifest: self._count_miss(manifest, key, entry))
+        return None
+
+    @staticmethod
+    def _count_hit(manifest, key):
+        manifest['hits'] += 1
+        if key in manifest['entries']:
+            manifest['entries'][key]['last_used'] = time.time()
+
+    def _count_miss(self, manifest, key, invalid):
+        """Fehlschlag zählen; ein ungültiger Eintrag wird verworfen, falls ihn kein anderer Prozess ersetzt hat"""
+        manifest['misses'] += 1
+        current = manifest['entries'].get(key)
+        if invalid is not None and current is not None and current.get('sha256') == invalid.get('sha256'):
+            del manifest['entries'][key]
+            with contextlib.suppress(OSError):
+                self._entry_path(key, current).unlink()
+
+    def store(self, key, output_path, rows):
+        """Nimmt eine Kopie einer frisch erzeugten Ausgabe in den Cache auf"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            'suffix': Path(output_path).suffix,
+            'size': Path(output_path).stat().st_size,
+            'sha256': file_digest(output_path),
+            'rows': rows,
+            'last_used': time.time(),
+        }
+        # Erst außerhalb der Sperre kopieren, dann per os.replace einsetzen:
+        # ein vorhandener Eintrag (evtl. Hardlink einer Ausgabe) wird ersetzt, nie überschrieben
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+        try:
+            shutil.copyfile(output_path, tmp_path)
+
+            def add(manifest):
+                os.replace(tmp_path, self._entry_path(key, entry))
+                manifest['entries'][key] = entry
+
+            self._update(add)
+        finally:
+            _remove(tmp_path)
+
+    def _evict(self, manifest):
+        """Älteste Einträge entfernen, bis Größe und Anzahl im Rahmen sind"""
+        entries = manifest['entries']
+        total = sum(entry['size'] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]['last_used']):
+            if total <= self.max_bytes and len(entries) <= self.max_entries:
+                break
+            entry = entries.pop(key)
+            total -= entry['size']
+            try:
+                self._entry_path(key, entry).unlink()
+            except OSError:
+                pass
+
+    def report(self, key, hit):
+        status = "Treffer" if hit else "Fehlschlag"
+        sys.stdout.buffer.write(
+            f"Cache {status}: {key[:12]} (Treffer: {self.manifest['hits']}, "
+            f"Fehlschlaege: {self.manifest['misses']})\n".encode('utf-8')
+        )
+        sys.stdout.flush()
+
+
+def cached_export(export_type, template_version, create_func, rows, output_path, **options):
+    """
+    Führt create_func(rows, output_path, **options) nur bei einem Cache-Fehlschlag aus
+
+    Gibt (anzahl_zeilen, treffer) zurück. Ohne Dateipfad als Ziel (z.B.
+    BytesIO), bei abgeschaltetem Cache, bei einem Generator als rows und
+    mit streaming=True wird direkt exportiert (siehe Modul-Docstring).
+    """
+    streamed = iter(rows) is rows or options.get('streaming')
+    if not cache_enabled() or streamed or not isinstance(output_path, (str, os.PathLike)):
+        return create_func(rows, output_path, **options), False
+
+    header = {'type': export_type, 'template': template_version, 'options': options}
+    with span('cache'):
+        key = rows_digest(rows, header)
+        cache = ExportCache.default()
+        try:
+            entry = cache.lookup(key, output_path)
+        except Exception as e:
+            _warn(f"Cache nicht lesbar, exportiere ohne Cache: {e}")
+            entry = None
+    if entry is not None:
+        cache.report(key, hit=True)
+        return entry['rows'], True
+
+    # output_path kann ein Hardlink auf einen älteren Cache-Eintrag sein:
+    # entfernen, damit der Export eine neue Datei anlegt statt sie zu überschreiben
+    _remove(output_path)
+    count = create_func(rows, output_path, **options)
+    with span('cache'):
+        try:
+            cache.store(key, output_path, count)
+        except Exception as e:
+            # Die Ausgabe ist fertig, nur die Kopie im Cache fehlt
+            _warn(f"Export nicht im Cache abgelegt: {e}")
+    cache.report(key, hit=False)
+    return count, False
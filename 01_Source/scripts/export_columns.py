@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Spalten der Urlaubsübersicht
+
+Gemeinsame Definition für Excel-, Delta- und Rohdaten-Export. Das Modul
+hat keine Abhängigkeiten, sodass z.B. der CSV-Export kein openpyxl lädt.
+"""
+
+
+# Spalten der Übersicht: (Überschrift, Schlüssel, Standardwert, Breite)
+COLUMNS = [
+    ("Mitarbeiter", 'mitarbeiter', '', 25),
+    ("Abteilung", 'abteilung', '', 20),
+    ("Anspruch", 'urlaub_anspruch', 0, 10),
+    ("Übertrag", 'urlaub_uebertrag', 0, 10),
+    ("Verfügbar", 'urlaub_verfuegbar', 0, 10),
+    ("Genommen", 'urlaub_genommen', 0, 10),
+    ("Rest", 'urlaub_rest', 0, 10),
+    ("Krank", 'krankheit', 0, 10),
+    ("Schulung", 'schulung', 0, 10),
+    ("Überstunden", 'ueberstunden', 0, 12),
+]
+
+# Die ersten beiden Spalten sind Texte, alle weiteren Zahlen (Tage bzw. Stunden)
+TEXT_COLUMNS = 2
+
+# Mitarbeiter-ID, in der Excel-Datei als ausgeblendete Spalte hinter den Daten
+ID_HEADER = "ID"
+ID_KEY = 'mitarbeiter_id'
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Datumsumwandlung für die TeamFlow Export-Scripts
+
+Die Datenbank speichert Daten als ISO-Text (JJJJ-MM-TT), die Exporte
+zeigen sie deutsch an (TT.MM.JJJJ). Statt strptime/strftime pro Feld wird
+der String direkt zerlegt und einmal mit date() auf ein gültiges
+Kalenderdatum geprüft. Das Ergebnis wird pro Wert zwischengespeichert;
+da sich Daten innerhalb eines Exports stark wiederholen, kostet jeder
+weitere Aufruf nur noch einen Dictionary-Zugriff.
+
+Ungültige Werte werden unverändert ausgegeben und einmal pro Wert als
+WARNUNG auf stderr gemeldet, statt sie stillschweigend zu übernehmen.
+"""
+
+import sys
+from datetime import date
+from functools import lru_cache
+
+
+# Verschiedene Daten, die zwischengespeichert werden (gut 25 Jahre)
+CACHE_SIZE = 10000
+
+
+class InvalidDate(ValueError):
+    """Wert ist kein gültiges ISO-Datum (JJJJ-MM-TT)"""
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _convert(value):
+    """(date, 'TT.MM.JJJJ') für einen ISO-String, None wenn ungültig"""
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return None
+    jahr, monat, tag = value[:4], value[5:7], value[8:]
+    if not (jahr.isdigit() and monat.isdigit() and tag.isdigit()):
+        return None
+    try:
+        parsed = date(int(jahr), int(monat), int(tag))
+    except ValueError:
+        return None
+    return parsed, f"{tag}.{monat}.{jahr}"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _warn_invalid(value):
+    sys.stderr.buffer.write(f"WARNUNG: Ungültiges Datum '{value}' (erwartet JJJJ-MM-TT)\n".encode('utf-8'))
+
+
+def parse_iso_date(value):
+    """ISO-String als date, InvalidDate bei fehlerhaften Werten"""
+    converted = _convert(value) if isinstance(value, str) else None
+    if converted is None:
+        raise InvalidDate(f"Ungültiges Datum: {value!r} (erwartet JJJJ-MM-TT)")
+    return converted[0]
+
+
+def format_date(value):
+    """
+    ISO-String als TT.MM.JJJJ
+
+    Leere Werte ergeben '', ungültige werden unverändert zurückgegeben
+    und gemeldet.
+    """
+    if not value:
+        return ''
+    if not isinstance(value, str):
+        value = str(value)
+    converted = _convert(value)
+    if converted is None:
+        _warn_invalid(value)
+        return value
+    return converted[1]
+
+
+def date_sort_key(value):
+    """
+    Sortierschlüssel für ISO-Daten
+
+    Gültige Daten sortieren chronologisch (der ISO-String selbst), leere
+    und ungültige davor, bei reverse=True also ans Ende.
+    """
+    if isinstance(value, str) and _convert(value) is not None:
+        return value
+    return ''
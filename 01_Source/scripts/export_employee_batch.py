@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch-Export für Mitarbeiter-Detail-PDFs
+Erstellt die Detailansicht für viele Mitarbeiter in einem Lauf.
+
+Modi:
+    kombiniert (Standard): eine PDF, Seitenumbruch und Lesezeichen pro Mitarbeiter
+    --separate:            eine PDF pro Mitarbeiter im Ausgabeordner,
+                           parallel in einem Prozess-Pool (ein Worker pro CPU)
+
+Eingabe ist eine JSON-Liste oder NDJSON über stdin ("-"), jeweils mit
+Einträgen der Form {"employee": {...}, "vacation": [...], "absence": [...]}.
+
+Fortschritt wird über export_progress gemeldet, als eigener Prozess als
+JSON-Zeile auf stdout:
+    {"event": "progress", "done": 3, "total": 120, "employee": "Max Muster"}
+"""
+
+import io
+import os
+import re
+import sys
+import contextlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from reportlab.platypus import PageBreak, Flowable
+
+from export_input import read_rows
+from export_employee_detail import create_detail_doc, build_employee_elements, create_employee_detail_pdf
+from export_progress import report_progress, progress_receiver, print_progress
+
+
+def _employee_name(payload):
+    return payload.get('employee', {}).get('name', 'Unbekannt')
+
+
+def _safe_file_name(name):
+    """Wie in main.js: alles außer a-z, A-Z, 0-9 wird zu '_'"""
+    return re.sub(r'[^a-zA-Z0-9]', '_', name)
+
+
+class EmployeeBookmark(Flowable):
+    """
+    Unsichtbarer Flowable, der am Beginn eines Mitarbeiters ein Lesezeichen
+    setzt. Da er erst beim Zeichnen der Seite ausgeführt wird, eignet er sich
+    auch für die Fortschrittsmeldung.
+    """
+
+    def __init__(self, key, title, on_draw=None):
+        super().__init__()
+        self.key = key
+        self.title = title
+        self.on_draw = on_draw
+        self.width = 0
+        self.height = 0
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, level=0)
+        if self.on_draw:
+            self.on_draw()
+
+
+def create_combined_pdf(payloads, output_path):
+    """Alle Mitarbeiter in einer PDF, jeweils ab neuer Seite mit Lesezeichen"""
+    payloads = list(payloads)
+    total = len(payloads)
+    done = [0]
+
+    def make_callback(name):
+        def callback():
+            done[0] += 1
+            report_progress(done=done[0], total=total, employee=name)
+        return callback
+
+    elements = []
+    for index, payload in enumerate(payloads):
+        name = _employee_name(payload)
+        if index > 0:
+            elements.append(PageBreak())
+        elements.append(EmployeeBookmark(f"ma_{index}", name, make_callback(name)))
+        elements.extend(build_employee_elements(
+            payload.get('employee', {}),
+            payload.get('vacation', []),
+            payload.get('absence', [])
+        ))
+
+    doc = create_detail_doc(output_path)
+    doc.build(elements)
+    sys.stdout.buffer.write(f"PDF erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return total
+
+
+def _render_single(payload, output_path):
+    """Worker: eine Detail-PDF, Log-Ausgaben und Seiten-Fortschritt werden verworfen"""
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())), progress_receiver(None):
+        create_employee_detail_pdf(
+            payload.get('employee', {}),
+            payload.get('vacation', []),
+            payload.get('absence', []),
+            output_path
+        )
+    return output_path
+
+
+def create_separate_pdfs(payloads, output_dir, workers=None):
+    """Eine PDF pro Mitarbeiter, parallel über einen Prozess-Pool"""
+    payloads = list(payloads)
+    total = len(payloads)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Eindeutige Dateinamen, auch bei gleichnamigen Mitarbeitern
+    jobs = []
+    used_names = set()
+    for payload in payloads:
+        base = f"Mitarbeiter_{_safe_file_name(_employee_name(payload))}"
+        file_name = base
+        suffix = 2
+        while file_name in used_names:
+            file_name = f"{base}_{suffix}"
+            suffix += 1
+        used_names.add(file_name)
+        jobs.append((payload, str(output_dir / f"{file_name}.pdf")))
+
+    workers = workers or os.cpu_count() or 1
+    done = 0
+    with ProcessPoolExecutor(max_workers=min(workers, max(total, 1))) as pool:
+        futures = {pool.submit(_render_single, payload, path): _employee_name(payload) for payload, path in jobs}
+        for future in as_completed(futures):
+            future.result()
+            done += 1
+            report_progress(done=done, total=total, employee=futures[future])
+
+    sys.stdout.buffer.write(f"{total} PDFs erfolgreich erstellt: {output_dir}\n".encode('utf-8'))
+    return total
+
+
+def main():
+    # Optional: --separate für eine Datei pro Mitarbeiter
+    args = sys.argv[1:]
+    separate = '--separate' in args
+    if separate:
+        args.remove('--separate')
+
+    if len(args) != 2:
+        sys.stderr.buffer.write(b"FEHLER: Falsche Anzahl Parameter!\n")
+        sys.stderr.buffer.write(b"Usage: python export_employee_batch.py [--separate] <input.json|-> <output.pdf|ordner>\n")
+        sys.exit(1)
+
+    input_file = args[0]
+    output = args[1]
+
+    try:
+        payloads = read_rows(input_file)
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Lesen der JSON: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        with progress_receiver(print_progress):
+            if separate:
+                create_separate_pdfs(payloads, output)
+            else:
+                create_combined_pdf(payloads, output)
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Erstellen der PDF: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
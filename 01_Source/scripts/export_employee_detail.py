@@ -6,72 +6,86 @@ Erstellt eine formatierte PDF mit Urlaubs- und Abwesenheitsdaten eines einzelnen
 """
 
 import sys
-import json
 from datetime import datetime
-from reportlab.lib import colors
+
+# Vor reportlab, damit dessen Import-Zeit im Profil erscheint
+from export_profile import start_profile, span, record
+
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
 
+from export_input import read_detail
+from export_rows import vacation_entries, absence_entries
+from export_styles import pdf_styles
+from export_dates import format_date, date_sort_key
+from export_progress import report_page
 
-def create_employee_detail_pdf(employee_data, vacation_data, absence_data, output_path):
-    """
-    Erstellt eine detaillierte PDF für einen Mitarbeiter
-    
-    Args:
-        employee_data: Dict mit Mitarbeiterdaten (name, department, etc.)
-        vacation_data: Liste mit Urlaubseinträgen
-        absence_data: Liste mit Abwesenheitseinträgen
-        output_path: Pfad zur Output-PDF
-    """
-    
-    # PDF-Dokument erstellen (A4 Hochformat)
-    doc = SimpleDocTemplate(
+
+# Styles werden einmal pro Prozess erstellt (wichtig für den Export-Server)
+_STYLES = pdf_styles()
+TITLE_STYLE = _STYLES.detail_title
+SUBTITLE_STYLE = _STYLES.subtitle
+INFO_STYLE = _STYLES.info
+FOOTER_STYLE = _STYLES.footer
+VACATION_TABLE_STYLE = _STYLES.vacation_table
+ABSENCE_TABLE_STYLE = _STYLES.absence_table
+
+# Typ auf Deutsch
+TYP_LABELS = {
+    'krankheit': 'Krankheit',
+    'schulung': 'Schulung',
+    'ueberstunden': 'Überstunden'
+}
+
+
+def create_detail_doc(output_path):
+    """PDF-Dokument für Mitarbeiter-Details (A4 Hochformat)"""
+    return SimpleDocTemplate(
         output_path,
         pagesize=A4,
         rightMargin=2*cm,
         leftMargin=2*cm,
         topMargin=2*cm,
-        bottomMargin=2*cm
+        bottomMargin=2*cm,
+        pageCompression=1
     )
-    
+
+
+def build_employee_elements(employee_data, vacation_data, absence_data):
+    """
+    Erstellt die Flowables der Detailansicht eines Mitarbeiters
+
+    Wird sowohl für die Einzel-PDF als auch für den Batch-Export genutzt.
+    """
     elements = []
-    styles = getSampleStyleSheet()
-    
-    # Custom Styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1F538D'),
-        spaceAfter=12,
-        alignment=1  # Center
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#1F538D'),
-        spaceAfter=10,
-        spaceBefore=15
-    )
-    
-    info_style = ParagraphStyle(
-        'InfoStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=6
-    )
     
     # Titel
-    title = Paragraph(f"Urlaubsübersicht: {employee_data.get('name', 'Unbekannt')}", title_style)
+    title = Paragraph(f"Urlaubsübersicht: {employee_data.get('name', 'Unbekannt')}", TITLE_STYLE)
     elements.append(title)
     elements.append(Spacer(1, 0.3*cm))
     
+    elements.extend(build_year_elements(employee_data, vacation_data, absence_data))
+    
+    # Fußzeile mit Datum
+    elements.append(Spacer(1, 1*cm))
+    footer_text = f"Erstellt am: {datetime.now().strftime('%d.%m.%Y um %H:%M Uhr')}"
+    footer = Paragraph(footer_text, FOOTER_STYLE)
+    elements.append(footer)
+    
+    return elements
+
+
+def build_year_elements(employee_data, vacation_data, absence_data):
+    """
+    Flowables eines Jahres: Kennzahlen, Urlaubs- und Abwesenheitstabelle
+
+    Ohne Titel und Fußzeile, damit das Mitarbeiter-Dossier mehrere Jahre
+    hintereinander setzen kann. Einträge als Dicts oder VacationEntry bzw.
+    AbsenceEntry.
+    """
+    elements = []
+    
     # Mitarbeiter-Informationen
     info_text = f"""
     <b>Abteilung:</b> {employee_data.get('department', 'Keine Abteilung')}<br/>
@@ -82,106 +96,56 @@ def create_employee_detail_pdf(employee_data, vacation_data, absence_data, outpu
     <b>Genommen:</b> {employee_data.get('taken', 0)} Tage<br/>
     <b>Verbleibend:</b> {employee_data.get('remaining', 0)} Tage
     """
-    info_para = Paragraph(info_text, info_style)
+    info_para = Paragraph(info_text, INFO_STYLE)
     elements.append(info_para)
     elements.append(Spacer(1, 0.5*cm))
     
     # Urlaubseinträge
     if vacation_data and len(vacation_data) > 0:
-        vacation_title = Paragraph("Urlaubseinträge", subtitle_style)
+        vacation_title = Paragraph("Urlaubseinträge", SUBTITLE_STYLE)
         elements.append(vacation_title)
         
         # Tabellen-Header
         vacation_table_data = [['Von', 'Bis', 'Tage', 'Notiz']]
         
-        # Sortiere nach Startdatum (neueste zuerst)
-        sorted_vacation = sorted(vacation_data, key=lambda x: x.get('von', ''), reverse=True)
+        # Sortiere nach Startdatum (neueste zuerst, ungültige Daten ans Ende)
+        sorted_vacation = sorted(vacation_entries(vacation_data), key=lambda x: date_sort_key(x.von), reverse=True)
         
         for entry in sorted_vacation:
-            von = entry.get('von', '')
-            bis = entry.get('bis', '')
-            tage = entry.get('tage', 0)
-            notiz = entry.get('notiz', '')
-            
-            # Formatiere Datum
-            try:
-                von_formatted = datetime.strptime(von, '%Y-%m-%d').strftime('%d.%m.%Y')
-            except:
-                von_formatted = von
-            
-            try:
-                bis_formatted = datetime.strptime(bis, '%Y-%m-%d').strftime('%d.%m.%Y')
-            except:
-                bis_formatted = bis
+            notiz = entry.notiz
             
             vacation_table_data.append([
-                von_formatted,
-                bis_formatted,
-                str(tage),
+                format_date(entry.von),
+                format_date(entry.bis),
+                str(entry.tage),
                 notiz[:40] + '...' if len(notiz) > 40 else notiz
             ])
         
         # Erstelle Tabelle
         vacation_table = Table(vacation_table_data, colWidths=[3*cm, 3*cm, 2*cm, 9*cm])
-        vacation_table.setStyle(TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#28a745')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            
-            # Daten
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ALIGN', (0, 1), (2, -1), 'CENTER'),
-            ('ALIGN', (3, 1), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        with span('styles'):
+            vacation_table.setStyle(VACATION_TABLE_STYLE)
         
         elements.append(vacation_table)
         elements.append(Spacer(1, 0.8*cm))
     else:
-        no_vacation = Paragraph("Keine Urlaubseinträge vorhanden", info_style)
+        no_vacation = Paragraph("Keine Urlaubseinträge vorhanden", INFO_STYLE)
         elements.append(no_vacation)
         elements.append(Spacer(1, 0.5*cm))
     
     # Abwesenheitseinträge (Krankheit, Schulung, Überstunden)
     if absence_data and len(absence_data) > 0:
-        absence_title = Paragraph("Weitere Abwesenheiten", subtitle_style)
+        absence_title = Paragraph("Weitere Abwesenheiten", SUBTITLE_STYLE)
         elements.append(absence_title)
         
         # Tabellen-Header
         absence_table_data = [['Typ', 'Datum', 'Wert', 'Notiz']]
         
-        # Sortiere nach Datum (neueste zuerst)
-        sorted_absence = sorted(absence_data, key=lambda x: x.get('datum', ''), reverse=True)
+        # Sortiere nach Datum (neueste zuerst, ungültige Daten ans Ende)
+        sorted_absence = sorted(absence_entries(absence_data), key=lambda x: date_sort_key(x.datum), reverse=True)
         
         for entry in sorted_absence:
-            typ = entry.get('typ', '')
-            datum = entry.get('datum', '')
-            wert = entry.get('wert', 0)
-            notiz = entry.get('notiz', '')
-            
-            # Formatiere Datum
-            try:
-                datum_formatted = datetime.strptime(datum, '%Y-%m-%d').strftime('%d.%m.%Y')
-            except:
-                datum_formatted = datum
-            
-            # Typ auf Deutsch
-            typ_labels = {
-                'krankheit': 'Krankheit',
-                'schulung': 'Schulung',
-                'ueberstunden': 'Überstunden'
-            }
-            typ_de = typ_labels.get(typ, typ)
+            typ, datum, wert, notiz, _ = entry
             
             # Wert formatieren (mit Einheit)
             if typ == 'ueberstunden':
@@ -190,75 +154,77 @@ def create_employee_detail_pdf(employee_data, vacation_data, absence_data, outpu
                 wert_str = f"{wert} Tage"
             
             absence_table_data.append([
-                typ_de,
-                datum_formatted,
+                TYP_LABELS.get(typ, typ),
+                format_date(datum),
                 wert_str,
                 notiz[:40] + '...' if len(notiz) > 40 else notiz
             ])
         
         # Erstelle Tabelle
         absence_table = Table(absence_table_data, colWidths=[3*cm, 3*cm, 2.5*cm, 8.5*cm])
-        absence_table.setStyle(TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F538D')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            
-            # Daten
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ALIGN', (0, 1), (2, -1), 'CENTER'),
-            ('ALIGN', (3, 1), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        with span('styles'):
+            absence_table.setStyle(ABSENCE_TABLE_STYLE)
         
         elements.append(absence_table)
     else:
-        no_absence = Paragraph("Keine weiteren Abwesenheiten vorhanden", info_style)
+        no_absence = Paragraph("Keine weiteren Abwesenheiten vorhanden", INFO_STYLE)
         elements.append(no_absence)
     
-    # Fußzeile mit Datum
-    elements.append(Spacer(1, 1*cm))
-    footer_text = f"Erstellt am: {datetime.now().strftime('%d.%m.%Y um %H:%M Uhr')}"
-    footer = Paragraph(footer_text, ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey))
-    elements.append(footer)
+    return elements
+
+
+def create_employee_detail_pdf(employee_data, vacation_data, absence_data, output_path):
+    """
+    Erstellt eine detaillierte PDF für einen Mitarbeiter
+    
+    Args:
+        employee_data: Dict mit Mitarbeiterdaten (name, department, etc.)
+        vacation_data: Liste mit Urlaubseinträgen
+        absence_data: Liste mit Abwesenheitseinträgen
+        output_path: Pfad zur Output-PDF
+    """
+    doc = create_detail_doc(output_path)
+    with span('row_build'):
+        elements = build_employee_elements(employee_data, vacation_data, absence_data)
     
     # PDF erstellen
-    doc.build(elements)
+    with span('doc.build'):
+        doc.build(elements, onFirstPage=report_page, onLaterPages=report_page)
     sys.stdout.buffer.write(f"PDF erfolgreich erstellt: {output_path}\n".encode('utf-8'))
 
 
+def create_detail_pdf(data, output_path):
+    """create_employee_detail_pdf für ein Payload {employee, vacation, absence} (Export-Server, exporters)"""
+    create_employee_detail_pdf(
+        data.get('employee', {}),
+        data.get('vacation', []),
+        data.get('absence', []),
+        output_path
+    )
+
+
 def main():
-    if len(sys.argv) != 3:
+    # Optional: --profile / --profile-stats für Zeitmessung (siehe export_profile.py)
+    args = start_profile(sys.argv[1:])
+    if len(args) != 2:
         sys.stderr.buffer.write(b"FEHLER: Falsche Anzahl Parameter!\n")
-        sys.stderr.buffer.write(b"Usage: python export_employee_detail.py <input.json> <output.pdf>\n")
+        sys.stderr.buffer.write(b"Usage: python export_employee_detail.py [--profile|--profile-stats] <input.json|-> <output.pdf>\n")
         sys.exit(1)
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file = args[0]
+    output_file = args[1]
+    record(output=output_file)
     
-    # JSON lesen
+    # JSON lesen und Daten extrahieren (bei "-" NDJSON von stdin)
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with span('json_parse'):
+            employee_data, vacation_data, absence_data = read_detail(input_file)
+        record(rows=len(vacation_data) + len(absence_data))
         sys.stdout.buffer.write(f"JSON gelesen\n".encode('utf-8'))
     except Exception as e:
         sys.stderr.buffer.write(f"FEHLER beim Lesen der JSON: {str(e)}\n".encode('utf-8'))
         sys.exit(1)
     
-    # Daten extrahieren
-    employee_data = data.get('employee', {})
-    vacation_data = data.get('vacation', [])
-    absence_data = data.get('absence', [])
-    
     # PDF erstellen
     try:
         create_employee_detail_pdf(employee_data, vacation_data, absence_data, output_file)
@@ -266,6 +232,5 @@ def main():
         sys.stderr.buffer.write(f"FEHLER beim Erstellen der PDF: {str(e)}\n".encode('utf-8'))
         sys.exit(1)
 
-
 if __name__ == '__main__':
     main()
\ No newline at end of file
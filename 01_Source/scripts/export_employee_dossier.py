@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mitarbeiter-Dossier für TeamFlow (alle Jahre eines Mitarbeiters)
+Für Prüfungen: Jahresübersicht mit Anspruch, Übertragskette und
+Überstunden-Saldo, danach pro Jahr die Detailansicht (wie
+export_employee_detail.py) ab neuer Seite mit Lesezeichen.
+
+Die Jahreswerte der Übersicht kommen aus gruppierten Abfragen. Die
+Einträge eines Jahres werden erst gelesen, wenn reportlab beim Setzen
+bei diesem Jahr ankommt: die Flowables entstehen in einem Generator und
+werden über LazyFlowables (export_to_pdf) nur wenige Elemente im Voraus
+angefordert.
+Gesetzte Seiten bleiben nur als fertiger Seiteninhalt im Canvas; Einträge
+und Tabellen liegen immer nur für das aktuelle Jahr im Speicher.
+
+Usage: python export_employee_dossier.py <datenbank> <mitarbeiter_id> <output.pdf> [--bis-jahr JAHR]
+"""
+
+import sys
+import sqlite3
+import argparse
+from datetime import datetime
+from functools import partial
+
+from reportlab.lib.units import cm
+from reportlab.platypus import Table, Paragraph, Spacer, PageBreak
+
+from export_from_db import open_database, load_employee, employee_year_summary, load_year_entries
+from export_employee_detail import (
+    create_detail_doc, build_year_elements, TITLE_STYLE, SUBTITLE_STYLE, INFO_STYLE, FOOTER_STYLE,
+)
+from export_styles import pdf_styles
+from export_employee_batch import EmployeeBookmark
+from export_dates import format_date
+from export_progress import report_page
+from export_to_pdf import LazyFlowables
+
+
+SUMMARY_TABLE_STYLE = pdf_styles().summary_table
+SUMMARY_HEADER = ['Jahr', 'Anspruch', 'Übertrag', 'Verfügbar', 'Genommen', 'Rest',
+                  'Krankheit', 'Schulung', 'Überst.', 'Saldo (h)']
+SUMMARY_WIDTHS = [1.3*cm] + [1.75*cm] * 5 + [1.6*cm] * 3 + [2*cm]
+
+def _days(value):
+    return f"{value or 0:g}"
+
+
+def build_summary_table(summary):
+    """Jahresübersicht: eine Zeile pro Jahr, Kopfzeile wiederholt sich pro Seite"""
+    table_data = [SUMMARY_HEADER]
+    for row in summary:
+        table_data.append([
+            str(row['jahr']),
+            _days(row['urlaub_anspruch']),
+            _days(row['urlaub_uebertrag']),
+            _days(row['urlaub_verfuegbar']),
+            _days(row['urlaub_genommen']),
+            _days(row['urlaub_rest']),
+            _days(row['krankheit']),
+            _days(row['schulung']),
+            f"{row['ueberstunden'] or 0:+.1f}",
+            f"{row['ueberstunden_saldo'] or 0:+.1f}",
+        ])
+    table = Table(table_data, colWidths=SUMMARY_WIDTHS, repeatRows=1)
+    table.setStyle(SUMMARY_TABLE_STYLE)
+    return table
+
+
+def iter_dossier_elements(employee, summary, fetch_year):
+    """
+    Flowables des Dossiers als Generator
+
+    employee:   {name, department, id, entry, exit}
+    summary:    Jahreswerte wie employee_year_summary(), aufsteigend
+    fetch_year: fetch_year(jahr) -> (vacation, absence); wird erst
+                aufgerufen, wenn das Jahr gesetzt wird
+    """
+    name = employee.get('name', 'Unbekannt')
+    yield EmployeeBookmark('uebersicht', "Jahresübersicht")
+    yield Paragraph(f"Mitarbeiter-Dossier: {name}", TITLE_STYLE)
+    yield Spacer(1, 0.3*cm)
+
+    zeitraum = f"{summary[0]['jahr']} – {summary[-1]['jahr']}" if summary else "–"
+    info_text = f"""
+    <b>Abteilung:</b> {employee.get('department', 'Keine Abteilung')}<br/>
+    <b>Personalnummer:</b> {employee.get('id', '')}<br/>
+    <b>Eintritt:</b> {format_date(employee.get('entry'))}<br/>
+    <b>Austritt:</b> {format_date(employee.get('exit')) or '–'}<br/>
+    <b>Zeitraum:</b> {zeitraum}
+    """
+    yield Paragraph(info_text, INFO_STYLE)
+    yield Spacer(1, 0.5*cm)
+
+    yield Paragraph("Jahresübersicht", SUBTITLE_STYLE)
+    if summary:
+        yield build_summary_table(summary)
+        yield Spacer(1, 0.3*cm)
+        yield Paragraph(
+            "Urlaub in Tagen (Anspruch im Eintrittsjahr anteilig), Überstunden in Stunden; "
+            "der Saldo ist kumulativ bis zum Jahresende.", FOOTER_STYLE
+        )
+    else:
+        yield Paragraph("Keine Jahre im gewählten Zeitraum", INFO_STYLE)
+
+    for row in summary:
+        jahr = row['jahr']
+        vacation, absence = fetch_year(jahr)
+        employee_data = {
+            'name': name,
+            'department': employee.get('department', 'Keine Abteilung'),
+            'year': jahr,
+            'entitlement': row['urlaub_anspruch'],
+            'carryover': row['urlaub_uebertrag'],
+            'available': row['urlaub_verfuegbar'],
+            'taken': row['urlaub_genommen'],
+            'remaining': row['urlaub_rest'],
+        }
+        yield PageBreak()
+        yield EmployeeBookmark(f"jahr_{jahr}", str(jahr))
+        yield Paragraph(f"{name}: {jahr}", TITLE_STYLE)
+        yield Spacer(1, 0.3*cm)
+        yield from build_year_elements(employee_data, vacation, absence)
+
+    yield Spacer(1, 1*cm)
+    yield Paragraph(f"Erstellt am: {datetime.now().strftime('%d.%m.%Y um %H:%M Uhr')}", FOOTER_STYLE)
+
+
+def create_employee_dossier_pdf(employee, summary, fetch_year, output_path):
+    """
+    Erstellt das Dossier eines Mitarbeiters
+
+    Args:
+        employee: Dict mit Stammdaten (name, department, id, entry, exit)
+        summary: Liste der Jahreswerte (siehe employee_year_summary)
+        fetch_year: Funktion jahr -> (vacation, absence)
+        output_path: Pfad zur Output-PDF
+    """
+    doc = create_detail_doc(output_path)
+    doc.build(LazyFlowables(iter_dossier_elements(employee, summary, fetch_year)),
+              onFirstPage=report_page, onLaterPages=report_page)
+    sys.stdout.buffer.write(f"Dossier erfolgreich erstellt: {output_path} ({len(summary)} Jahre)\n".encode('utf-8'))
+    return len(summary)
+
+
+def create_dossier_from_db(conn, mitarbeiter_id, output_path, bis_jahr=None):
+    """Dossier direkt aus der Datenbank, Einträge werden pro Jahr nachgeladen"""
+    ma = load_employee(conn, mitarbeiter_id)
+    if ma is None:
+        raise ValueError(f"Mitarbeiter {mitarbeiter_id} nicht gefunden")
+
+    summary = employee_year_summary(conn, ma, bis_jahr or datetime.now().year)
+    employee = {
+        'name': f"{ma['vorname']} {ma['nachname']}",
+        'department': ma['abteilung_name'] or 'Keine Abteilung',
+        'id': ma['id'],
+        'entry': ma['eintrittsdatum'],
+        'exit': ma['austrittsdatum'],
+    }
+    return create_employee_dossier_pdf(employee, summary, partial(load_year_entries, conn, ma['id']), output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TeamFlow-Mitarbeiter-Dossier (alle Jahre) aus der Datenbank")
+    parser.add_argument('database', help="Pfad zur TeamFlow-Datenbank")
+    parser.add_argument('mitarbeiter_id', help="ID des Mitarbeiters")
+    parser.add_argument('output', help="Ausgabedatei (.pdf)")
+    parser.add_argument('--bis-jahr', type=int, help="Letztes Jahr des Dossiers (Standard: aktuelles Jahr)")
+    args = parser.parse_args()
+
+    try:
+        conn = open_database(args.database)
+    except sqlite3.Error as e:
+        sys.stderr.buffer.write(f"FEHLER beim Öffnen der Datenbank: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        create_dossier_from_db(conn, args.mitarbeiter_id, args.output, args.bis_jahr)
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Erstellen des Dossiers: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Schriften der TeamFlow PDF-Exporte (TrueType, Unicode)
+
+Die Standardschriften von PDF (Helvetica) kennen nur Latin-1; Namen und
+Notizen mit z.B. 'ł', 'ő' oder 'ș' werden damit als Kästchen gesetzt.
+Alle PDF-Exporte verwenden deshalb eine TrueType-Schrift, gesucht in
+dieser Reihenfolge:
+    1. TEAMFLOW_PDF_FONT / TEAMFLOW_PDF_FONT_BOLD (Pfade zu .ttf-Dateien);
+       TEAMFLOW_PDF_FONT=Helvetica schaltet auf die eingebauten Schriften
+    2. Arial (Windows, macOS), DejaVu Sans oder Liberation Sans (Linux)
+    3. Bitstream Vera aus dem reportlab-Paket (immer vorhanden)
+
+reportlab bettet pro Dokument nur die verwendeten Zeichen als Teilschrift
+ein (Subsetting), komprimiert wie die Seiteninhalte. Die name-Tabelle der
+Schrift (bei DejaVu gut 15 KB Lizenztext) wird dabei durch eine minimale
+mit Familien- und PostScript-Namen ersetzt; PDF-Viewer lesen sie nicht.
+
+Das Einlesen einer TTF-Datei (Tabellen, Breiten aller Zeichen) kostet bei
+DejaVu Sans gut 20 ms pro Schnitt und Prozess. Die ausgewerteten Metriken
+werden deshalb im Benutzer-Cache gespeichert (Schlüssel: Pfad, Größe,
+Änderungszeit, reportlab-Version) und in späteren Läufen nur geladen; die
+Schriftdatei selbst wird für das Subsetting roh eingelesen. Anderer Ordner
+mit TEAMFLOW_FONT_CACHE=<pfad>, abschalten mit TEAMFLOW_FONT_CACHE=0.
+"""
+
+import os
+import sys
+import struct
+import pickle
+import hashlib
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
+
+FONT_ENV = 'TEAMFLOW_PDF_FONT'
+FONT_BOLD_ENV = 'TEAMFLOW_PDF_FONT_BOLD'
+FONT_CACHE_ENV = 'TEAMFLOW_FONT_CACHE'
+
+# Namen, unter denen die TrueType-Schnitte registriert werden
+FONT_NAME = 'TeamFlow'
+FONT_BOLD_NAME = 'TeamFlow-Bold'
+
+BUILTIN_FONTS = ('Helvetica', 'Helvetica-Bold')
+
+# Format der Cache-Dateien, bei Änderungen erhöhen
+CACHE_VERSION = 1
+
+# Attribute des Schriftschnitts, die nicht in den Cache gehören
+# (Dateiinhalt wird neu gelesen, _pdfScale ist eine lokale Funktion)
+_UNCACHED = ('_ttf_data', '_pdfScale')
+
+
+def _system_font_candidates():
+    """(normal, fett) der üblichen Systemschriften, in Suchreihenfolge"""
+    windows_fonts = Path(os.environ.get('WINDIR', r'C:\Windows')) / 'Fonts'
+    return [
+        (windows_fonts / 'arial.ttf', windows_fonts / 'arialbd.ttf'),
+        (Path('/Library/Fonts/Arial.ttf'), Path('/Library/Fonts/Arial Bold.ttf')),
+        (Path('/System/Library/Fonts/Supplemental/Arial.ttf'), Path('/System/Library/Fonts/Supplemental/Arial Bold.ttf')),
+        (Path('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'), Path('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf')),
+        (Path('/usr/share/fonts/TTF/DejaVuSans.ttf'), Path('/usr/share/fonts/TTF/DejaVuSans-Bold.ttf')),
+        (Path('/usr/share/fonts/dejavu/DejaVuSans.ttf'), Path('/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf')),
+        (Path('/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf'),
+         Path('/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf')),
+    ]
+
+
+def find_font_files():
+    """
+    (normal, fett) als Pfade der zu verwendenden TTF-Dateien, None für Helvetica
+
+    Ohne fetten Schnitt (nur TEAMFLOW_PDF_FONT gesetzt) wird auch für fett
+    der normale verwendet.
+    """
+    configured = os.environ.get(FONT_ENV)
+    if configured:
+        if configured in BUILTIN_FONTS:
+            return None
+        bold = os.environ.get(FONT_BOLD_ENV) or configured
+        return Path(configured), Path(bold)
+
+    for regular, bold in _system_font_candidates():
+        if regular.is_file() and bold.is_file():
+            return regular, bold
+
+    import reportlab
+    fonts = Path(reportlab.__file__).parent / 'fonts'
+    return fonts / 'Vera.ttf', fonts / 'VeraBd.ttf'
+
+
+def font_cache_dir():
+    """Ordner der Metrik-Caches, None wenn abgeschaltet"""
+    configured = os.environ.get(FONT_CACHE_ENV)
+    if configured == '0':
+        return None
+    if configured:
+        return Path(configured)
+    from export_cache import app_cache_dir
+    return app_cache_dir() / 'fonts'
+
+
+def _cache_path(cache_dir, path):
+    import reportlab
+
+    stat = path.stat()
+    key = f"{CACHE_VERSION}|{reportlab.__version__}|{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+    return cache_dir / f"{path.stem}-{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.pickle"
+
+
+def _pdf_scale(units_per_em):
+    """Wie TTFontFile.extractInfo: Font-Einheiten in 1/1000 pt"""
+    if units_per_em == 1000:
+        return lambda x: x
+    factor = 1000 / units_per_em
+    return lambda x: x * factor
+
+
+def _name_table(face):
+    """name-Tabelle nur mit Familie, Stil, vollem und PostScript-Namen (Windows, Unicode)"""
+    records = [(1, face.familyName), (2, face.styleName), (4, face.fullName), (6, face.name)]
+    strings = [(getattr(value, 'ustr', None) or bytes(value).decode('latin-1')).encode('utf-16-be')
+               for _, value in records]
+    header = struct.pack('>HHH', 0, len(records), 6 + 12 * len(records))
+    offset = 0
+    entries = []
+    for (name_id, _), data in zip(records, strings):
+        entries.append(struct.pack('>HHHHHH', 3, 1, 0x409, name_id, len(data), offset))
+        offset += len(data)
+    return header + b''.join(entries) + b''.join(strings)
+
+
+def _subset_face_class():
+    """TTFontFace, deren Teilschriften die minimale name-Tabelle enthalten"""
+    from reportlab.pdfbase.ttfonts import TTFontFace
+
+    class SubsetFace(TTFontFace):
+        def get_table(self, tag):
+            # Nur makeSubset liest ganze Tabellen, das Einlesen arbeitet mit Positionen
+            if tag == 'name':
+                return _name_table(self)
+            return super().get_table(tag)
+
+    return SubsetFace
+
+
+def load_face(path, cache_dir=None):
+    """
+    Schriftschnitt (TTFontFace) einer TTF-Datei, über den Metrik-Cache
+
+    Ein fehlender, veralteter oder beschädigter Cache führt zum normalen
+    Einlesen der Datei; der Cache wird dann neu geschrieben. Fehler beim
+    Schreiben (z.B. schreibgeschützter Ordner) werden ignoriert.
+    """
+    face_class = _subset_face_class()
+    path = Path(path)
+    cache_file = _cache_path(cache_dir, path) if cache_dir is not None else None
+
+    if cache_file is not None and cache_file.is_file():
+        try:
+            with open(cache_file, 'rb') as f:
+                state = pickle.load(f)
+            face = face_class.__new__(face_class)
+            face.__dict__.update(state)
+            face._ttf_data = path.read_bytes()
+            face._pdfScale = _pdf_scale(face.unitsPerEm)
+            return face
+        except Exception:
+            pass
+
+    face = face_class(str(path))
+    if cache_file is not None:
+        state = {key: value for key, value in face.__dict__.items() if key not in _UNCACHED}
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+    return face
+
+
+def _ttfont(name, face):
+    """TTFont um einen bereits geladenen Schriftschnitt (wie TTFont.__init__, ohne Einlesen)"""
+    from reportlab import rl_config
+    from reportlab.pdfbase.ttfonts import TTFont, TTEncoding
+
+    font = TTFont.__new__(TTFont)
+    font.fontName = name
+    font.face = face
+    font.encoding = TTEncoding()
+    font.state = WeakKeyDictionary()
+    font._asciiReadable = rl_config.ttfAsciiReadable
+    # Die Exporte setzen keinen Text mit HarfBuzz-Shaping
+    font.shapable = False
+    return font
+
+
+@lru_cache(maxsize=None)
+def pdf_fonts():
+    """
+    Registriert die Schriften einmal pro Prozess
+
+    Gibt ein SimpleNamespace zurück:
+        regular, bold:  Namen für setFont / FONTNAME / ParagraphStyle
+        files:          (normal, fett) als Pfade, None bei Helvetica
+
+    Ist die konfigurierte Schrift nicht lesbar, wird mit einer WARNUNG auf
+    Helvetica zurückgefallen, statt den Export abzubrechen.
+    """
+    files = find_font_files()
+    if files is None:
+        return SimpleNamespace(regular=BUILTIN_FONTS[0], bold=BUILTIN_FONTS[1], files=None)
+
+    from reportlab.pdfbase import pdfmetrics
+
+    cache_dir = font_cache_dir()
+    try:
+        fonts = [_ttfont(name, load_face(path, cache_dir)) for name, path in zip((FONT_NAME, FONT_BOLD_NAME), files)]
+    except Exception as e:
+        sys.stderr.buffer.write(
+            f"WARNUNG: Schrift {files[0]} nicht lesbar ({str(e)}), verwende Helvetica\n".encode('utf-8'))
+        return SimpleNamespace(regular=BUILTIN_FONTS[0], bold=BUILTIN_FONTS[1], files=None)
+
+    for font in fonts:
+        pdfmetrics.registerFont(font)
+    # <b> in Paragraphen wählt den fetten Schnitt
+    pdfmetrics.registerFontFamily(FONT_NAME, normal=FONT_NAME, bold=FONT_BOLD_NAME,
+                                  italic=FONT_NAME, boldItalic=FONT_BOLD_NAME)
+    return SimpleNamespace(regular=FONT_NAME, bold=FONT_BOLD_NAME, files=files)
+
+
+def reserve_fonts(canvas, font_names, characters=''):
+    """
+    Legt interne Schriftnamen und Zeichencodes eines Dokuments im Voraus fest
+
+    TrueType-Teilschriften vergeben Namen (/F1+0) und Zeichencodes in der
+    Reihenfolge der ersten Verwendung. Werden Seiten in mehreren Prozessen
+    gesetzt und danach zusammengefügt, müssen alle Canvas mit denselben
+    Schriften und Zeichen in derselben Reihenfolge vorbereitet werden;
+    dann sind Namen und Codes überall gleich.
+    """
+    from reportlab.pdfbase import pdfmetrics
+
+    doc = canvas._doc
+    text = ''.join(sorted(set(characters)))
+    for name in font_names:
+        font = pdfmetrics.getFont(name)
+        if getattr(font, '_dynamicFont', False):
+            font.getSubsetInternalName(0, doc)
+            font.splitString(text, doc)
+        else:
+            doc.getInternalFontName(name)
+
+
+def reserved_characters(canvas, font_names):
+    """Anzahl belegter Zeichencodes pro TrueType-Schrift (zum Vergleich zwischen Prozessen)"""
+    from reportlab.pdfbase import pdfmetrics
+
+    usage = {}
+    for name in font_names:
+        font = pdfmetrics.getFont(name)
+        if getattr(font, '_dynamicFont', False):
+            state = font.state.get(canvas._doc)
+            usage[name] = state.nextCode if state is not None else 0
+    return usage
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Direkter Datenbank-Export für TeamFlow
+Liest die TeamFlow-Datenbank read-only und streamt die Zeilen direkt in
+create_excel / create_pdf / den Batch-Export der Mitarbeiter-Details.
+
+Damit entfallen Berechnung im Renderer, IPC, JSON-Serialisierung und das
+erneute Parsen in Python. Auch Jahre, die gerade nicht in der Oberfläche
+geladen sind, lassen sich so günstig exportieren.
+
+Anspruch, Übertrag und die Summen pro Jahr kommen aus
+statistics_engine.compute_statistics, der gegen data-manager.js geprüften
+Umsetzung (benchmarks/statistics_parity.js); hier gibt es keine eigene.
+"""
+
+import sys
+import sqlite3
+import argparse
+from pathlib import Path
+
+from export_raw import raw_format, create_raw
+from export_rows import OverviewRow, VacationEntry, AbsenceEntry
+from statistics_engine import compute_statistics, iter_overview_rows as statistik_rows, iter_employee_years
+
+
+def open_database(db_path):
+    """Öffnet die Datenbank read-only (die App darf parallel schreiben)"""
+    uri = Path(db_path).resolve().as_uri() + '?mode=ro'
+    conn = sqlite3.connect(uri, uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _year_range(jahr):
+    """ISO-Datumsgrenzen eines Jahres (index-freundlich statt strftime)"""
+    return f"{jahr:04d}-01-01", f"{jahr + 1:04d}-01-01"
+
+
+def iter_overview_rows(conn, jahr, abteilung=None):
+    """Zeilen der Urlaubsübersicht als OverviewRow (Felder wie renderer.js exportToExcel)"""
+    statistik = compute_statistics(conn, jahr)
+    for row in statistik_rows(statistik, jahr, abteilung):
+        yield OverviewRow.from_dict(row)
+
+
+def load_year_entries(conn, mitarbeiter_id, jahr):
+    """
+    (vacation, absence) eines Mitarbeiters in einem Jahr, neueste zuerst
+
+    Einträge als VacationEntry bzw. AbsenceEntry (Spalten in Feldreihenfolge).
+
+    Gelesen über die Indizes (mitarbeiter_id, von_datum / datum).
+    """
+    von, bis = _year_range(jahr)
+    params = (mitarbeiter_id, von, bis)
+
+    vacation = [
+        VacationEntry.from_values(r)
+        for r in conn.execute("""
+            SELECT von_datum, bis_datum, tage, COALESCE(notiz, '') FROM urlaub
+            WHERE mitarbeiter_id = ? AND von_datum >= ? AND von_datum < ?
+            ORDER BY von_datum DESC
+        """, params)
+    ]
+
+    absence = [
+        AbsenceEntry.from_values(r)
+        for r in conn.execute("""
+            SELECT 'krankheit', von_datum, tage, COALESCE(notiz, ''), '' FROM krankheit
+            WHERE mitarbeiter_id = ? AND von_datum >= ? AND von_datum < ?
+            ORDER BY von_datum DESC
+        """, params)
+    ]
+    absence.extend(
+        AbsenceEntry.from_values(r)
+        for r in conn.execute("""
+            SELECT 'schulung', datum, dauer_tage, COALESCE(notiz, ''), COALESCE(titel, '') FROM schulung
+            WHERE mitarbeiter_id = ? AND datum >= ? AND datum < ?
+            ORDER BY datum DESC
+        """, params)
+    )
+    absence.extend(
+        AbsenceEntry.from_values(r)
+        for r in conn.execute("""
+            SELECT 'ueberstunden', datum, stunden, COALESCE(notiz, ''), '' FROM ueberstunden
+            WHERE mitarbeiter_id = ? AND datum >= ? AND datum < ?
+            ORDER BY datum DESC
+        """, params)
+    )
+    return vacation, absence
+
+
+def iter_detail_payloads(conn, jahr, abteilung=None):
+    """Payloads {employee, vacation, absence} wie in DetailDialog._exportMitarbeiterPDF"""
+    statistik = compute_statistics(conn, jahr)
+    urlaubstage = {ma['id']: ma['urlaubstage_jahr'] for ma in statistik['mitarbeiter']}
+
+    for row in statistik_rows(statistik, jahr, abteilung):
+        ma_id = row['mitarbeiter_id']
+        vacation, absence = load_year_entries(conn, ma_id, jahr)
+
+        # Wie im Detail-Dialog: voller Jahresanspruch ohne Anteilsberechnung
+        anspruch = urlaubstage[ma_id] or 0
+        uebertrag = row['urlaub_uebertrag']
+        genommen = sum(entry.tage for entry in vacation)
+
+        yield {
+            'employee': {
+                'name': row['mitarbeiter'],
+                'department': row['abteilung'] or 'Keine Abteilung',
+                'year': jahr,
+                'entitlement': anspruch,
+                'carryover': uebertrag,
+                'available': anspruch + uebertrag,
+                'taken': genommen,
+                'remaining': anspruch + uebertrag - genommen,
+            },
+            'vacation': vacation,
+            'absence': absence,
+        }
+
+
+def load_employee(conn, mitarbeiter_id):
+    """Stammdaten eines Mitarbeiters (auch ausgetretene), None wenn unbekannt"""
+    return conn.execute("""
+        SELECT m.id, m.vorname, m.nachname, m.eintrittsdatum, m.austrittsdatum, m.urlaubstage_jahr,
+               a.name AS abteilung_name
+        FROM mitarbeiter m
+        LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.id = ?
+    """, (mitarbeiter_id,)).fetchone()
+
+
+def employee_year_summary(conn, ma, bis_jahr):
+    """
+    Jahreswerte eines Mitarbeiters vom Eintritts- bis zum Jahr bis_jahr
+
+    Berechnet mit compute_statistics in einem Durchlauf über alle Jahre;
+    die Einträge selbst werden erst mit load_year_entries gelesen. Der
+    Anspruch ist wie in der Übersicht anteilig, damit die Übertragskette
+    der Jahre nachvollziehbar bleibt. ueberstunden ist der Wert des Jahres,
+    ueberstunden_saldo kumulativ bis zum Jahresende (inklusive der Jahre
+    vor dem Eintritt, wie in der Übersicht).
+    """
+    erstes_jahr = int(ma['eintrittsdatum'][:4])
+    letztes_jahr = bis_jahr
+    if ma['austrittsdatum']:
+        letztes_jahr = min(letztes_jahr, int(ma['austrittsdatum'][:4]))
+    if letztes_jahr < erstes_jahr:
+        return []
+
+    statistik = compute_statistics(conn, erstes_jahr, letztes_jahr, mitarbeiter=[ma])
+    return [
+        {
+            'jahr': werte['jahr'],
+            'urlaub_anspruch': werte['urlaub_anspruch'],
+            'urlaub_uebertrag': werte['urlaub_uebertrag'],
+            'urlaub_verfuegbar': werte['urlaub_verfuegbar'],
+            'urlaub_genommen': werte['urlaub_genommen'],
+            'urlaub_rest': werte['urlaub_rest'],
+            'krankheit': werte['krankheit'],
+            'schulung': werte['schulung'],
+            'ueberstunden': werte['ueberstunden_jahr'],
+            'ueberstunden_saldo': werte['ueberstunden'],
+        }
+        for werte in iter_employee_years(statistik, 0)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TeamFlow-Export direkt aus der Datenbank")
+    parser.add_argument('database', help="Pfad zur TeamFlow-Datenbank")
+    parser.add_argument('jahr', type=int, help="Exportjahr")
+    parser.add_argument('output', help="Ausgabedatei (.xlsx/.pdf/.csv/.parquet/.arrow) bzw. Ordner bei --details --separate")
+    parser.add_argument('--abteilung', help="Nur diese Abteilung exportieren")
+    parser.add_argument('--details', action='store_true', help="Mitarbeiter-Detail-PDFs statt Übersicht")
+    parser.add_argument('--separate', action='store_true', help="Bei --details: eine PDF pro Mitarbeiter")
+    parser.add_argument('--departments', action='store_true', help="Excel: ein Blatt pro Abteilung")
+    args = parser.parse_args()
+
+    try:
+        conn = open_database(args.database)
+    except sqlite3.Error as e:
+        sys.stderr.buffer.write(f"FEHLER beim Öffnen der Datenbank: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        if args.details:
+            from export_employee_batch import create_combined_pdf, create_separate_pdfs
+            payloads = iter_detail_payloads(conn, args.jahr, args.abteilung)
+            if args.separate:
+                create_separate_pdfs(payloads, args.output)
+            else:
+                create_combined_pdf(payloads, args.output)
+        elif raw_format(args.output):
+            create_raw(iter_overview_rows(conn, args.jahr, args.abteilung), args.output)
+        elif args.output.lower().endswith('.pdf'):
+            from export_to_pdf import create_pdf
+            create_pdf(iter_overview_rows(conn, args.jahr, args.abteilung), args.output)
+        else:
+            from export_to_excel import create_excel
+            create_excel(iter_overview_rows(conn, args.jahr, args.abteilung), args.output,
+                         streaming=True, departments=args.departments)
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Export aus der Datenbank: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Eingabe-Hilfen für die TeamFlow Export-Scripts
+
+Als Eingabepfad ist entweder eine JSON-Datei oder "-" erlaubt. Bei "-" wird
+NDJSON (eine JSON-Zeile pro Eintrag) von stdin gelesen und zeilenweise
+verarbeitet, sodass nie mehr als ein Eintrag gleichzeitig geparst im
+Speicher liegt.
+
+NDJSON-Format für die Mitarbeiter-Detail-PDF (ein Datensatz pro Zeile):
+    {"employee": {...}}
+    {"vacation": {...}}
+    {"absence": {...}}
+"""
+
+import io
+import sys
+import json
+import codecs
+
+from export_rows import RowTypeError, VacationEntry, AbsenceEntry, vacation_entries, absence_entries
+
+
+STDIN_PATH = '-'
+
+
+def iter_ndjson(stream, row_type=None):
+    """
+    Liefert die Einträge eines binären NDJSON-Streams einzeln
+
+    Mit row_type (z.B. OverviewRow) wird jede Zeile direkt in diesen Typ
+    dekodiert statt in ein Dict.
+    """
+    # Ein Decoder für alle Zeilen (json.loads mit Hook baut sonst jedes Mal einen neuen)
+    decode = json.JSONDecoder(object_pairs_hook=row_type.from_pairs).decode if row_type is not None else json.loads
+    for line_no, raw in enumerate(stream, 1):
+        if line_no == 1 and raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+
+        line = raw.strip()
+        if not line:
+            continue
+
+        try:
+            yield decode(line.decode('utf-8'))
+        except RowTypeError as e:
+            raise RowTypeError(f"Zeile {line_no}: {e}") from None
+        except ValueError as e:
+            raise ValueError(f"Ungültiges JSON in Zeile {line_no}: {e}") from None
+
+
+def read_json_file(input_path, row_type=None):
+    """
+    Liest eine komplette JSON-Datei (UTF-8, optional mit BOM)
+
+    Mit row_type wird jedes Objekt der Datei als row_type dekodiert.
+    """
+    hook = row_type.from_pairs if row_type is not None else None
+    with io.open(input_path, 'r', encoding='utf-8-sig') as f:
+        return json.load(f, object_pairs_hook=hook)
+
+
+def read_rows(input_path, row_type=None):
+    """
+    Gibt die Zeilen für Übersichts-Exporte zurück
+
+    Bei "-" ein Generator über stdin, sonst die Liste aus der JSON-Datei.
+    row_type siehe iter_ndjson; ohne row_type sind die Zeilen Dicts.
+    """
+    if input_path == STDIN_PATH:
+        return iter_ndjson(sys.stdin.buffer, row_type)
+    return read_json_file(input_path, row_type)
+
+
+def read_detail(input_path):
+    """
+    Gibt (employee, vacation, absence) für die Mitarbeiter-Detail-PDF zurück
+
+    Einträge als Listen von VacationEntry bzw. AbsenceEntry.
+    """
+    if input_path != STDIN_PATH:
+        data = read_json_file(input_path)
+        return (data.get('employee', {}), vacation_entries(data.get('vacation', [])),
+                absence_entries(data.get('absence', [])))
+
+    employee = {}
+    vacation = []
+    absence = []
+    for record in iter_ndjson(sys.stdin.buffer):
+        if 'employee' in record:
+            employee = record['employee']
+        elif 'vacation' in record:
+            vacation.append(VacationEntry.from_dict(record['vacation']))
+        elif 'absence' in record:
+            absence.append(AbsenceEntry.from_dict(record['absence']))
+
+    return employee, vacation, absence
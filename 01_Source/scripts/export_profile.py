@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zeitmessung für die TeamFlow Export-Scripts
+
+Eingeschaltet über --profile (bzw. --profile-stats) auf der Kommandozeile
+oder die Umgebungsvariable TEAMFLOW_PROFILE:
+    TEAMFLOW_PROFILE=1        Zeitabschnitte, Zeilenzahl, Spitzen-Speicher
+    TEAMFLOW_PROFILE=stats    zusätzlich cProfile, gespeichert als
+                              <ausgabe>.pstats neben der Ausgabedatei
+
+Beim Prozessende wird eine JSON-Zeile auf stdout geschrieben (wie die
+Fortschrittsmeldungen des Batch-Exports):
+    {"event": "profile", "script": "export_to_excel.py", "rows": 1000,
+     "spans": [{"name": "import", "ms": 412.3, "calls": 1}, ...],
+     "total_ms": 1630.8, "peak_rss_mb": 81.2, "pstats": null}
+
+Abschnitte der Export-Scripts:
+    import       Import der Exporter (openpyxl, reportlab, pyarrow)
+    json_parse   Lesen der Eingabe, bei NDJSON über den ganzen Export verteilt
+    styles       Styles, Schriften und Formatierung
+    row_build    Zeilen bzw. Flowables aufbauen
+    wb.save      openpyxl serialisiert und schreibt die Datei in einem Schritt,
+                 der Abschnitt enthält also das Schreiben der .xlsx
+    doc.build    Layout und Seiten der PDF, einschließlich Schreiben der Datei
+                 (reportlab schreibt erst am Ende von doc.build)
+    file_write   nur wo ein Script die Datei selbst zusammensetzt: Mappe pro
+                 Abteilung (nach wb.save in den Speicher) und Delta-Export
+    cache        Nachschlagen und Ablegen im Ergebnis-Cache
+Ein eigener Abschnitt file_write für xlsx und PDF würde eine zusätzliche
+Kopie der ganzen Datei im Speicher erfordern und fehlt deshalb.
+
+Abschnitte mit demselben Namen werden aufsummiert. Ohne Profiling ist
+span() ein leerer Kontextmanager, die Export-Funktionen können ihn daher
+immer verwenden (auch im Export-Server).
+
+Dieses Modul muss vor openpyxl/reportlab importiert werden, damit der
+Abschnitt "import" deren Import-Zeit enthält.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import contextlib
+from pathlib import Path
+
+_PROCESS_START = time.perf_counter()
+
+PROFILE_ENV = 'TEAMFLOW_PROFILE'
+PROFILE_FLAG = '--profile'
+STATS_FLAG = '--profile-stats'
+STATS_SUFFIX = '.pstats'
+
+_NO_SPAN = contextlib.nullcontext()
+_active = None
+
+
+class _Profile:
+    """Gesammelte Zeitabschnitte und Kennzahlen eines Laufs"""
+
+    def __init__(self, stats):
+        self.spans = {}
+        self.values = {}
+        self.stats = None
+        if stats:
+            import cProfile
+            self.stats = cProfile.Profile()
+            self.stats.enable()
+
+    def add(self, name, seconds):
+        span = self.spans.setdefault(name, [0.0, 0])
+        span[0] += seconds
+        span[1] += 1
+
+    @contextlib.contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def report(self):
+        stats_path = None
+        if self.stats is not None:
+            self.stats.disable()
+            output = self.values.get('output')
+            stats_path = f"{output}{STATS_SUFFIX}" if output else f"export{STATS_SUFFIX}"
+            try:
+                self.stats.dump_stats(stats_path)
+            except OSError as e:
+                sys.stderr.buffer.write(f"FEHLER beim Schreiben der Profildaten: {str(e)}\n".encode('utf-8'))
+                stats_path = None
+
+        message = {
+            'event': 'profile',
+            'script': Path(sys.argv[0]).name,
+            **{key: value for key, value in self.values.items() if key != 'output'},
+            'spans': [
+                {'name': name, 'ms': round(seconds * 1000, 1), 'calls': calls}
+                for name, (seconds, calls) in self.spans.items()
+            ],
+            'total_ms': round((time.perf_counter() - _PROCESS_START) * 1000, 1),
+            'peak_rss_mb': peak_rss_mb(),
+            'pstats': stats_path,
+        }
+        line = json.dumps(message, ensure_ascii=False)
+        sys.stdout.buffer.write((line + '\n').encode('utf-8'))
+        sys.stdout.flush()
+
+
+def peak_rss_mb():
+    """Höchster Arbeitsspeicher des Prozesses in MB, None wenn nicht ermittelbar"""
+    try:
+        import resource
+    except ImportError:
+        return _peak_rss_windows()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux meldet KB, macOS Bytes
+    if sys.platform == 'darwin':
+        peak /= 1024
+    return round(peak / 1024, 1)
+
+
+def _peak_rss_windows():
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+        return round(counters.PeakWorkingSetSize / (1024 * 1024), 1)
+    except (AttributeError, OSError):
+        return None
+
+
+def start_profile(args):
+    """
+    Schaltet das Profiling ein, wenn ein Schalter oder TEAMFLOW_PROFILE gesetzt ist
+
+    Entfernt --profile/--profile-stats aus args (Liste der Parameter ohne
+    Scriptnamen) und gibt sie zurück. Die Zeit bis hierher wird als
+    Abschnitt "import" erfasst, der Bericht beim Prozessende geschrieben.
+    """
+    global _active
+    env = os.environ.get(PROFILE_ENV, '').strip().lower()
+    stats = STATS_FLAG in args or env == 'stats'
+    enabled = stats or PROFILE_FLAG in args or env not in ('', '0')
+    args = [arg for arg in args if arg not in (PROFILE_FLAG, STATS_FLAG)]
+
+    if enabled and _active is None:
+        _active = _Profile(stats)
+        _active.add('import', time.perf_counter() - _PROCESS_START)
+        atexit.register(_active.report)
+    return args
+
+
+def span(name):
+    """Kontextmanager, der die Dauer des Blocks unter name aufsummiert"""
+    if _active is None:
+        return _NO_SPAN
+    return _active.span(name)
+
+
+def timed_iter(name, iterable):
+    """
+    Misst die Zeit in next() eines Generators (z.B. NDJSON-Parsen von stdin)
+
+    Die Zeit zählt zusätzlich zu dem Abschnitt, in dem der Generator
+    verbraucht wird. Listen werden unverändert zurückgegeben.
+    """
+    if _active is None or iter(iterable) is not iterable:
+        return iterable
+    return _timed_iter(_active, name, iterable)
+
+
+def _timed_iter(profile, name, iterable):
+    iterator = iter(iterable)
+    seconds = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                seconds += time.perf_counter() - start
+            yield item
+    finally:
+        profile.add(name, seconds)
+
+
+def record(**values):
+    """Kennzahlen für den Bericht (z.B. rows=..., output=... für die pstats-Datei)"""
+    if _active is not None:
+        _active.values.update(values)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fortschritt und Abbruch für laufende Exporte
+
+Die Export-Funktionen melden über report_progress() geschriebene Zeilen
+bzw. gerenderte Seiten. Ohne eingesetzten Empfänger (Einzelprozess,
+Benchmarks) passiert dabei nichts. Der Export-Server setzt pro Job mit
+progress_receiver() einen Empfänger ein; dieser darf ExportCancelled
+werfen, um den Export an der nächsten Meldung abzubrechen.
+
+Als eigener Prozess gestartete Scripts (z.B. der Batch-Export) setzen
+print_progress() als Empfänger ein: jede Meldung wird als JSON-Zeile
+{"event": "progress", ...} auf stdout geschrieben, die main.js auswertet.
+
+Ein Prozess führt immer nur einen Job gleichzeitig aus, der Empfänger
+ist deshalb modulweit gespeichert (wie in export_profile).
+"""
+
+import sys
+import json
+import contextlib
+
+
+# Zeilen bzw. Seiten zwischen zwei Meldungen
+PROGRESS_ROWS = 1000
+PROGRESS_PAGES = 10
+
+_receiver = None
+
+
+class ExportCancelled(Exception):
+    """Der Job wurde abgebrochen, die Teil-Ausgabe ist zu verwerfen"""
+
+
+@contextlib.contextmanager
+def progress_receiver(callback):
+    """Leitet report_progress() für die Dauer des Blocks an callback(**werte) weiter"""
+    global _receiver
+    previous = _receiver
+    _receiver = callback
+    try:
+        yield
+    finally:
+        _receiver = previous
+
+
+def print_progress(**values):
+    """Empfänger für Einzelprozesse: Meldung als JSON-Zeile auf stdout"""
+    line = json.dumps({'event': 'progress', **values}, ensure_ascii=False)
+    sys.stdout.buffer.write((line + '\n').encode('utf-8'))
+    sys.stdout.flush()
+
+
+def report_progress(**values):
+    """Meldet den Stand, z.B. rows=5000, pages=12 oder done=3, total=120"""
+    if _receiver is not None:
+        _receiver(**values)
+
+
+def report_page(canvas, doc):
+    """onPage-Callback für reportlab-Dokumente: meldet jede PROGRESS_PAGES-te begonnene Seite"""
+    if _receiver is not None and (doc.page == 1 or doc.page % PROGRESS_PAGES == 0):
+        _receiver(pages=doc.page)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rohdaten-Export der Urlaubsübersicht (CSV, Parquet, Arrow IPC)
+
+Für Weiterverarbeitung (z.B. Lohnabrechnung) ohne Formatierung. Das Format
+wird über die Dateiendung der Ausgabe gewählt:
+    .csv                UTF-8 mit BOM (Excel erkennt die Kodierung), Komma
+                        als Trenner, Dezimalpunkt
+    .parquet            Parquet (Snappy-komprimiert)
+    .arrow / .feather   Arrow IPC-Datei
+
+Die Zeilen sind dieselben wie bei create_excel (Liste oder Generator),
+Spaltennamen sind die Felder von OverviewRow. CSV wird zeilenweise
+geschrieben; für Parquet/Arrow werden typisierte Spalten in Blöcken zu je
+BATCH_SIZE Zeilen gebaut und als RecordBatch geschrieben, der Speicherbedarf
+bleibt damit unabhängig von der Zeilenzahl.
+
+pyarrow ist optional und wird nur für Parquet/Arrow gebraucht.
+"""
+
+import csv
+import sys
+from itertools import islice
+from pathlib import Path
+
+from export_columns import COLUMNS, TEXT_COLUMNS, ID_KEY
+from export_rows import OVERVIEW_FIELDS, OverviewColumns, overview_rows
+from export_progress import report_progress, PROGRESS_ROWS
+
+
+# Dateiendung -> Format
+RAW_FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+}
+
+# Zeilen pro RecordBatch
+BATCH_SIZE = 16384
+
+# (Schlüssel, Standardwert, Text-Spalte) in Ausgabereihenfolge
+FIELDS = [(ID_KEY, None, True)] + [
+    (key, default, index < TEXT_COLUMNS) for index, (_, key, default, _) in enumerate(COLUMNS)
+]
+
+
+def raw_format(output_path):
+    """Rohdaten-Format zur Ausgabedatei, None für xlsx/pdf"""
+    if not isinstance(output_path, (str, Path)):
+        return None
+    return RAW_FORMATS.get(Path(output_path).suffix.lower())
+
+
+def create_csv(data, output_path):
+    """
+    Schreibt die Zeilen als CSV, ohne sie im Speicher zu sammeln
+
+    Gibt die Anzahl der geschriebenen Zeilen zurück.
+    """
+    count = 0
+    with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(OVERVIEW_FIELDS)
+        for row in overview_rows(data):
+            writer.writerow(row)
+            count += 1
+            if count % PROGRESS_ROWS == 0:
+                report_progress(rows=count)
+    report_progress(rows=count)
+
+    sys.stdout.buffer.write(f"CSV erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return count
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow nicht installiert! Installiere mit: pip install pyarrow") from None
+    return pyarrow
+
+
+def iter_record_batches(data, schema, batch_size=BATCH_SIZE):
+    """
+    RecordBatches mit typisierten Spalten (Texte als string, Zahlen als float64)
+
+    Jeder Block wird als OverviewColumns gesammelt; die Zahlen-Arrays
+    übernimmt pyarrow ohne Kopie als Datenpuffer.
+    """
+    pa = _import_pyarrow()
+    rows = overview_rows(data)
+    while True:
+        batch = OverviewColumns(islice(rows, batch_size))
+        if not batch.count:
+            break
+        arrays = []
+        for (_, values), (_, _, is_text), field in zip(batch.columns(), FIELDS, schema):
+            if is_text:
+                arrays.append(pa.array(values, type=field.type))
+            else:
+                arrays.append(pa.Array.from_buffers(field.type, batch.count, [None, pa.py_buffer(values)]))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def create_columnar(data, output_path, fmt='parquet'):
+    """
+    Schreibt die Zeilen als Parquet- oder Arrow-IPC-Datei
+
+    Gibt die Anzahl der geschriebenen Zeilen zurück.
+    """
+    pa = _import_pyarrow()
+    schema = pa.schema([(key, pa.string() if is_text else pa.float64()) for key, _, is_text in FIELDS])
+
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(output_path, schema, compression='snappy')
+    else:
+        writer = pa.ipc.new_file(output_path, schema)
+
+    count = 0
+    with writer:
+        for batch in iter_record_batches(data, schema):
+            writer.write_batch(batch)
+            count += batch.num_rows
+            report_progress(rows=count)
+
+    sys.stdout.buffer.write(f"{fmt.capitalize()} erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return count
+
+
+def create_raw(data, output_path):
+    """Schreibt die Zeilen im Format der Dateiendung (siehe RAW_FORMATS)"""
+    fmt = raw_format(output_path)
+    if fmt is None:
+        raise ValueError(f"Unbekanntes Rohdaten-Format: {output_path}")
+    if fmt == 'csv':
+        return create_csv(data, output_path)
+    return create_columnar(data, output_path, fmt)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Typisierte Zeilen der TeamFlow Export-Scripts
+
+Statt eines Dicts pro Zeile (mit Schlüssel-Lookup pro Feld und Format)
+sind Zeilen kompakte, unveränderliche Tupel mit festen Feldern:
+    OverviewRow     Urlaubsübersicht, Felder in der Reihenfolge ID + COLUMNS
+    VacationEntry   Urlaubseintrag {von, bis, tage, notiz}
+    AbsenceEntry    Abwesenheit {typ, datum, wert, notiz, titel}
+
+Die Typen werden einmal beim Erzeugen geprüft (Texte str, Zahlen int oder
+float; fehlende Felder und null ergeben den Standardwert, bei der
+Mitarbeiter-ID None), danach greifen
+die Exporte nur noch über Position oder Attribut zu. Über from_pairs als
+object_pairs_hook dekodiert json direkt in die Zeilen, ohne Dict pro Zeile.
+get() entspricht dict.get, damit Aufrufer wahlweise Dicts oder Zeilen
+übergeben können.
+
+OverviewColumns ist die spaltenweise Sicht: Texte als Listen, Zahlen als
+array('d') mit 8 Bytes pro Wert statt eines float-Objekts.
+"""
+
+from array import array
+from collections import namedtuple
+
+from export_columns import COLUMNS, TEXT_COLUMNS, ID_KEY
+
+
+class RowTypeError(ValueError):
+    """Feld einer Zeile hat einen unzulässigen Typ"""
+
+
+# Zulässige Typen je Feldart (bool zählt bewusst nicht als Zahl)
+TEXT_TYPES = (str,)
+NUMBER_TYPES = (int, float)
+
+
+class _TypedRow(tuple):
+    """
+    Gemeinsame Konstruktion der Zeilentypen (Mixin zu einem namedtuple)
+
+    Unterklassen setzen _text_fields (Indizes der Textfelder) und
+    _defaults; alle übrigen Felder sind Zahlen. null wird zum Standardwert.
+
+    Geprüfte Typ-Kombinationen (Typ je Feld) werden pro Klasse gemerkt;
+    Zeilen mit einer bekannten Kombination brauchen nur noch einen
+    Vergleich statt einer Prüfung pro Feld.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._index = {key: i for i, key in enumerate(cls._fields)}
+        cls._items = tuple(zip(cls._fields, cls._defaults))
+        cls._signatures = set()
+        cls._checks = tuple(
+            (i, key, default, TEXT_TYPES if i in cls._text_fields else NUMBER_TYPES)
+            for i, (key, default) in enumerate(zip(cls._fields, cls._defaults))
+        )
+
+    @classmethod
+    def _validated(cls, values):
+        signature = tuple(map(type, values))
+        if signature in cls._signatures:
+            return tuple.__new__(cls, values)
+
+        changed = False
+        for i, key, default, types in cls._checks:
+            value = values[i]
+            if value is None:
+                if default is not None:
+                    values[i] = default
+                    changed = True
+            elif type(value) not in types:
+                expected = 'Text' if types is TEXT_TYPES else 'Zahl'
+                raise RowTypeError(f"Feld '{key}': {expected} erwartet, {value!r} erhalten")
+        if not changed:
+            cls._signatures.add(signature)
+        return tuple.__new__(cls, values)
+
+    @classmethod
+    def from_values(cls, values):
+        """Zeile aus Werten in Feldreihenfolge (z.B. einer Datenbankzeile)"""
+        return cls._validated(list(values))
+
+    @classmethod
+    def from_dict(cls, entry):
+        """Zeile aus einem Dict; unbekannte Schlüssel werden ignoriert"""
+        return cls._validated([entry.get(key, default) for key, default in cls._items])
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """object_pairs_hook für json.loads"""
+        return cls.from_dict(dict(pairs))
+
+    @classmethod
+    def coerce(cls, entry):
+        """Zeile unverändert, Dicts werden umgewandelt"""
+        return entry if type(entry) is cls else cls.from_dict(entry)
+
+    def get(self, key, default=None):
+        i = self._index.get(key)
+        return default if i is None else self[i]
+
+    def to_dict(self):
+        return dict(zip(self._fields, self))
+
+
+# Urlaubsübersicht: ID, dann die Spalten in Export-Reihenfolge
+OVERVIEW_FIELDS = (ID_KEY,) + tuple(key for _, key, _, _ in COLUMNS)
+
+
+class OverviewRow(namedtuple('OverviewRow', OVERVIEW_FIELDS), _TypedRow):
+    """Zeile der Urlaubsübersicht; row[1:] sind die Werte der Spalten in COLUMNS"""
+    __slots__ = ()
+    _text_fields = frozenset(range(TEXT_COLUMNS + 1))
+    _defaults = (None,) + tuple(default for _, _, default, _ in COLUMNS)
+
+
+class VacationEntry(namedtuple('VacationEntry', ('von', 'bis', 'tage', 'notiz')), _TypedRow):
+    """Urlaubseintrag, Daten als ISO-Text"""
+    __slots__ = ()
+    _text_fields = frozenset((0, 1, 3))
+    _defaults = ('', '', 0, '')
+
+
+class AbsenceEntry(namedtuple('AbsenceEntry', ('typ', 'datum', 'wert', 'notiz', 'titel')), _TypedRow):
+    """Krankheit, Schulung (Tage) oder Überstunden (Stunden)"""
+    __slots__ = ()
+    _text_fields = frozenset((0, 1, 3, 4))
+    _defaults = ('', '', 0, '', '')
+
+
+# Position des ersten Zahlenfelds in OverviewRow
+FIRST_NUMBER_FIELD = TEXT_COLUMNS + 1
+
+
+def overview_rows(data):
+    """
+    OverviewRow je Eintrag von data (Dicts oder bereits typisierte Zeilen)
+
+    Bei einem Typfehler wird die Zeilennummer ergänzt.
+    """
+    from_dict = OverviewRow.from_dict
+    for number, entry in enumerate(data, 1):
+        if type(entry) is OverviewRow:
+            yield entry
+            continue
+        try:
+            yield from_dict(entry)
+        except RowTypeError as e:
+            raise RowTypeError(f"Zeile {number}: {e}") from None
+
+
+def vacation_entries(entries):
+    """Urlaubseinträge als VacationEntry (Liste)"""
+    return [VacationEntry.coerce(entry) for entry in entries]
+
+
+def absence_entries(entries):
+    """Abwesenheiten als AbsenceEntry (Liste)"""
+    return [AbsenceEntry.coerce(entry) for entry in entries]
+
+
+class OverviewColumns:
+    """
+    Spaltenweise Sicht auf Übersichtszeilen
+
+    Jedes Feld aus OVERVIEW_FIELDS ist ein Attribut: Texte als Liste von
+    str, Zahlen als array('d'). Die Zahlen-Arrays lassen sich ohne Kopie an
+    pyarrow/numpy übergeben (Buffer-Protokoll).
+    """
+
+    __slots__ = OVERVIEW_FIELDS + ('count',)
+
+    def __init__(self, rows=()):
+        for i, key in enumerate(OVERVIEW_FIELDS):
+            setattr(self, key, [] if i < FIRST_NUMBER_FIELD else array('d'))
+        self.count = 0
+        self.extend(rows)
+
+    def extend(self, rows):
+        """Hängt Zeilen (Dicts oder OverviewRow) an"""
+        columns = [getattr(self, key) for key in OVERVIEW_FIELDS]
+        appends = [column.append for column in columns]
+        for row in overview_rows(rows):
+            for append, value in zip(appends, row):
+                append(value)
+            self.count += 1
+        return self
+
+    def __len__(self):
+        return self.count
+
+    def columns(self):
+        """(Schlüssel, Spalte) in Feldreihenfolge"""
+        return [(key, getattr(self, key)) for key in OVERVIEW_FIELDS]
+
+    def rows(self):
+        """Zeilen zurück als OverviewRow (Zahlen dann als float)"""
+        for values in zip(*(getattr(self, key) for key in OVERVIEW_FIELDS)):
+            yield tuple.__new__(OverviewRow, values)
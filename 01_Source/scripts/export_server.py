@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Export-Server für TeamFlow
+Langlebiger Python-Prozess, der Export-Jobs über stdin entgegennimmt.
+
+Die Jobs laufen gleichzeitig in einem Pool aus Worker-Prozessen (Standard:
+ein Worker pro CPU, höchstens MAX_WORKERS). Jeder Worker importiert
+openpyxl und reportlab einmal beim Start und erstellt die Styles der
+Export-Scripts einmal; jeder weitere Export spart damit den
+Interpreter-Start und die teuren Imports. Die Annahme der Jobs läuft
+über asyncio und bleibt auch bei großen Exporten ansprechbar.
+
+Protokoll:
+    Eingabe (stdin):  4 Byte Länge (big-endian, unsigned) + UTF-8 JSON
+                      {"id": ..., "type": "excel" | "pdf" | "raw" | "employeeDetailPdf",
+                       "output": "<pfad>", "data": ..., "options": {...}}
+                      {"id": ..., "type": "cancel"}   bricht den Job mit dieser id ab
+    Ausgabe (stdout): Eine JSON-Zeile pro Job
+                      {"id": ..., "success": true, "path": "...", "dauer_ms": ..., "cache": "hit" | "miss"}
+                      {"id": ..., "success": false, "error": "..."}
+                      {"id": ..., "success": false, "cancelled": true, "error": "..."}
+                      dazwischen Fortschrittszeilen (ohne Ergebnis)
+                      {"event": "progress", "id": ..., "rows": 5000}
+                      {"event": "progress", "id": ..., "pages": 12}
+
+Ein abgebrochener Job endet an der nächsten Fortschrittsmeldung; eine
+dabei neu angelegte, unvollständige Ausgabedatei wird gelöscht. Noch
+wartende Jobs werden gar nicht erst gestartet.
+
+Log-Ausgaben der Export-Funktionen werden auf stderr umgeleitet, damit
+stdout ausschließlich Ergebnis- und Fortschrittszeilen enthält.
+
+Usage: python export_server.py [--workers N]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import struct
+import asyncio
+import argparse
+import threading
+import contextlib
+import multiprocessing
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, CancelledError
+from concurrent.futures.process import BrokenProcessPool
+
+import export_to_excel
+import export_to_pdf
+from export_to_excel import create_excel
+from export_to_pdf import create_pdf
+from export_employee_detail import create_employee_detail_pdf, create_detail_pdf
+from export_raw import create_raw
+from export_cache import cached_export
+from export_progress import progress_receiver, ExportCancelled
+
+
+HEADER_SIZE = 4
+
+CANCEL_TYPE = 'cancel'
+MAX_WORKERS = 4
+CANCELLED_MESSAGE = "Export abgebrochen"
+
+
+JOB_HANDLERS = {
+    'excel': create_excel,
+    # Der Server verteilt bereits die Jobs auf Prozesse, kein Pool pro PDF
+    'pdf': partial(create_pdf, workers=1),
+    'raw': create_raw,
+    'employeeDetailPdf': create_detail_pdf,
+}
+
+# Template-Versionen der Exporte mit Ergebnis-Cache. Die Detail-PDF wird
+# nicht gecacht, da ihre Fußzeile den Erstellungszeitpunkt enthält, die
+# Rohdaten nicht, da sie schneller geschrieben als gehasht sind.
+CACHED_TEMPLATES = {
+    'excel': export_to_excel.TEMPLATE_VERSION,
+    'pdf': export_to_pdf.TEMPLATE_VERSION,
+}
+
+
+def _read_exact(stream, size):
+    """Liest genau size Bytes, None bei sauberem EOF vor dem ersten Byte"""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            if remaining == size:
+                return None
+            raise EOFError("Unvollständiger Job auf stdin")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def read_job(stream):
+    """Liest einen längenpräfixierten JSON-Job, None bei EOF"""
+    header = _read_exact(stream, HEADER_SIZE)
+    if header is None:
+        return None
+
+    (length,) = struct.unpack('>I', header)
+    payload = _read_exact(stream, length)
+    if payload is None:
+        raise EOFError("Job-Header ohne Inhalt")
+
+    return json.loads(payload.decode('utf-8'))
+
+
+def encode_job(job):
+    """Kodiert einen Job im Server-Protokoll (für Clients und Benchmarks)"""
+    payload = json.dumps(job, ensure_ascii=False).encode('utf-8')
+    return struct.pack('>I', len(payload)) + payload
+
+
+def write_result(stream, result):
+    stream.write((json.dumps(result, ensure_ascii=False) + '\n').encode('utf-8'))
+    stream.flush()
+
+
+def run_job(job):
+    """Führt einen Job aus und gibt das Ergebnis-Dict zurück"""
+    job_id = job.get('id')
+    job_type = job.get('type')
+    output_path = job.get('output')
+
+    handler = JOB_HANDLERS.get(job_type)
+    if handler is None:
+        return {'id': job_id, 'success': False, 'error': f"Unbekannter Export-Typ: {job_type}"}
+    if not output_path:
+        return {'id': job_id, 'success': False, 'error': "Kein Ausgabepfad angegeben"}
+
+    data = job.get('data')
+    options = job.get('options', {})
+
+    start = time.perf_counter()
+    hit = False
+    existed = os.path.exists(output_path)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            if job_type in CACHED_TEMPLATES:
+                _, hit = cached_export(job_type, CACHED_TEMPLATES[job_type], handler, data, output_path, **options)
+            else:
+                handler(data, output_path, **options)
+    except ExportCancelled:
+        # Nur eine vom Job selbst angelegte Datei entfernen
+        if not existed:
+            with contextlib.suppress(OSError):
+                os.remove(output_path)
+        return {'id': job_id, 'success': False, 'cancelled': True, 'error': CANCELLED_MESSAGE}
+    except Exception as e:
+        return {'id': job_id, 'success': False, 'error': str(e)}
+
+    dauer_ms = round((time.perf_counter() - start) * 1000, 1)
+    return {'id': job_id, 'success': True, 'path': output_path, 'dauer_ms': dauer_ms, 'cache': 'hit' if hit else 'miss'}
+
+
+def warm_up():
+    """Rendert leere Dokumente in den Speicher, um Lazy-Caches der Bibliotheken zu füllen"""
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO())):
+        create_excel([], io.BytesIO())
+        create_pdf([], io.BytesIO())
+        create_employee_detail_pdf({}, [], [], io.BytesIO())
+
+
+# Fortschritts-Queue des Worker-Prozesses (gesetzt von _init_worker)
+_events = None
+
+
+def _init_worker(events):
+    global _events
+    _events = events
+    warm_up()
+
+
+def _worker_ready():
+    return None
+
+
+def _run_worker_job(job, cancelled):
+    """Führt einen Job im Worker aus, meldet Fortschritt und prüft dabei auf Abbruch"""
+    job_id = job.get('id')
+
+    def receive(**values):
+        if job_id in cancelled:
+            raise ExportCancelled()
+        _events.put({'event': 'progress', 'id': job_id, **values})
+
+    with progress_receiver(receive):
+        return run_job(job)
+
+
+class JobRunner:
+    """Nimmt Jobs an, verteilt sie auf den Worker-Pool und schreibt die Antworten"""
+
+    def __init__(self, stdout, workers, manager):
+        self.stdout = stdout
+        self.workers = workers
+        self.context = multiprocessing.get_context('spawn')
+        self.events = self.context.Queue()
+        # Abgebrochene laufende Jobs, für die Worker lesbar
+        self.cancelled = manager.dict()
+        self.futures = {}
+        self.tasks = set()
+        self.pool = self._create_pool()
+
+    def _create_pool(self):
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=self.context,
+            initializer=_init_worker, initargs=(self.events,)
+        )
+        # Worker sofort starten, damit der erste Job nicht auf die Imports wartet
+        for _ in range(self.workers):
+            pool.submit(_worker_ready)
+        return pool
+
+    def _pump_events(self, loop):
+        """Thread: Fortschritt der Worker an die Event-Loop weiterreichen"""
+        while True:
+            event = self.events.get()
+            if event is None:
+                break
+            loop.call_soon_threadsafe(write_result, self.stdout, event)
+
+    def submit(self, job):
+        task = asyncio.ensure_future(self._run(job))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, job):
+        job_id = job.get('id')
+        try:
+            future = self.pool.submit(_run_worker_job, job, self.cancelled)
+        except BrokenProcessPool:
+            # Ein Worker ist abgestürzt, der Pool nimmt nichts mehr an
+            self.pool = self._create_pool()
+            future = self.pool.submit(_run_worker_job, job, self.cancelled)
+        self.futures[job_id] = future
+
+        try:
+            result = await asyncio.wrap_future(future)
+        except (CancelledError, asyncio.CancelledError):
+            result = {'id': job_id, 'success': False, 'cancelled': True, 'error': CANCELLED_MESSAGE}
+        except BrokenProcessPool as e:
+            result = {'id': job_id, 'success': False, 'error': f"Worker abgestürzt: {str(e)}"}
+        finally:
+            if self.futures.get(job_id) is future:
+                del self.futures[job_id]
+            self.cancelled.pop(job_id, None)
+
+        write_result(self.stdout, result)
+
+    def cancel(self, job_id):
+        """Wartende Jobs werden verworfen, laufende an der nächsten Meldung beendet"""
+        future = self.futures.get(job_id)
+        if future is not None and not future.cancel():
+            self.cancelled[job_id] = True
+
+    async def serve(self, stdin):
+        loop = asyncio.get_running_loop()
+        pump = threading.Thread(target=self._pump_events, args=(loop,), daemon=True)
+        pump.start()
+        try:
+            while True:
+                try:
+                    job = await loop.run_in_executor(None, read_job, stdin)
+                except EOFError as e:
+                    sys.stderr.buffer.write(f"FEHLER beim Lesen des Jobs: {str(e)}\n".encode('utf-8'))
+                    sys.stderr.flush()
+                    break
+                except ValueError as e:
+                    # Framing ist intakt, nur der Inhalt ist kein gültiges JSON
+                    write_result(self.stdout, {'id': None, 'success': False, 'error': f"Ungültiges JSON: {str(e)}"})
+                    continue
+
+                if job is None:
+                    break
+                if job.get('type') == CANCEL_TYPE:
+                    self.cancel(job.get('id'))
+                else:
+                    self.submit(job)
+
+            # stdin geschlossen: angenommene Jobs noch fertigstellen
+            if self.tasks:
+                await asyncio.gather(*self.tasks)
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            self.events.put(None)
+            pump.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TeamFlow Export-Server")
+    parser.add_argument('--workers', type=int, default=min(MAX_WORKERS, os.cpu_count() or 1),
+                        help="Anzahl gleichzeitiger Exporte")
+    args = parser.parse_args()
+
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+
+    with multiprocessing.get_context('spawn').Manager() as manager:
+        runner = JobRunner(stdout, max(1, args.workers), manager)
+        sys.stderr.buffer.write(f"Export-Server bereit ({runner.workers} Worker)\n".encode('utf-8'))
+        sys.stderr.flush()
+        asyncio.run(runner.serve(stdin))
+
+
+if __name__ == '__main__':
+    main()
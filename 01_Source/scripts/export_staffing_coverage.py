@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Besetzungsanalyse für TeamFlow (Mindestbesetzung pro Abteilung)
+Anwesende Mitarbeiter pro Abteilung und Tag: beschäftigt laut Eintritt
+und Austritt, abzüglich Urlaub, Krankheit und Schulung, gewichtet mit dem
+Arbeitszeitmodell (VOLL = 1, HALB = 0.5, FREI = 0, Feiertage 0). Tage,
+an denen eine Abteilung planmäßig arbeitet (Soll > 0), aber weniger als
+die Mindestbesetzung anwesend ist, sind Konflikte; aufeinanderfolgende
+Konflikttage werden über freie Tage hinweg zu einem Eintrag
+zusammengefasst. Ausgabe als Excel oder PDF, das Format kommt aus der
+Dateiendung.
+
+Statt pro Tag und Mitarbeiter zu prüfen, werden alle Zeiträume in einem
+Durchlauf verarbeitet (O(n log n) für das Sortieren, danach linear):
+    1. Abwesenheiten auf die Beschäftigung zuschneiden, pro Mitarbeiter
+       sortieren und überlappende Zeiträume verschmelzen (kumulatives
+       Maximum der Enden), damit niemand doppelt fehlt
+    2. pro Gruppe (Abteilung, Arbeitszeitmodell) +1 am ersten und -1 nach
+       dem letzten Tag in ein Differenz-Array (np.bincount), kumulative
+       Summe über die Tage
+    3. Köpfe x Tageswert des Modells, summiert je Abteilung
+
+Abwesenheiten gelten ganztägig, auch halbe Urlaubstage; für die
+Besetzungsplanung ist das die vorsichtige Annahme. Mitarbeiter wie in der
+Statistik (Status AKTIV). Schulungen dauern wie im Jahresplaner
+floor(dauer_tage) Kalendertage, mindestens aber einen Tag.
+
+Usage: python export_staffing_coverage.py <datenbank> <von> <bis> <output.xlsx|.pdf>
+           [--minimum N] [--abteilung-minimum NAME=N ...] [--abteilung NAME]
+"""
+
+import sys
+import sqlite3
+import argparse
+from pathlib import Path
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+
+from export_from_db import open_database
+from export_dates import parse_iso_date, format_date
+from workday_calendar import WorkdayCalendar, STANDARD_MODELL, load_work_models
+
+
+NO_DEPARTMENT = "Keine Abteilung"
+DEFAULT_MINIMUM = 1
+
+# Austritt offen: weit genug in der Zukunft für jeden Zeitraum
+OFFENES_ENDE = '9999-12-31'
+
+_QUERIES = [
+    "SELECT mitarbeiter_id, von_datum, bis_datum FROM urlaub WHERE von_datum <= ? AND bis_datum >= ?",
+    "SELECT mitarbeiter_id, von_datum, bis_datum FROM krankheit WHERE von_datum <= ? AND bis_datum >= ?",
+    """
+        SELECT mitarbeiter_id, datum, bis_datum FROM (
+            SELECT mitarbeiter_id, datum,
+                   date(datum, '+' || (MAX(CAST(dauer_tage AS INTEGER), 1) - 1) || ' days') AS bis_datum
+            FROM schulung
+        ) WHERE datum <= ? AND bis_datum >= ?
+    """,
+]
+
+
+def merge_intervals(person, start, end):
+    """
+    Verschmilzt überlappende oder aneinandergrenzende Zeiträume pro Person
+
+    person, start, end sind gleich lange Integer-Arrays, die Tage sind
+    nicht negativ und inklusive. Gibt die verschmolzenen Zeiträume als
+    (person, start, end) zurück, sortiert nach Person und Start.
+    """
+    if len(person) == 0:
+        return person, start, end
+    order = np.lexsort((start, person))
+    person, start, end = person[order], start[order], end[order]
+
+    # Personen so weit auseinanderschieben, dass das kumulative Maximum der
+    # Enden nicht über eine Personengrenze hinweg reicht
+    offset = person * (int(end.max()) + 2)
+    reach = np.maximum.accumulate(end + offset)
+    neu = np.ones(len(start), dtype=bool)
+    neu[1:] = start[1:] + offset[1:] > reach[:-1] + 1
+
+    first = np.flatnonzero(neu)
+    last = np.append(first[1:], len(start)) - 1
+    return person[first], start[first], reach[last] - offset[last]
+
+
+def count_per_day(gruppe, start, end, anzahl_gruppen, tage):
+    """
+    Anzahl Zeiträume pro Gruppe und Tag
+
+    start und end sind Tagesindizes in [0, tage), inklusive. Pro Zeitraum
+    +1 am ersten und -1 nach dem letzten Tag (zwei np.bincount), danach
+    eine kumulative Summe über die Tage.
+    """
+    breite = tage + 1
+    zu = np.bincount(gruppe * breite + start, minlength=anzahl_gruppen * breite)
+    ab = np.bincount(gruppe * breite + end + 1, minlength=anzahl_gruppen * breite)
+    return np.cumsum((zu - ab).reshape(anzahl_gruppen, breite)[:, :tage], axis=1)
+
+
+def find_conflicts(soll, anwesend, minimum):
+    """
+    Konflikte als Liste (abteilung, erster_tag, letzter_tag, arbeitstage, min_anwesend, fehlend)
+
+    Betrachtet werden nur die Arbeitstage einer Abteilung (soll > 0); ein
+    Lauf von Konflikttagen endet also nicht an Wochenenden oder Feiertagen.
+    Tage sind Indizes in den Zeitraum, fehlend bezieht sich auf den Tag
+    mit der geringsten Besetzung.
+    """
+    konflikte = []
+    for abteilung in range(soll.shape[0]):
+        arbeitstage = np.flatnonzero(soll[abteilung] > 0)
+        werte = anwesend[abteilung, arbeitstage]
+        unter = (werte < minimum[abteilung]).astype(np.int8)
+        kanten = np.diff(np.concatenate(([0], unter, [0])))
+        for anfang, ende in zip(np.flatnonzero(kanten == 1).tolist(), np.flatnonzero(kanten == -1).tolist()):
+            tiefstwert = float(werte[anfang:ende].min())
+            konflikte.append((abteilung, int(arbeitstage[anfang]), int(arbeitstage[ende - 1]),
+                              ende - anfang, tiefstwert, float(minimum[abteilung]) - tiefstwert))
+    return konflikte
+
+
+def compute_staffing_coverage(conn, von, bis, minimum=DEFAULT_MINIMUM, abteilung=None, minimum_abteilung=None):
+    """
+    Tägliche Besetzung pro Abteilung von-bis (ISO-Strings, inklusive)
+
+    minimum gilt für alle Abteilungen, minimum_abteilung ({name: n})
+    überschreibt es einzeln. Gibt ein SimpleNamespace zurück:
+        von, bis:     Zeitraum (date)
+        abteilung:    Filter oder None
+        tage:         Tage des Zeitraums (datetime64[D])
+        abteilungen:  Namen der Zeilen (alphabetisch, ohne Abteilung zuletzt)
+        minimum:      [Abteilung] Mindestbesetzung
+        soll:         [Abteilung, Tag] planmäßig arbeitende Köpfe (nach Modell gewichtet)
+        anwesend:     [Abteilung, Tag] davon anwesend
+        konflikte:    siehe find_conflicts
+        zeitraeume:   Anzahl berücksichtigter Abwesenheiten
+    """
+    von_datum, bis_datum = parse_iso_date(von), parse_iso_date(bis)
+    if bis_datum < von_datum:
+        raise ValueError(f"Ende {bis} liegt vor dem Beginn {von}")
+    start = np.datetime64(von_datum, 'D')
+    anzahl_tage = (bis_datum - von_datum).days + 1
+
+    def offsets(daten):
+        return (np.array(daten, dtype='datetime64[D]') - start).astype(np.int64)
+
+    nur_abteilung = abteilung if abteilung and abteilung != 'Alle' else None
+    mitarbeiter = conn.execute("""
+        SELECT m.id, COALESCE(a.name, ''), m.eintrittsdatum, m.austrittsdatum
+        FROM mitarbeiter m
+        LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV'
+    """).fetchall()
+    if nur_abteilung is not None:
+        mitarbeiter = [ma for ma in mitarbeiter if ma[1] == nur_abteilung]
+    namen = sorted({ma[1] for ma in mitarbeiter}, key=lambda name: (name == '', name.casefold()))
+    index = {name: i for i, name in enumerate(namen)}
+
+    minimum_abteilung = minimum_abteilung or {}
+    bekannt = {row[0] for row in conn.execute("SELECT name FROM abteilungen")}
+    unbekannt = sorted(set(minimum_abteilung) - bekannt)
+    if unbekannt:
+        raise ValueError(f"Unbekannte Abteilung: {', '.join(unbekannt)}")
+    mindest = np.array([minimum_abteilung.get(name, minimum) for name in namen], dtype=np.float64)
+
+    # Gruppen gleicher Abteilung und gleichen Arbeitszeitmodells
+    modelle = load_work_models(conn)
+    gruppen = {}
+    gruppe_ma = np.array([
+        gruppen.setdefault((index[ma[1]], modelle.get(ma[0], STANDARD_MODELL)), len(gruppen))
+        for ma in mitarbeiter
+    ], dtype=np.int64)
+
+    # Beschäftigung auf den Zeitraum zugeschnitten (leer, wenn außerhalb)
+    eintritt = np.maximum(offsets([ma[2] for ma in mitarbeiter]), 0)
+    austritt = np.minimum(offsets([ma[3] or OFFENES_ENDE for ma in mitarbeiter]), anzahl_tage - 1)
+    beschaeftigt = eintritt <= austritt
+    koepfe = count_per_day(gruppe_ma[beschaeftigt], eintritt[beschaeftigt], austritt[beschaeftigt],
+                           len(gruppen), anzahl_tage)
+
+    ma_index = {ma[0]: i for i, ma in enumerate(mitarbeiter)}
+    params = (bis_datum.isoformat(), von_datum.isoformat())
+    eintraege = [(ma_index[ma_id], a, b) for query in _QUERIES
+                 for ma_id, a, b in conn.execute(query, params) if ma_id in ma_index]
+    person, a_von, a_bis = (list(spalte) for spalte in zip(*eintraege)) if eintraege else ([], [], [])
+    person = np.array(person, dtype=np.int64)
+    a_von = np.maximum(offsets(a_von), eintritt[person])
+    a_bis = np.minimum(offsets(a_bis), austritt[person])
+    gueltig = a_von <= a_bis
+    person, a_von, a_bis = merge_intervals(person[gueltig], a_von[gueltig], a_bis[gueltig])
+    abwesend = count_per_day(gruppe_ma[person], a_von, a_bis, len(gruppen), anzahl_tage)
+
+    calendar = WorkdayCalendar.from_database(conn, von_datum.year, bis_datum.year)
+    gewicht = np.array([calendar.day_values(von_datum.isoformat(), bis_datum.isoformat(), modell)
+                        for _, modell in gruppen], dtype=np.float64).reshape(len(gruppen), anzahl_tage)
+    gruppe_abteilung = np.array([abt for abt, _ in gruppen], dtype=np.int64)
+
+    soll = np.zeros((len(namen), anzahl_tage))
+    anwesend = np.zeros((len(namen), anzahl_tage))
+    np.add.at(soll, gruppe_abteilung, koepfe * gewicht)
+    np.add.at(anwesend, gruppe_abteilung, (koepfe - abwesend) * gewicht)
+
+    return SimpleNamespace(
+        von=von_datum,
+        bis=bis_datum,
+        abteilung=nur_abteilung,
+        tage=start + np.arange(anzahl_tage),
+        abteilungen=namen,
+        minimum=mindest,
+        soll=soll,
+        anwesend=anwesend,
+        konflikte=find_conflicts(soll, anwesend, mindest),
+        zeitraeume=int(gueltig.sum()),
+    )
+
+
+def _labels(analyse):
+    return [name or NO_DEPARTMENT for name in analyse.abteilungen]
+
+
+def _number(wert):
+    """Köpfe ohne überflüssige Nachkommastellen (3, 2.5)"""
+    return f"{wert:g}"
+
+
+def department_summary(analyse):
+    """
+    Zeilen (abteilung, mindestbesetzung, arbeitstage, konflikttage, min_anwesend, mittel_anwesend)
+
+    Nur die Arbeitstage der Abteilung (soll > 0) zählen.
+    """
+    zeilen = []
+    konflikttage = np.zeros(len(analyse.abteilungen), dtype=np.int64)
+    for abteilung, _, _, tage, _, _ in analyse.konflikte:
+        konflikttage[abteilung] += tage
+    for i, label in enumerate(_labels(analyse)):
+        werte = analyse.anwesend[i, analyse.soll[i] > 0]
+        zeilen.append((label, float(analyse.minimum[i]), len(werte), int(konflikttage[i]),
+                       float(werte.min()) if len(werte) else 0.0, float(werte.mean()) if len(werte) else 0.0))
+    return zeilen
+
+
+def create_staffing_excel(analyse, output_path):
+    """
+    Schreibt den Konfliktbericht als Excel-Datei
+
+    Blatt "Konflikte": ein Eintrag pro Lauf von Konflikttagen. Blatt
+    "Abteilungen": Mindestbesetzung, Arbeitstage, Konflikttage und
+    Besetzung je Abteilung. Gibt die Anzahl der Konflikte zurück.
+    """
+    from openpyxl import Workbook
+    from export_styles import register_excel_styles, EXCEL_HEADER_STYLE, EXCEL_DATA_STYLE
+
+    labels = _labels(analyse)
+    tage = analyse.tage.astype(object)
+
+    wb = Workbook()
+    register_excel_styles(wb)
+    konflikt_ws = wb.active
+    konflikt_ws.title = "Konflikte"
+    abteilung_ws = wb.create_sheet("Abteilungen")
+
+    def write(ws, headers, zeilen, formats, widths):
+        for col, header in enumerate(headers, 1):
+            ws.cell(row=1, column=col, value=header).style = EXCEL_HEADER_STYLE
+        for row_idx, werte in enumerate(zeilen, 2):
+            for col, (value, number_format) in enumerate(zip(werte, formats), 1):
+                cell = ws.cell(row=row_idx, column=col, value=value)
+                cell.style = EXCEL_DATA_STYLE
+                if number_format:
+                    cell.number_format = number_format
+        for col, width in enumerate(widths):
+            ws.column_dimensions[chr(ord('A') + col)].width = width
+        ws.freeze_panes = 'A2'
+
+    write(konflikt_ws,
+          ["Abteilung", "Von", "Bis", "Arbeitstage", "Min. anwesend", "Mindestbesetzung", "Fehlend"],
+          [(labels[abteilung], tage[erster], tage[letzter], anzahl, tiefstwert, analyse.minimum[abteilung], fehlend)
+           for abteilung, erster, letzter, anzahl, tiefstwert, fehlend in analyse.konflikte],
+          [None, 'DD.MM.YYYY', 'DD.MM.YYYY', '0', '0.#', '0.#', '0.#'],
+          [25, 12, 12, 12, 14, 17, 10])
+    if not analyse.konflikte:
+        konflikt_ws.cell(row=2, column=1, value="Keine Konflikte")
+
+    write(abteilung_ws,
+          ["Abteilung", "Mindestbesetzung", "Arbeitstage", "Konflikttage", "Min. anwesend", "Ø anwesend"],
+          department_summary(analyse),
+          [None, '0.#', '0', '0', '0.#', '0.0'],
+          [25, 17, 12, 13, 14, 12])
+
+    wb.save(output_path)
+    sys.stdout.buffer.write(
+        f"Besetzungsanalyse erfolgreich erstellt: {output_path} ({len(analyse.konflikte)} Konflikte)\n".encode('utf-8'))
+    return len(analyse.konflikte)
+
+
+def create_staffing_pdf(analyse, output_path):
+    """
+    Schreibt den Konfliktbericht als PDF (A4)
+
+    Übersicht je Abteilung, danach die Konflikte chronologisch. Gibt die
+    Anzahl der Konflikte zurück.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+    from export_styles import pdf_styles
+
+    styles = pdf_styles()
+    labels = _labels(analyse)
+    datum = [format_date(str(tag)) for tag in analyse.tage]
+    titel = "Besetzungsanalyse" + (f": {analyse.abteilung}" if analyse.abteilung else "")
+
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=A4,
+        topMargin=1.5*cm,
+        bottomMargin=1.5*cm,
+        leftMargin=1.5*cm,
+        rightMargin=1.5*cm,
+        pageCompression=1,
+    )
+
+    elements = [
+        Paragraph(titel, styles.detail_title),
+        Paragraph(f"<b>Zeitraum:</b> {datum[0]} - {datum[-1]}", styles.info),
+        Paragraph(f"<b>Konflikte:</b> {len(analyse.konflikte)} ({analyse.zeitraeume} Abwesenheiten ausgewertet)",
+                  styles.info),
+        Paragraph("Abteilungen", styles.subtitle),
+    ]
+
+    summary = [["Abteilung", "Mindestbesetzung", "Arbeitstage", "Konflikttage", "Min. anwesend", "Ø anwesend"]]
+    summary.extend([label, _number(mindest), str(arbeitstage), str(konflikttage), _number(tiefstwert), f"{mittel:.1f}"]
+                   for label, mindest, arbeitstage, konflikttage, tiefstwert, mittel in department_summary(analyse))
+    table = Table(summary, colWidths=[5*cm, 2.7*cm, 2.2*cm, 2.3*cm, 2.5*cm, 2.3*cm], repeatRows=1)
+    table.setStyle(styles.summary_table)
+    elements.append(table)
+
+    elements.append(Paragraph("Konflikte", styles.subtitle))
+    if analyse.konflikte:
+        zeilen = [["Abteilung", "Von", "Bis", "Arbeitstage", "Min. anwesend", "Mindest.", "Fehlend"]]
+        # Chronologisch über alle Abteilungen
+        for abteilung, erster, letzter, anzahl, tiefstwert, fehlend in sorted(analyse.konflikte, key=lambda k: (k[1], k[0])):
+            zeilen.append([labels[abteilung], datum[erster], datum[letzter], str(anzahl),
+                           _number(tiefstwert), _number(analyse.minimum[abteilung]), _number(fehlend)])
+        table = Table(zeilen, colWidths=[4.6*cm, 2.3*cm, 2.3*cm, 2.1*cm, 2.5*cm, 1.8*cm, 1.6*cm], repeatRows=1)
+        table.setStyle(styles.summary_table)
+        elements.append(table)
+    else:
+        elements.append(Paragraph("Keine Konflikte im Zeitraum.", styles.info))
+
+    elements.append(Spacer(1, 0.5*cm))
+    elements.append(Paragraph(
+        "Anwesend = beschäftigte Mitarbeiter ohne Urlaub, Krankheit oder Schulung, gewichtet mit dem "
+        "Arbeitszeitmodell; nur Arbeitstage der Abteilung. "
+        f"Erstellt am {datetime.now().strftime('%d.%m.%Y um %H:%M Uhr')}", styles.footer))
+
+    doc.build(elements)
+    sys.stdout.buffer.write(
+        f"Besetzungsanalyse erfolgreich erstellt: {output_path} ({len(analyse.konflikte)} Konflikte)\n".encode('utf-8'))
+    return len(analyse.konflikte)
+
+
+def create_staffing_report(analyse, output_path):
+    """Konfliktbericht im Format der Dateiendung (.xlsx oder .pdf)"""
+    suffix = Path(output_path).suffix.lower()
+    if suffix == '.pdf':
+        return create_staffing_pdf(analyse, output_path)
+    if suffix == '.xlsx':
+        return create_staffing_excel(analyse, output_path)
+    raise ValueError(f"Unbekanntes Format: {output_path} (erlaubt: .xlsx, .pdf)")
+
+
+def _parse_minimum(value):
+    """'NAME=N' für --abteilung-minimum"""
+    name, sep, anzahl = value.rpartition('=')
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"erwartet NAME=N, erhalten: {value}")
+    try:
+        return name, float(anzahl)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"keine Zahl: {anzahl}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TeamFlow-Besetzungsanalyse (Mindestbesetzung pro Abteilung)")
+    parser.add_argument('database', help="Pfad zur TeamFlow-Datenbank")
+    parser.add_argument('von', help="Erster Tag (JJJJ-MM-TT)")
+    parser.add_argument('bis', help="Letzter Tag (JJJJ-MM-TT)")
+    parser.add_argument('output', help="Ausgabedatei (.xlsx oder .pdf)")
+    parser.add_argument('--minimum', type=float, default=DEFAULT_MINIMUM,
+                        help=f"Mindestbesetzung aller Abteilungen (Standard: {DEFAULT_MINIMUM})")
+    parser.add_argument('--abteilung-minimum', type=_parse_minimum, action='append', default=[],
+                        metavar='NAME=N', help="Mindestbesetzung einer Abteilung (mehrfach möglich)")
+    parser.add_argument('--abteilung', help="Nur diese Abteilung")
+    args = parser.parse_args()
+
+    try:
+        conn = open_database(args.database)
+    except sqlite3.Error as e:
+        sys.stderr.buffer.write(f"FEHLER beim Öffnen der Datenbank: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        analyse = compute_staffing_coverage(conn, args.von, args.bis, args.minimum, args.abteilung,
+                                            dict(args.abteilung_minimum))
+        create_staffing_report(analyse, args.output)
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER bei der Besetzungsanalyse: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gemeinsame Styles der TeamFlow-Exporte
+
+Farben, Excel-Styles (openpyxl NamedStyle) und reportlab-Styles werden
+einmal pro Prozess erstellt und von allen Export-Scripts wiederverwendet.
+openpyxl bzw. reportlab werden erst beim ersten Zugriff importiert, der
+Excel-Export lädt also kein reportlab und umgekehrt.
+
+Excel-Zellen bekommen ihren Style über den Namen (cell.style = ...):
+openpyxl kopiert dann nur das vorberechnete Style-Tupel, statt pro Zelle
+Border/Font/Fill zu hashen und im Workbook nachzuschlagen.
+
+Die PDF-Styles verwenden die TrueType-Schriften aus export_fonts.
+"""
+
+from types import SimpleNamespace
+from functools import lru_cache
+
+
+# Farben (Hex ohne '#'), Abwesenheiten wie in der Kalenderansicht
+PRIMARY_COLOR = '1F538D'
+VACATION_COLOR = '28a745'
+SICKNESS_COLOR = 'dc3545'
+TRAINING_COLOR = '17a2b8'
+HOLIDAY_COLOR = '6f42c1'
+EVENT_COLOR = 'fd7e14'
+WEEKEND_COLOR = 'e9ecef'
+# Markierung geänderter Zellen im Delta-Export
+CHANGED_COLOR = 'fff3cd'
+
+# Namen der Excel-NamedStyles
+EXCEL_HEADER_STYLE = 'TeamFlow Kopfzeile'
+EXCEL_DATA_STYLE = 'TeamFlow Daten'
+
+
+@lru_cache(maxsize=None)
+def excel_styles():
+    """
+    Excel-Styles der Übersicht
+
+    header / data:     NamedStyles für Kopf- und Datenzellen
+    data_border_rule:  bedingte Formatierung mit Rahmen (Write-Only-Modus)
+    """
+    from openpyxl.styles import NamedStyle, Font, PatternFill, Alignment, Border, Side
+    from openpyxl.styles.fonts import DEFAULT_FONT
+    from openpyxl.formatting.rule import FormulaRule
+
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+    return SimpleNamespace(
+        header=NamedStyle(
+            name=EXCEL_HEADER_STYLE,
+            fill=PatternFill(start_color=PRIMARY_COLOR, end_color=PRIMARY_COLOR, fill_type='solid'),
+            font=Font(color='FFFFFF', bold=True, size=12),
+            alignment=Alignment(horizontal='center', vertical='center'),
+            border=border,
+        ),
+        # Datenzellen behalten die Standardschrift des Workbooks
+        data=NamedStyle(name=EXCEL_DATA_STYLE, font=DEFAULT_FONT, border=border),
+        data_border_rule=FormulaRule(formula=['TRUE'], border=border),
+    )
+
+
+def register_excel_styles(wb):
+    """
+    Registriert die NamedStyles im Workbook (einmal pro Workbook)
+
+    Die Style-Objekte werden dabei neu an das Workbook gebunden; Workbooks
+    werden nacheinander erstellt (Script bzw. Export-Server), nicht parallel.
+    """
+    styles = excel_styles()
+    for style in (styles.header, styles.data):
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+
+def _detail_table_commands(header_color, fonts):
+    """Tabellen der Detail-PDF (Urlaub / Abwesenheiten), nur die Header-Farbe unterscheidet sich"""
+    from reportlab.lib import colors
+
+    return [
+        # Header
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(f"#{header_color}")),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts.bold),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('TOPPADDING', (0, 0), (-1, 0), 8),
+
+        # Daten
+        ('FONTNAME', (0, 1), (-1, -1), fonts.regular),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('ALIGN', (0, 1), (2, -1), 'CENTER'),
+        ('ALIGN', (3, 1), (-1, -1), 'LEFT'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ('LEFTPADDING', (0, 0), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ]
+
+
+@lru_cache(maxsize=None)
+def pdf_styles():
+    """
+    reportlab-Styles für Übersichts- und Detail-PDF
+
+    Paragraph-Styles: overview_title, detail_title, subtitle, info, footer
+    TableStyles:      overview_table, vacation_table, absence_table, summary_table,
+                      heatmap_table
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    from export_fonts import pdf_fonts
+
+    sample = getSampleStyleSheet()
+    primary = colors.HexColor(f"#{PRIMARY_COLOR}")
+    fonts = pdf_fonts()
+
+    return SimpleNamespace(
+        overview_title=ParagraphStyle(
+            'CustomTitle',
+            parent=sample['Heading1'],
+            fontName=fonts.bold,
+            fontSize=18,
+            textColor=primary,
+            spaceAfter=20,
+            alignment=1  # Center
+        ),
+        detail_title=ParagraphStyle(
+            'CustomTitle',
+            parent=sample['Heading1'],
+            fontName=fonts.bold,
+            fontSize=18,
+            textColor=primary,
+            spaceAfter=12,
+            alignment=1  # Center
+        ),
+        subtitle=ParagraphStyle(
+            'CustomSubtitle',
+            parent=sample['Heading2'],
+            fontName=fonts.bold,
+            fontSize=14,
+            textColor=primary,
+            spaceAfter=10,
+            spaceBefore=15
+        ),
+        info=ParagraphStyle('InfoStyle', parent=sample['Normal'], fontName=fonts.regular, fontSize=11, spaceAfter=6),
+        footer=ParagraphStyle('Footer', parent=sample['Normal'], fontName=fonts.regular, fontSize=8,
+                              textColor=colors.grey),
+
+        overview_table=TableStyle([
+            # Header
+            ('BACKGROUND', (0, 0), (-1, 0), primary),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), fonts.bold),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+
+            # Daten
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('FONTNAME', (0, 1), (-1, -1), fonts.regular),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ]),
+        vacation_table=TableStyle(_detail_table_commands(VACATION_COLOR, fonts)),
+        absence_table=TableStyle(_detail_table_commands(PRIMARY_COLOR, fonts)),
+        # Jahresübersicht im Dossier: Zahlen rechtsbündig
+        summary_table=TableStyle(_detail_table_commands(PRIMARY_COLOR, fonts) + [
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+        ]),
+        # Abwesenheitsbericht: Zellfarben kommen pro Zelle dazu, Gesamtzeile fett
+        heatmap_table=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), primary),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), fonts.bold),
+            ('FONTNAME', (0, 1), (-1, -1), fonts.regular),
+            ('FONTNAME', (0, -1), (-1, -1), fonts.bold),
+            ('FONTSIZE', (0, 0), (-1, -1), 7),
+            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ]),
+    )
@@ -5,108 +5,407 @@ Excel-Export für TeamFlow
 Erstellt eine formatierte Excel-Datei aus Urlaubsdaten
 """
 
+import io
+import os
+import re
 import sys
-import json
+import zipfile
 from datetime import datetime
 from pathlib import Path
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor
+
+# Vor openpyxl, damit dessen Import-Zeit im Profil erscheint
+from export_profile import start_profile, span, timed_iter, record
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 except ImportError:
     print("FEHLER: openpyxl nicht installiert!", file=sys.stderr)
     print("Installiere mit: pip install openpyxl", file=sys.stderr)
     sys.exit(1)
 
+from export_input import read_rows, STDIN_PATH
+from export_rows import OverviewRow, overview_rows
+from export_cache import cached_export
+from export_columns import COLUMNS, TEXT_COLUMNS, ID_HEADER
+from export_raw import raw_format, create_raw
+from export_progress import report_progress, PROGRESS_ROWS
+from export_styles import excel_styles, register_excel_styles, EXCEL_HEADER_STYLE, EXCEL_DATA_STYLE
+
+
+# Layout-Version, bei Änderungen am Layout erhöhen (invalidiert den Export-Cache)
+TEMPLATE_VERSION = 3
+
+# Styles werden einmal pro Prozess erstellt (wichtig für den Export-Server)
+STYLES = excel_styles()
+
+
+# Ausgeblendete Spalte hinter den Daten mit der Mitarbeiter-ID, über die
+# ein Delta-Export (excel_delta.py) die Zeilen einer früheren Datei findet
+ID_COLUMN = len(COLUMNS) + 1
+
+SHEET_TITLE = "Urlaubsübersicht"
 
-def create_excel(data, output_path):
-    """Erstellt Excel-Datei mit formatierten Urlaubsdaten"""
+# Mappe mit einem Blatt pro Abteilung
+SUMMARY_TITLE = "Übersicht"
+NO_DEPARTMENT_TITLE = "Ohne Abteilung"
+TOTAL_LABEL = "Gesamt"
+# Excel erlaubt max. 31 Zeichen und keines von []:*?/\ im Blattnamen
+MAX_SHEET_TITLE = 31
+INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+# Leeres Blatt, wie openpyxl es schreibt; wird durch die Worker-Zeilen ersetzt
+EMPTY_DIMENSION = b'<dimension ref="A1:A1"/>'
+EMPTY_SHEET_DATA = b'<sheetData></sheetData>'
+
+
+def create_excel(data, output_path, streaming=False, departments=False, workers=None):
+    """
+    Erstellt Excel-Datei mit formatierten Urlaubsdaten
+
+    Mit streaming=True wird ein Write-Only-Workbook verwendet (siehe
+    create_excel_streaming), der Speicherbedarf bleibt dann konstant.
+    Mit departments=True entsteht ein Blatt pro Abteilung plus Übersicht
+    (siehe create_excel_by_department).
+
+    Gibt die Anzahl der geschriebenen Zeilen zurück.
+    """
+    if departments:
+        return create_excel_by_department(data, output_path, workers=workers)
+    if streaming:
+        return create_excel_streaming(data, output_path)
     
     wb = Workbook()
     ws = wb.active
-    ws.title = "Urlaubsübersicht"
-    
-    # Header-Style
-    header_fill = PatternFill(start_color="1F538D", end_color="1F538D", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True, size=12)
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    ws.title = SHEET_TITLE
     
     # Header schreiben
-    headers = ["Mitarbeiter", "Abteilung", "Anspruch", "Übertrag", "Verfügbar", "Genommen", "Rest", "Krank", "Schulung", "Überstunden"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
+    with span('styles'):
+        register_excel_styles(wb)
+        for col, (header, _, _, _) in enumerate(COLUMNS, 1):
+            ws.cell(row=1, column=col, value=header).style = EXCEL_HEADER_STYLE
+        ws.cell(row=1, column=ID_COLUMN, value=ID_HEADER)
     
-    # Daten schreiben
-    for row_idx, entry in enumerate(data, 2):
-        ws.cell(row=row_idx, column=1, value=entry.get('mitarbeiter', ''))
-        ws.cell(row=row_idx, column=2, value=entry.get('abteilung', ''))
-        ws.cell(row=row_idx, column=3, value=entry.get('urlaub_anspruch', 0))
-        ws.cell(row=row_idx, column=4, value=entry.get('urlaub_uebertrag', 0))
-        ws.cell(row=row_idx, column=5, value=entry.get('urlaub_verfuegbar', 0))
-        ws.cell(row=row_idx, column=6, value=entry.get('urlaub_genommen', 0))
-        ws.cell(row=row_idx, column=7, value=entry.get('urlaub_rest', 0))
-        ws.cell(row=row_idx, column=8, value=entry.get('krankheit', 0))
-        ws.cell(row=row_idx, column=9, value=entry.get('schulung', 0))
-        ws.cell(row=row_idx, column=10, value=entry.get('ueberstunden', 0))
-        
-        # Border für alle Zellen
-        for col in range(1, 11):
-            ws.cell(row=row_idx, column=col).border = border
+    # Daten schreiben (data darf auch ein Generator sein)
+    # Style über den Namen: keine Style-Objekte pro Zelle
+    row_idx = 1
+    with span('row_build'):
+        for row_idx, row in enumerate(overview_rows(data), 2):
+            for col, value in enumerate(row[1:], 1):
+                ws.cell(row=row_idx, column=col, value=value).style = EXCEL_DATA_STYLE
+            ws.cell(row=row_idx, column=ID_COLUMN, value=row[0])
+            if row_idx % PROGRESS_ROWS == 1:
+                report_progress(rows=row_idx - 1)
+        report_progress(rows=row_idx - 1)
     
     # Spaltenbreite anpassen
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 20
-    ws.column_dimensions['C'].width = 10
-    ws.column_dimensions['D'].width = 10
-    ws.column_dimensions['E'].width = 10
-    ws.column_dimensions['F'].width = 10
-    ws.column_dimensions['G'].width = 10
-    ws.column_dimensions['H'].width = 10
-    ws.column_dimensions['I'].width = 10
-    ws.column_dimensions['J'].width = 12
+    with span('styles'):
+        for col, (_, _, _, width) in enumerate(COLUMNS, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        ws.column_dimensions[get_column_letter(ID_COLUMN)].hidden = True
     
     # Speichern
-    wb.save(output_path)
+    with span('wb.save'):
+        wb.save(output_path)
     # Erfolg ohne Emojis ausgeben (Windows-kompatibel)
     sys.stdout.buffer.write(f"Excel erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return row_idx - 1
+
+
+def create_excel_streaming(data, output_path):
+    """
+    Erstellt die Excel-Datei mit konstantem Speicherbedarf
+
+    Nutzt ein Write-Only-Workbook von openpyxl: jede Zeile wird beim Lesen
+    direkt in das Sheet-XML geschrieben, es entsteht kein Zell-Objektgraph.
+    Datenzeilen werden als reine Werte angehängt; der Rahmen kommt aus einer
+    einzigen bedingten Formatierung über den gesamten Datenbereich statt aus
+    einem Border-Objekt pro Zelle.
+
+    Gibt die Anzahl der geschriebenen Zeilen zurück.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET_TITLE)
+    
+    with span('styles'):
+        register_excel_styles(wb)
+        # Spaltenbreiten müssen vor der ersten Zeile gesetzt werden
+        for col, (_, _, _, width) in enumerate(COLUMNS, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        ws.column_dimensions[get_column_letter(ID_COLUMN)].hidden = True
+        
+        # Header mit vorgefertigten Styles
+        header_cells = []
+        for header, _, _, _ in COLUMNS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = EXCEL_HEADER_STYLE
+            header_cells.append(cell)
+    
+    # Daten direkt beim Lesen anhängen
+    count = 0
+    with span('row_build'):
+        ws.append(header_cells + [ID_HEADER])
+        for row in overview_rows(data):
+            ws.append(row[1:] + row[:1])
+            count += 1
+            if count % PROGRESS_ROWS == 0:
+                report_progress(rows=count)
+        report_progress(rows=count)
+    
+    # Ein Rahmen-Style für alle Datenzellen
+    if count:
+        with span('styles'):
+            data_range = f"A2:{get_column_letter(len(COLUMNS))}{count + 1}"
+            ws.conditional_formatting.add(data_range, STYLES.data_border_rule)
+    
+    with span('wb.save'):
+        wb.save(output_path)
+    sys.stdout.buffer.write(f"Excel erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return count
+
+
+def _sheet_titles(departments):
+    """
+    Gültige, eindeutige Blattnamen für die Abteilungen
+
+    Excel vergleicht Blattnamen ohne Groß-/Kleinschreibung; Duplikate
+    (auch nach dem Kürzen) bekommen " (2)", " (3)", ... angehängt.
+    """
+    used = {SUMMARY_TITLE.casefold()}
+    titles = []
+    for department in departments:
+        base = INVALID_SHEET_CHARS.sub('_', department).strip("' ")[:MAX_SHEET_TITLE] or NO_DEPARTMENT_TITLE
+        title = base
+        suffix = 2
+        while title.casefold() in used:
+            tail = f" ({suffix})"
+            title = base[:MAX_SHEET_TITLE - len(tail)] + tail
+            suffix += 1
+        used.add(title.casefold())
+        titles.append(title)
+    return titles
+
+
+def cell_xml(ref, value, style_id):
+    """Eine Zelle als SpreadsheetML; Texte als Inline-String (keine gemeinsame String-Tabelle)"""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return f'<c r="{ref}" s="{style_id}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}" s="{style_id}"><v>{value}</v></c>'
+    text = escape(ILLEGAL_CHARACTERS_RE.sub('', str(value)))
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<c r="{ref}" s="{style_id}" t="inlineStr"><is><t{space}>{text}</t></is></c>'
+
+
+def _render_department_sheet(rows, header_id, data_id):
+    """
+    Worker: serialisiert Kopfzeile und Zeilen einer Abteilung
+
+    Gibt (dimension, sheetData) als UTF-8-Bytes sowie die Spaltensummen der
+    Zahlenspalten für die Übersicht zurück. Läuft im Prozess-Pool, daher nur
+    einfache Werte (Tupel, Zahlen, Bytes) als Ein- und Ausgabe.
+    """
+    letters = [get_column_letter(col) for col in range(1, len(COLUMNS) + 1)]
+    sums = [0] * (len(COLUMNS) - TEXT_COLUMNS)
+
+    parts = ['<sheetData><row r="1">']
+    parts.extend(cell_xml(f"{letter}1", header, header_id) for letter, (header, _, _, _) in zip(letters, COLUMNS))
+    parts.append('</row>')
+    for row_idx, values in enumerate(rows, 2):
+        parts.append(f'<row r="{row_idx}">')
+        parts.extend(cell_xml(f"{letter}{row_idx}", value, data_id) for letter, value in zip(letters, values))
+        parts.append('</row>')
+        for i, value in enumerate(values[TEXT_COLUMNS:]):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                sums[i] += value
+    parts.append('</sheetData>')
+
+    dimension = f'<dimension ref="A1:{letters[-1]}{len(rows) + 1}"/>'
+    return dimension.encode('utf-8'), ''.join(parts).encode('utf-8'), sums
+
+
+def _group_by_department(data):
+    """Zeilen als Wert-Tupel nach Abteilung gruppiert, Abteilungen alphabetisch, ohne Abteilung zuletzt"""
+    groups = {}
+    for row in overview_rows(data):
+        groups.setdefault(row.abteilung, []).append(row[1:])
+    return sorted(groups.items(), key=lambda item: (item[0] == '', item[0].casefold()))
+
+
+def create_excel_by_department(data, output_path, workers=None):
+    """
+    Erstellt eine Mappe mit Übersichtsblatt und einem Blatt pro Abteilung
+
+    Die Zeilen werden nach 'abteilung' gruppiert; das Sheet-XML jeder
+    Abteilung wird parallel in einem Prozess-Pool erzeugt (ein Worker pro
+    CPU, workers=1 rechnet im eigenen Prozess). Die Vorlage mit Styles,
+    Übersicht und leeren Abteilungsblättern schreibt openpyxl, danach
+    werden die Zeilen der Worker in die leeren Blätter eingesetzt.
+
+    Gibt die Anzahl der geschriebenen Zeilen zurück.
+    """
+    with span('row_build'):
+        groups = _group_by_department(data)
+    titles = _sheet_titles(department or NO_DEPARTMENT_TITLE for department, _ in groups)
+
+    wb = Workbook()
+    register_excel_styles(wb)
+    summary = wb.active
+    summary.title = SUMMARY_TITLE
+
+    # Style-IDs, die die Worker in ihre Zellen schreiben
+    summary_headers = ["Abteilung", "Mitarbeiter"] + [header for header, _, _, _ in COLUMNS[TEXT_COLUMNS:]]
+    for col, header in enumerate(summary_headers, 1):
+        summary.cell(row=1, column=col, value=header).style = EXCEL_HEADER_STYLE
+    header_id = summary.cell(row=1, column=1).style_id
+    probe = summary.cell(row=2, column=1)
+    probe.style = EXCEL_DATA_STYLE
+    data_id = probe.style_id
+
+    # Größte Abteilungen zuerst, damit kein Worker am Ende allein rechnet
+    order = sorted(range(len(groups)), key=lambda i: len(groups[i][1]), reverse=True)
+    workers = min(workers or os.cpu_count() or 1, max(len(groups), 1))
+    results = [None] * len(groups)
+    done = 0
+    with span('row_build'):
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {i: pool.submit(_render_department_sheet, groups[i][1], header_id, data_id) for i in order}
+                for i, future in futures.items():
+                    results[i] = future.result()
+                    done += len(groups[i][1])
+                    report_progress(rows=done)
+        else:
+            for i in order:
+                results[i] = _render_department_sheet(groups[i][1], header_id, data_id)
+                done += len(groups[i][1])
+                report_progress(rows=done)
+
+    # Übersicht: eine Zeile pro Abteilung plus Gesamtsumme
+    totals = [0] * (len(COLUMNS) - TEXT_COLUMNS)
+    row_idx = 1
+    for row_idx, ((department, rows), (_, _, sums)) in enumerate(zip(groups, results), 2):
+        values = [department or NO_DEPARTMENT_TITLE, len(rows)] + sums
+        for col, value in enumerate(values, 1):
+            summary.cell(row=row_idx, column=col, value=value).style = EXCEL_DATA_STYLE
+        totals = [a + b for a, b in zip(totals, sums)]
+    count = sum(len(rows) for _, rows in groups)
+    for col, value in enumerate([TOTAL_LABEL, count] + totals, 1):
+        summary.cell(row=row_idx + 1, column=col, value=value).style = EXCEL_HEADER_STYLE
+    summary_widths = [COLUMNS[1][3], 12] + [width for _, _, _, width in COLUMNS[TEXT_COLUMNS:]]
+    for col, width in enumerate(summary_widths, 1):
+        summary.column_dimensions[get_column_letter(col)].width = width
+    summary.freeze_panes = 'A2'
+
+    # Leere Abteilungsblätter mit Spaltenbreiten als Vorlage
+    sheets = []
+    for title in titles:
+        ws = wb.create_sheet(title)
+        for col, (_, _, _, width) in enumerate(COLUMNS, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        ws.freeze_panes = 'A2'
+        sheets.append(ws)
+
+    template = io.BytesIO()
+    with span('wb.save'):
+        wb.save(template)
+
+    # Sheet-XML der Worker in die Vorlage einsetzen
+    replacements = {ws.path.lstrip('/'): result for ws, result in zip(sheets, results)}
+    with span('file_write'), zipfile.ZipFile(template) as source, \
+            zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            content = source.read(item.filename)
+            if item.filename in replacements:
+                dimension, sheet_data, _ = replacements[item.filename]
+                if EMPTY_DIMENSION not in content or EMPTY_SHEET_DATA not in content:
+                    raise ValueError(f"Unerwartetes Vorlagen-Blatt: {item.filename}")
+                content = content.replace(EMPTY_DIMENSION, dimension, 1).replace(EMPTY_SHEET_DATA, sheet_data, 1)
+            target.writestr(item.filename, content)
+
+    sys.stdout.buffer.write(f"Excel erfolgreich erstellt: {output_path} ({len(groups)} Abteilungen)\n".encode('utf-8'))
+    return count
 
 
 def main():
-    if len(sys.argv) != 3:
+    # Optional: --streaming für konstanten Speicherbedarf bei großen Exporten,
+    # --departments für ein Blatt pro Abteilung,
+    # --previous <datei> [--highlight] für einen Delta-Export gegen eine frühere Übersicht,
+    # --profile / --profile-stats für Zeitmessung (siehe export_profile.py)
+    args = start_profile(sys.argv[1:])
+    streaming = '--streaming' in args
+    if streaming:
+        args.remove('--streaming')
+    departments = '--departments' in args
+    if departments:
+        args.remove('--departments')
+    highlight = '--highlight' in args
+    if highlight:
+        args.remove('--highlight')
+    previous = None
+    if '--previous' in args:
+        index = args.index('--previous')
+        previous = args[index + 1] if index + 1 < len(args) else ''
+        del args[index:index + 2]
+    
+    if len(args) != 2 or previous == '':
         print("FEHLER: Falsche Anzahl Parameter!", file=sys.stderr)
-        print("Usage: python export_to_excel.py <input.json> <output.xlsx>", file=sys.stderr)
+        print("Usage: python export_to_excel.py [--streaming] [--departments] [--profile|--profile-stats] "
+              "[--previous <alt.xlsx> [--highlight]] <input.json|-> <output.xlsx|.csv|.parquet|.arrow>", file=sys.stderr)
         sys.exit(1)
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file = args[0]
+    output_file = args[1]
+    record(output=output_file)
     
-    # JSON lesen - WICHTIG: UTF-8 explizit setzen
+    # JSON lesen - bei "-" wird NDJSON zeilenweise von stdin gestreamt
     try:
-        # Windows-kompatibles Öffnen mit UTF-8
-        import io
-        with io.open(input_file, 'r', encoding='utf-8-sig') as f:
-            content = f.read()
-            data = json.loads(content)
+        with span('json_parse'):
+            data = timed_iter('json_parse', read_rows(input_file, OverviewRow))
         
         # Logging ohne Emojis für Windows-Konsole - direkt auf buffer schreiben
-        sys.stdout.buffer.write(f"JSON gelesen: {len(data)} Eintraege\n".encode('utf-8'))
+        if input_file != STDIN_PATH:
+            sys.stdout.buffer.write(f"JSON gelesen: {len(data)} Eintraege\n".encode('utf-8'))
     except Exception as e:
         # Fehler direkt auf buffer schreiben
         sys.stderr.buffer.write(f"FEHLER beim Lesen der JSON: {str(e)}\n".encode('utf-8'))
         sys.exit(1)
     
+    # Rohdaten-Export (CSV/Parquet/Arrow) über die Dateiendung
+    if raw_format(output_file):
+        try:
+            count = create_raw(data, output_file)
+            record(rows=count)
+            if input_file == STDIN_PATH:
+                sys.stdout.buffer.write(f"NDJSON gelesen: {count} Eintraege\n".encode('utf-8'))
+        except Exception as e:
+            sys.stderr.buffer.write(f"FEHLER beim Erstellen der Rohdaten: {str(e)}\n".encode('utf-8'))
+            sys.exit(1)
+        return
+    
+    # Delta-Export: nur geänderte Zeilen der früheren Datei neu schreiben
+    if previous:
+        try:
+            from excel_delta import update_excel
+            counts = update_excel(previous, data, output_file, highlight=highlight)
+            record(rows=sum(counts.values()) - counts['entfernt'])
+        except Exception as e:
+            sys.stderr.buffer.write(f"FEHLER beim Aktualisieren der Excel: {str(e)}\n".encode('utf-8'))
+            sys.exit(1)
+        return
+    
     # Excel erstellen
     try:
-        create_excel(data, output_file)
+        count, _ = cached_export('excel', TEMPLATE_VERSION, create_excel, data, output_file,
+                                 streaming=streaming, departments=departments)
+        record(rows=count)
+        if input_file == STDIN_PATH:
+            sys.stdout.buffer.write(f"NDJSON gelesen: {count} Eintraege\n".encode('utf-8'))
     except Exception as e:
         sys.stderr.buffer.write(f"FEHLER beim Erstellen der Excel: {str(e)}\n".encode('utf-8'))
         sys.exit(1)
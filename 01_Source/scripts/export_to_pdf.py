@@ -3,127 +3,506 @@
 """
 PDF-Export für TeamFlow
 Erstellt eine formatierte PDF-Datei aus Urlaubsdaten
+
+Große Übersichten werden parallel gesetzt: die Seiten werden in Segmente
+zu SEGMENT_PAGES Seiten aufgeteilt, jedes Segment rendert ein Prozess des
+Pools. Die Worker liefern den fertigen Inhalt jeder Seite zurück, der
+Hauptprozess schreibt ihn der Reihe nach in ein einziges Dokument und
+setzt dort die Lesezeichen. Da jede Seite eine feste Zeilenzahl hat, sind
+Seitenzahlen ("Seite n von N") und Kopfzeilen schon vor dem Rendern
+bekannt. Mit --single-process bzw. workers=1 wird wie bisher in einem
+Prozess gerendert, das Ergebnis ist dasselbe.
+
+Das Zusammensetzen nutzt private Teile von reportlab (Seiteninhalt des
+Canvas, Schriften und PDF-Version des Dokuments). Es ist auf den
+Versionen in PARALLEL_REPORTLAB_VERSIONS geprüft; bei anderen Versionen
+oder fehlenden Attributen wird mit einer WARNUNG in einem Prozess
+gerendert (parallel_supported).
+
+Die TrueType-Teilschriften (export_fonts) vergeben Zeichencodes in der
+Reihenfolge der ersten Verwendung. Vor dem parallelen Rendern werden
+deshalb alle Zeichen der Übersicht in jedem Canvas in derselben
+Reihenfolge belegt, damit die Seiten der Worker zum Dokument passen.
 """
 
+import io
+import os
 import sys
-import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial, lru_cache
 from pathlib import Path
 
+# Vor reportlab, damit dessen Import-Zeit im Profil erscheint
+from export_profile import start_profile, span, timed_iter, record
+
 try:
+    from reportlab import Version as REPORTLAB_VERSION
     from reportlab.lib.pagesizes import A4, landscape
     from reportlab.lib import colors
     from reportlab.lib.units import cm
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen.canvas import Canvas
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer, PageBreak
 except ImportError:
     print("FEHLER: reportlab nicht installiert!", file=sys.stderr)
     print("Installiere mit: pip install reportlab", file=sys.stderr)
     sys.exit(1)
 
+from export_input import read_rows, STDIN_PATH
+from export_rows import OverviewRow, overview_rows
+from export_cache import cached_export
+from export_styles import pdf_styles
+from export_fonts import pdf_fonts, reserve_fonts, reserved_characters
+from export_progress import report_progress, report_page, PROGRESS_ROWS
 
-def create_pdf(data, output_path):
-    """Erstellt PDF-Datei mit formatierten Urlaubsdaten"""
-    
-    doc = SimpleDocTemplate(
+
+# Layout-Version, bei Änderungen am Layout erhöhen (invalidiert den Export-Cache)
+TEMPLATE_VERSION = 3
+
+# Styles werden einmal pro Prozess erstellt (wichtig für den Export-Server)
+_STYLES = pdf_styles()
+_FONTS = pdf_fonts()
+TITLE_STYLE = _STYLES.overview_title
+TABLE_STYLE = _STYLES.overview_table
+
+
+HEADER_ROW = ["Mitarbeiter", "Abteilung", "Anspruch", "Übertrag", "Verfügbar", "Genommen", "Rest", "Krank", "Schulung", "Überstd."]
+COL_WIDTHS = [4*cm, 3.5*cm, 2*cm, 2*cm, 2*cm, 2*cm, 2*cm, 2*cm, 2*cm, 2.5*cm]
+
+# Feste Zeilenhöhen (pt): Schrift + Padding aus TABLE_STYLE, gerundet
+HEADER_ROW_HEIGHT = 27  # 10pt Schrift, 3pt oben, 12pt unten
+DATA_ROW_HEIGHT = 16    # 8pt Schrift, je 3pt oben/unten
+
+# Standard-Padding des Frames von SimpleDocTemplate (oben + unten)
+FRAME_PADDING = 12
+
+# Kopf- und Fußzeile (in den Seitenrändern)
+PAGE_TITLE = "TeamFlow – Urlaubsübersicht"
+TITLE_TEXT = "Urlaubsübersicht"
+PAGE_TEXT_FONT = _FONTS.regular
+PAGE_TEXT_SIZE = 8
+HEADER_Y = 1*cm   # Abstand vom oberen Rand
+FOOTER_Y = 0.8*cm
+
+# Alle Schriften der Übersicht; werden in jedem Canvas in dieser Reihenfolge
+# registriert, damit die internen Namen (/F1, /F2) in allen Segmenten gleich sind
+PAGE_FONTS = (_FONTS.regular, _FONTS.bold)
+
+# Feste Texte und Ziffern, die außer den Zellen auf den Seiten stehen
+STATIC_TEXT = PAGE_TITLE + TITLE_TEXT + "Seite von 0123456789" + ''.join(HEADER_ROW)
+
+# Parallel-Rendering: Seiten pro Segment und ab welcher Zeilenzahl sich der Pool lohnt
+SEGMENT_PAGES = 25
+PARALLEL_MIN_ROWS = 10000
+
+# reportlab-Versionen, auf denen _render_parallel geprüft ist (Präfixe)
+PARALLEL_REPORTLAB_VERSIONS = ('5.0.',)
+
+# Flowables, die reportlab höchstens im Voraus sieht (für keepWithNext)
+LOOKAHEAD = 8
+
+
+def _table_row(row):
+    """Tabellenzeile aus einer OverviewRow (Tupel: bleibt bis zum Setzen im Speicher)"""
+    return (
+        row.mitarbeiter,
+        row.abteilung,
+        str(row.urlaub_anspruch),
+        str(row.urlaub_uebertrag),
+        str(row.urlaub_verfuegbar),
+        str(row.urlaub_genommen),
+        str(row.urlaub_rest),
+        str(row.krankheit),
+        str(row.schulung),
+        str(row.ueberstunden)
+    )
+
+
+def _create_doc(output_path):
+    return SimpleDocTemplate(
         output_path,
         pagesize=landscape(A4),
         topMargin=1.5*cm,
         bottomMargin=1.5*cm,
         leftMargin=1.5*cm,
-        rightMargin=1.5*cm
+        rightMargin=1.5*cm,
+        pageCompression=1
+    )
+
+
+def _title_elements():
+    return [Paragraph(TITLE_TEXT, TITLE_STYLE), Spacer(1, 0.5*cm)]
+
+
+def _rows_per_page(available_height):
+    """Anzahl Datenzeilen, die zusammen mit dem Header in die Höhe passen"""
+    return max(1, int((available_height - HEADER_ROW_HEIGHT) // DATA_ROW_HEIGHT))
+
+
+def _chunk_table(rows):
+    """Tabelle für eine Seite: wiederholter Header, feste Zeilenhöhen"""
+    table = Table(
+        [HEADER_ROW] + rows,
+        colWidths=COL_WIDTHS,
+        rowHeights=[HEADER_ROW_HEIGHT] + [DATA_ROW_HEIGHT] * len(rows),
+        repeatRows=1
+    )
+    with span('styles'):
+        table.setStyle(TABLE_STYLE)
+    return table
+
+
+def _page_title(rows):
+    """Laufende Kopfzeile bzw. Lesezeichen einer Seite: erster – letzter Mitarbeiter"""
+    if not rows:
+        return ""
+    return f"{rows[0][0]} – {rows[-1][0]}"
+
+
+def _register_fonts(canvas, characters=''):
+    reserve_fonts(canvas, PAGE_FONTS, STATIC_TEXT + characters)
+
+
+def _page_characters(pages):
+    """Alle Zeichen der Zellen (für _register_fonts)"""
+    characters = set()
+    for rows in pages:
+        for row in rows:
+            characters.update(*row)
+    return ''.join(characters)
+
+
+def _add_bookmark(canvas, number, title):
+    key = f"seite_{number}"
+    canvas.bookmarkPage(key)
+    canvas.addOutlineEntry(f"Seite {number}: {title}" if title else f"Seite {number}", key, level=0)
+
+
+class _PageDecorator:
+    """
+    onPage-Callback: Kopfzeile, "Seite n von N" und Lesezeichen
+
+    first_page verschiebt die Seitenzahl, wenn ein Segment nicht mit
+    Seite 1 beginnt. Lesezeichen gehören zum Dokument, nicht zum
+    Seiteninhalt; beim parallelen Rendern setzt sie der Hauptprozess.
+    """
+
+    def __init__(self, titles, total_pages, first_page=1, bookmarks=True):
+        self.titles = titles
+        self.total_pages = total_pages
+        self.first_page = first_page
+        self.bookmarks = bookmarks
+
+    def __call__(self, canvas, doc):
+        number = self.first_page + doc.page - 1
+        title = self.titles[doc.page - 1] if doc.page <= len(self.titles) else ""
+        width, height = doc.pagesize
+
+        canvas.saveState()
+        canvas.setFont(PAGE_TEXT_FONT, PAGE_TEXT_SIZE)
+        canvas.setFillColor(colors.grey)
+        canvas.drawString(doc.leftMargin, height - HEADER_Y, PAGE_TITLE)
+        canvas.drawRightString(width - doc.rightMargin, height - HEADER_Y, title)
+        canvas.drawCentredString(width / 2, FOOTER_Y, f"Seite {number} von {self.total_pages}")
+        canvas.restoreState()
+
+        if self.bookmarks:
+            _add_bookmark(canvas, number, title)
+        report_page(canvas, doc)
+
+
+class LazyFlowables(list):
+    """
+    Flowable-Liste für doc.build(), die sich aus einem Generator nachfüllt
+
+    reportlab arbeitet die Liste von vorne ab (len(), [0], del [0] und
+    Einfügen geteilter Flowables am Anfang). len() holt vorher so viele
+    Elemente aus dem Generator, dass LOOKAHEAD Stück bereitliegen.
+    """
+
+    def __init__(self, iterable):
+        super().__init__()
+        self._source = iter(iterable)
+
+    def __len__(self):
+        while self._source is not None and super().__len__() < LOOKAHEAD:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+        return super().__len__()
+
+
+def _iter_page_elements(pages, with_title):
+    if with_title:
+        yield from _title_elements()
+    for index, rows in enumerate(pages):
+        if index:
+            yield PageBreak()
+        yield _chunk_table(rows)
+
+
+def _page_elements(pages, with_title):
+    """
+    Flowables für Seiten mit festen Zeilenzahlen, je Seite eine Tabelle
+
+    Die Tabellen entstehen erst, wenn reportlab beim Setzen bei ihrer
+    Seite ankommt; im Speicher liegen bis dahin nur die Zeilen.
+    """
+    return LazyFlowables(_iter_page_elements(pages, with_title))
+
+
+class _FontCanvas(Canvas):
+    """Canvas mit vorab belegten Schriften (siehe _register_fonts)"""
+
+    def __init__(self, *args, characters='', **kwargs):
+        super().__init__(*args, **kwargs)
+        _register_fonts(self, characters)
+
+
+class _SegmentCanvas(_FontCanvas):
+    """Canvas eines Workers: sammelt den Inhalt jeder Seite, statt eine Datei zu schreiben"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_codes = []
+
+    def showPage(self):
+        self.page_codes.append('\n'.join(self._code))
+        super().showPage()
+
+    def save(self):
+        pass
+
+
+def _render_segment(first_page, total_pages, pages, titles, characters):
+    """
+    Worker: setzt die Seiten first_page.. und gibt (Schriften, PDF-Version, Seiteninhalte) zurück
+
+    Die Seiten bestehen nur aus Text, Linien und Flächen; deren Inhalt
+    hängt außer von den Schriftnamen und Zeichencodes von keinen
+    Dokument-Ressourcen ab. Schriften sind die internen Namen und die
+    Anzahl belegter Zeichencodes; beides muss zum Hauptdokument passen.
+    """
+    doc = _create_doc(None)
+    decorator = _PageDecorator(titles, total_pages, first_page, bookmarks=False)
+    doc.build(_page_elements(pages, first_page == 1),
+              onFirstPage=decorator, onLaterPages=decorator, canvasmaker=partial(_SegmentCanvas, characters=characters))
+    codes = doc.canv.page_codes
+    if len(codes) != len(pages):
+        raise RuntimeError(f"Segment ab Seite {first_page}: {len(codes)} statt {len(pages)} Seiten gesetzt")
+    pdf_doc = doc.canv._doc
+    return (dict(pdf_doc.fontMapping), reserved_characters(doc.canv, PAGE_FONTS)), pdf_doc._pdfVersion, codes
+
+
+def _render_parallel(doc, pages, titles, characters, workers):
+    """Rendert Segmente im Prozess-Pool und schreibt die Seiten der Reihe nach in ein Dokument"""
+    canvas = doc._makeCanvas()
+    _register_fonts(canvas, characters)
+    fonts = (dict(canvas._doc.fontMapping), reserved_characters(canvas, PAGE_FONTS))
+    total_pages = len(pages)
+
+    segments = (
+        (start + 1, total_pages, pages[start:start + SEGMENT_PAGES], titles[start:start + SEGMENT_PAGES], characters)
+        for start in range(0, total_pages, SEGMENT_PAGES)
     )
+    number = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Nur wenige Segmente im Voraus, damit fertige Seiten nicht im Speicher warten
+        pending = deque()
+
+        def submit_next():
+            segment = next(segments, None)
+            if segment is not None:
+                pending.append(pool.submit(_render_segment, *segment))
+
+        try:
+            for _ in range(workers * 2):
+                submit_next()
+            while pending:
+                segment_fonts, pdf_version, codes = pending.popleft().result()
+                submit_next()
+                if segment_fonts != fonts:
+                    raise RuntimeError(f"Schriften der Segmente weichen ab: {segment_fonts} / {fonts}")
+                # z.B. 1.4, sobald reportlab Transparenz-Operatoren verwendet
+                canvas._doc._pdfVersion = max(canvas._doc._pdfVersion, pdf_version)
+                for code in codes:
+                    number += 1
+                    canvas.addLiteral(code)
+                    _add_bookmark(canvas, number, titles[number - 1])
+                    canvas.showPage()
+                report_progress(pages=number)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    canvas.save()
+
+
+@lru_cache(maxsize=None)
+def parallel_supported():
+    """
+    Prüft reportlab auf die privaten Teile, auf denen _render_parallel aufbaut
+
+    Version aus PARALLEL_REPORTLAB_VERSIONS, SimpleDocTemplate._makeCanvas,
+    Canvas._code (Seiteninhalt), Canvas.addLiteral und _doc.fontMapping /
+    _doc._pdfVersion des Dokuments.
+    """
+    if not REPORTLAB_VERSION.startswith(PARALLEL_REPORTLAB_VERSIONS):
+        return False
+    probe = Canvas(io.BytesIO())
+    pdf_doc = getattr(probe, '_doc', None)
+    return (callable(getattr(SimpleDocTemplate, '_makeCanvas', None))
+            and callable(getattr(probe, 'addLiteral', None))
+            and isinstance(getattr(probe, '_code', None), list)
+            and isinstance(getattr(pdf_doc, 'fontMapping', None), dict)
+            and hasattr(pdf_doc, '_pdfVersion'))
+
+
+def _worker_count(workers, count):
+    """None: ein Worker pro CPU, aber nur bei großen Übersichten"""
+    if workers is None:
+        workers = (os.cpu_count() or 1) if count >= PARALLEL_MIN_ROWS else 1
+    return max(1, workers)
+
+
+def create_pdf(data, output_path, paginate=True, workers=None):
+    """
+    Erstellt PDF-Datei mit formatierten Urlaubsdaten
+
+    Standardmäßig wird die Tabelle in seitengroße Blöcke mit festen
+    Zeilenhöhen aufgeteilt, sodass reportlab weder Zellen vermessen noch
+    Tabellen teilen muss. paginate=False erzeugt die frühere Einzeltabelle.
+
+    workers: Prozesse für das Rendern der Seiten (1 = Einzelprozess,
+    None = automatisch ab PARALLEL_MIN_ROWS Zeilen).
+
+    Gibt die Anzahl der geschriebenen Zeilen zurück.
+    """
+    if not paginate:
+        return _create_pdf_single_table(data, output_path)
     
-    elements = []
-    styles = getSampleStyleSheet()
+    doc = _create_doc(output_path)
     
-    # Titel
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1F538D'),
-        spaceAfter=20,
-        alignment=1  # Center
-    )
+    # Platz auf Seite 1 abzüglich Titel, auf Folgeseiten der volle Frame
+    frame_height = doc.height - FRAME_PADDING
+    title_height = 0
+    for element in _title_elements():
+        _, height = element.wrap(doc.width, frame_height)
+        title_height += height + element.getSpaceBefore() + element.getSpaceAfter()
     
-    title = Paragraph("Urlaubsübersicht", title_style)
-    elements.append(title)
-    elements.append(Spacer(1, 0.5*cm))
+    chunk_size = _rows_per_page(frame_height - title_height)
+    full_page_size = _rows_per_page(frame_height)
     
-    # Tabelle erstellen
-    table_data = [["Mitarbeiter", "Abteilung", "Anspruch", "Übertrag", "Verfügbar", "Genommen", "Rest", "Krank", "Schulung", "Überstd."]]
+    # Seiten direkt beim Lesen bilden (data darf auch ein Generator sein);
+    # gehalten werden nur die Zeilen, die Tabellen entstehen erst beim Setzen
+    count = 0
+    pages = []
+    rows = []
+    next_report = PROGRESS_ROWS
+    with span('row_build'):
+        for row in overview_rows(data):
+            rows.append(_table_row(row))
+            count += 1
+            if len(rows) == chunk_size:
+                pages.append(rows)
+                rows = []
+                chunk_size = full_page_size
+                if count >= next_report:
+                    report_progress(rows=count)
+                    next_report += PROGRESS_ROWS
+        
+        if rows or count == 0:
+            pages.append(rows)
     
-    for entry in data:
-        table_data.append([
-            entry.get('mitarbeiter', ''),
-            entry.get('abteilung', ''),
-            str(entry.get('urlaub_anspruch', 0)),
-            str(entry.get('urlaub_uebertrag', 0)),
-            str(entry.get('urlaub_verfuegbar', 0)),
-            str(entry.get('urlaub_genommen', 0)),
-            str(entry.get('urlaub_rest', 0)),
-            str(entry.get('krankheit', 0)),
-            str(entry.get('schulung', 0)),
-            str(entry.get('ueberstunden', 0))
-        ])
+    report_progress(rows=count)
+    titles = [_page_title(rows) for rows in pages]
+    workers = _worker_count(workers, count)
+    if workers > 1 and len(pages) > SEGMENT_PAGES and not parallel_supported():
+        sys.stderr.buffer.write(
+            f"WARNUNG: Paralleles Rendern mit reportlab {REPORTLAB_VERSION} nicht geprüft, "
+            f"rendere in einem Prozess\n".encode('utf-8'))
+        workers = 1
+    record(workers=workers)
     
-    table = Table(table_data, colWidths=[4*cm, 3.5*cm, 2*cm, 2*cm, 2*cm, 2*cm, 2*cm, 2*cm, 2*cm, 2.5*cm])
+    # PDF erstellen; Zeichen wie beim parallelen Rendern vorab belegen,
+    # damit beide Wege dieselbe Datei ergeben
+    with span('doc.build'):
+        characters = _page_characters(pages) + ''.join(titles)
+        if workers > 1 and len(pages) > SEGMENT_PAGES:
+            _render_parallel(doc, pages, titles, characters, workers)
+        else:
+            decorator = _PageDecorator(titles, len(pages))
+            doc.build(_page_elements(pages, True), onFirstPage=decorator, onLaterPages=decorator,
+                      canvasmaker=partial(_FontCanvas, characters=characters))
+    sys.stdout.buffer.write(f"PDF erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return count
+
+
+def _create_pdf_single_table(data, output_path):
+    """Bisheriger Weg: eine große Tabelle, reportlab vermisst und teilt selbst"""
+    doc = _create_doc(output_path)
+    elements = _title_elements()
     
-    # Tabellen-Style
-    table.setStyle(TableStyle([
-        # Header
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F538D')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    # Tabelle erstellen
+    table_data = [HEADER_ROW]
+    with span('row_build'):
+        for row in overview_rows(data):
+            table_data.append(_table_row(row))
         
-        # Daten
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-    ]))
+        table = Table(table_data, colWidths=COL_WIDTHS)
+    
+    # Tabellen-Style
+    with span('styles'):
+        table.setStyle(TABLE_STYLE)
     
     elements.append(table)
     
     # PDF erstellen
-    doc.build(elements)
+    with span('doc.build'):
+        doc.build(elements, onFirstPage=report_page, onLaterPages=report_page)
     sys.stdout.buffer.write(f"PDF erfolgreich erstellt: {output_path}\n".encode('utf-8'))
+    return len(table_data) - 1
 
 
 def main():
-    if len(sys.argv) != 3:
+    # Optional: --profile / --profile-stats für Zeitmessung (siehe export_profile.py)
+    args = start_profile(sys.argv[1:])
+    # Optional: --single-process rendert ohne Prozess-Pool
+    single_process = '--single-process' in args
+    if single_process:
+        args.remove('--single-process')
+    
+    if len(args) != 2:
         print("FEHLER: Falsche Anzahl Parameter!", file=sys.stderr)
-        print("Usage: python export_to_pdf.py <input.json> <output.pdf>", file=sys.stderr)
+        print("Usage: python export_to_pdf.py [--profile|--profile-stats] [--single-process] <input.json|-> <output.pdf>", file=sys.stderr)
         sys.exit(1)
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file = args[0]
+    output_file = args[1]
+    record(output=output_file)
     
-    # JSON lesen
+    # JSON lesen - bei "-" wird NDJSON zeilenweise von stdin gestreamt
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        sys.stdout.buffer.write(f"JSON gelesen: {len(data)} Eintraege\n".encode('utf-8'))
+        with span('json_parse'):
+            data = timed_iter('json_parse', read_rows(input_file, OverviewRow))
+        if input_file != STDIN_PATH:
+            sys.stdout.buffer.write(f"JSON gelesen: {len(data)} Eintraege\n".encode('utf-8'))
     except Exception as e:
         sys.stderr.buffer.write(f"FEHLER beim Lesen der JSON: {str(e)}\n".encode('utf-8'))
         sys.exit(1)
     
     # PDF erstellen
     try:
-        create_pdf(data, output_file)
+        create = partial(create_pdf, workers=1) if single_process else create_pdf
+        count, _ = cached_export('pdf', TEMPLATE_VERSION, create, data, output_file)
+        record(rows=count)
+        if input_file == STDIN_PATH:
+            sys.stdout.buffer.write(f"NDJSON gelesen: {count} Eintraege\n".encode('utf-8'))
     except Exception as e:
         sys.stderr.buffer.write(f"FEHLER beim Erstellen der PDF: {str(e)}\n".encode('utf-8'))
         sys.exit(1)
 
-
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Jahresplaner-Export für TeamFlow (Gantt-Raster)
+Eine Zeile pro Mitarbeiter, eine Spalte pro Tag des Jahres; Urlaub,
+Krankheit, Schulung, Feiertage und Veranstaltungen sind farbig markiert.
+
+Die Zeiträume werden aus der Datenbank gelesen und mit numpy in ein
+Tages-Array pro Mitarbeiter gerastert (Differenz-Array + cumsum, keine
+Schleife über Tage). Die Zellen des Rasters bleiben leer: jede Farbe ist
+eine einzige bedingte Formatierung, deren Bereich die zusammenhängenden
+Läufe aufzählt (z.B. "C3:P3 AB7:AF7"). Feiertage, Veranstaltungen und
+Wochenenden gelten für alle Mitarbeiter und werden als Spaltenbereiche
+ausgegeben.
+
+Usage: python export_year_grid.py <datenbank> <jahr> <output.xlsx> [--abteilung NAME]
+"""
+
+import sys
+import sqlite3
+import argparse
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.styles import PatternFill
+    from openpyxl.formatting.rule import FormulaRule
+    from openpyxl.utils import get_column_letter
+except ImportError:
+    print("FEHLER: openpyxl nicht installiert!", file=sys.stderr)
+    print("Installiere mit: pip install openpyxl", file=sys.stderr)
+    sys.exit(1)
+
+from export_from_db import open_database
+from export_styles import (
+    register_excel_styles, EXCEL_HEADER_STYLE, EXCEL_DATA_STYLE,
+    VACATION_COLOR, SICKNESS_COLOR, TRAINING_COLOR, HOLIDAY_COLOR, EVENT_COLOR, WEEKEND_COLOR,
+)
+
+
+# Codes im Tages-Array; bei Überschneidungen gewinnt der höhere Code
+FREI = 0
+SCHULUNG = 1
+URLAUB = 2
+KRANKHEIT = 3
+
+# Legende und Farben in Prioritätsreihenfolge (höchste zuerst)
+PERSONAL_CODES = [(KRANKHEIT, "Krankheit", SICKNESS_COLOR), (URLAUB, "Urlaub", VACATION_COLOR), (SCHULUNG, "Schulung", TRAINING_COLOR)]
+GLOBAL_LAYERS = [("Feiertag", HOLIDAY_COLOR), ("Veranstaltung", EVENT_COLOR), ("Wochenende", WEEKEND_COLOR)]
+
+MONATE = ['Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
+          'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember']
+
+SHEET_TITLE = "Jahresplaner"
+FIRST_DAY_COLUMN = 3   # A: Mitarbeiter, B: Abteilung
+FIRST_ROW = 3          # Zeile 1: Monate, Zeile 2: Tage
+DAY_COLUMN_WIDTH = 3.3
+
+
+def _day_offsets(dates, jahr):
+    """ISO-Daten als Tagesindex relativ zum 1.1. des Jahres (vektorisiert)"""
+    return (np.array(dates, dtype='datetime64[D]') - np.datetime64(f"{jahr:04d}-01-01")).astype(np.int64)
+
+
+def rasterize(rows, start, end, shape):
+    """
+    Markiert die Tage [start, end] jeder Zeile (inklusive)
+
+    rows, start, end sind gleich lange Integer-Arrays; Zeiträume außerhalb
+    des Rasters werden abgeschnitten. Pro Zeitraum nur +1/-1 in einem
+    Differenz-Array, danach eine kumulative Summe über die Tage.
+    """
+    anzahl, tage = shape
+    start = np.clip(start, 0, tage)
+    end = np.clip(end + 1, 0, tage)
+    valid = start < end
+    diff = np.zeros((anzahl, tage + 1), dtype=np.int32)
+    np.add.at(diff, (rows[valid], start[valid]), 1)
+    np.add.at(diff, (rows[valid], end[valid]), -1)
+    return np.cumsum(diff[:, :tage], axis=1) > 0
+
+
+def find_runs(grid):
+    """
+    Zusammenhängende Läufe gleicher Codes != FREI
+
+    Gibt Arrays (zeile, erster_tag, letzter_tag, code) zurück, zeilenweise
+    sortiert. Die Grenzen werden auf dem mit FREI aufgefüllten Raster
+    gesucht, daher hat jeder Lauf eine Folgegrenze in derselben Zeile.
+    """
+    anzahl, tage = grid.shape
+    padded = np.zeros((anzahl, tage + 2), dtype=grid.dtype)
+    padded[:, 1:-1] = grid
+    bounds = np.flatnonzero(padded[:, 1:] != padded[:, :-1])
+    rows, cols = np.divmod(bounds, tage + 1)
+    codes = padded[rows, cols + 1]
+    starts = np.flatnonzero(codes != FREI)
+    return rows[starts], cols[starts], cols[starts + 1] - 1, codes[starts]
+
+
+def _column_runs(mask):
+    """Läufe True-Werte eines 1D-Tagesarrays als (erster_tag, letzter_tag)"""
+    _, first, last, _ = find_runs(mask[np.newaxis, :].astype(np.uint8))
+    return list(zip(first.tolist(), last.tolist()))
+
+
+def load_year_grid(conn, jahr, abteilung=None):
+    """
+    Liest Mitarbeiter und Zeiträume des Jahres und rastert sie
+
+    Mitarbeiter wie in der Kalenderansicht (aktiv, nach Abteilung und Name).
+    Schulungen dauern wie dort floor(dauer_tage) Kalendertage, mindestens
+    aber einen Tag.
+    """
+    tage = (date(jahr + 1, 1, 1) - date(jahr, 1, 1)).days
+    jahr_start, jahr_ende = f"{jahr:04d}-01-01", f"{jahr:04d}-12-31"
+
+    sql = """
+        SELECT m.id, m.vorname, m.nachname, a.name AS abteilung_name
+        FROM mitarbeiter m
+        LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV'
+    """
+    params = []
+    if abteilung and abteilung != 'Alle':
+        sql += " AND a.name = ?"
+        params.append(abteilung)
+    sql += " ORDER BY a.name, m.nachname, m.vorname"
+    mitarbeiter = conn.execute(sql, params).fetchall()
+    index = {ma['id']: i for i, ma in enumerate(mitarbeiter)}
+
+    grid = np.zeros((len(mitarbeiter), tage), dtype=np.uint8)
+    queries = [
+        (SCHULUNG, """
+            SELECT mitarbeiter_id, datum, bis_datum FROM (
+                SELECT mitarbeiter_id, datum,
+                       date(datum, '+' || (MAX(CAST(dauer_tage AS INTEGER), 1) - 1) || ' days') AS bis_datum
+                FROM schulung
+            ) WHERE datum <= ? AND bis_datum >= ?
+        """),
+        (URLAUB, "SELECT mitarbeiter_id, von_datum, bis_datum FROM urlaub WHERE von_datum <= ? AND bis_datum >= ?"),
+        (KRANKHEIT, "SELECT mitarbeiter_id, von_datum, bis_datum FROM krankheit WHERE von_datum <= ? AND bis_datum >= ?"),
+    ]
+    # Aufsteigende Priorität: spätere Codes überschreiben frühere
+    for code, query in queries:
+        eintraege = [(index[ma_id], von, bis) for ma_id, von, bis in conn.execute(query, (jahr_ende, jahr_start))
+                     if ma_id in index]
+        if not eintraege:
+            continue
+        rows, von, bis = zip(*eintraege)
+        covered = rasterize(np.array(rows), _day_offsets(von, jahr), _day_offsets(bis, jahr), grid.shape)
+        grid[covered] = code
+
+    feiertage = np.zeros(tage, dtype=bool)
+    tage_feiertage = [datum for (datum,) in conn.execute(
+        "SELECT datum FROM feiertage WHERE datum BETWEEN ? AND ?", (jahr_start, jahr_ende))]
+    if tage_feiertage:
+        feiertage[_day_offsets(tage_feiertage, jahr)] = True
+
+    veranstaltungen = np.zeros(tage, dtype=bool)
+    zeitraeume = conn.execute(
+        "SELECT von_datum, bis_datum FROM veranstaltungen WHERE von_datum <= ? AND bis_datum >= ?",
+        (jahr_ende, jahr_start)).fetchall()
+    if zeitraeume:
+        von, bis = zip(*zeitraeume)
+        veranstaltungen = rasterize(np.zeros(len(von), dtype=np.int64), _day_offsets(von, jahr),
+                                    _day_offsets(bis, jahr), (1, tage))[0]
+
+    # Montag = 0 wie date.weekday()
+    wochentage = (np.arange(tage) + date(jahr, 1, 1).weekday()) % 7
+
+    return SimpleNamespace(
+        jahr=jahr,
+        mitarbeiter=[(f"{ma['vorname']} {ma['nachname']}", ma['abteilung_name'] or '') for ma in mitarbeiter],
+        grid=grid,
+        feiertage=feiertage,
+        veranstaltungen=veranstaltungen,
+        wochenende=wochentage >= 5,
+    )
+
+
+def _fill_rule(color):
+    fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
+    return FormulaRule(formula=['TRUE'], fill=fill)
+
+
+def create_year_grid_excel(planer, output_path):
+    """
+    Schreibt das Raster als Excel-Datei
+
+    Gibt die Anzahl der Mitarbeiter-Zeilen zurück.
+    """
+    anzahl, tage = planer.grid.shape
+    letters = [get_column_letter(FIRST_DAY_COLUMN + tag) for tag in range(tage)]
+    last_row = FIRST_ROW + max(anzahl, 1) - 1
+
+    wb = Workbook()
+    register_excel_styles(wb)
+    ws = wb.active
+    ws.title = f"{SHEET_TITLE} {planer.jahr}"
+
+    # Kopf: Monate (verbunden über ihre Tage) und Tagesnummern
+    for col, header in ((1, "Mitarbeiter"), (2, "Abteilung")):
+        ws.cell(row=1, column=col, value=header).style = EXCEL_HEADER_STYLE
+        ws.cell(row=2, column=col).style = EXCEL_HEADER_STYLE
+        ws.merge_cells(start_row=1, start_column=col, end_row=2, end_column=col)
+    tag = 0
+    for monat, name in enumerate(MONATE, 1):
+        monatstage = (date(planer.jahr + monat // 12, monat % 12 + 1, 1) - date(planer.jahr, monat, 1)).days
+        first = FIRST_DAY_COLUMN + tag
+        ws.cell(row=1, column=first, value=name).style = EXCEL_HEADER_STYLE
+        ws.merge_cells(start_row=1, start_column=first, end_row=1, end_column=first + monatstage - 1)
+        for nummer in range(1, monatstage + 1):
+            ws.cell(row=2, column=FIRST_DAY_COLUMN + tag, value=nummer).style = EXCEL_HEADER_STYLE
+            tag += 1
+
+    for row_idx, (name, abteilung) in enumerate(planer.mitarbeiter, FIRST_ROW):
+        ws.cell(row=row_idx, column=1, value=name).style = EXCEL_DATA_STYLE
+        ws.cell(row=row_idx, column=2, value=abteilung).style = EXCEL_DATA_STYLE
+
+    # Persönliche Läufe: ein Bereich pro Lauf, eine Regel pro Farbe
+    rows, first, last, codes = find_runs(planer.grid)
+    rows = (rows + FIRST_ROW).tolist()
+    first = first.tolist()
+    last = last.tolist()
+    codes = codes.tolist()
+    ranges = {code: [] for code, _, _ in PERSONAL_CODES}
+    for row, von, bis, code in zip(rows, first, last, codes):
+        ranges[code].append(f"{letters[von]}{row}:{letters[bis]}{row}")
+    for code, _, color in PERSONAL_CODES:
+        if ranges[code]:
+            ws.conditional_formatting.add(' '.join(ranges[code]), _fill_rule(color))
+
+    # Spaltenbereiche für alle Mitarbeiter (niedrigere Priorität)
+    for (_, color), mask in zip(GLOBAL_LAYERS, (planer.feiertage, planer.veranstaltungen, planer.wochenende)):
+        spalten = [f"{letters[von]}{FIRST_ROW}:{letters[bis]}{last_row}" for von, bis in _column_runs(mask)]
+        if spalten:
+            ws.conditional_formatting.add(' '.join(spalten), _fill_rule(color))
+
+    # Legende unter dem Raster
+    legend_row = last_row + 2
+    legende = [(label, color) for _, label, color in PERSONAL_CODES] + GLOBAL_LAYERS
+    for offset, (label, color) in enumerate(legende):
+        ws.cell(row=legend_row + offset, column=1, value=label)
+        ws.cell(row=legend_row + offset, column=2).fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 20
+    for letter in letters:
+        ws.column_dimensions[letter].width = DAY_COLUMN_WIDTH
+    ws.freeze_panes = ws.cell(row=FIRST_ROW, column=FIRST_DAY_COLUMN)
+
+    wb.save(output_path)
+    sys.stdout.buffer.write(f"Jahresplaner erfolgreich erstellt: {output_path} ({len(rows)} Zeitraeume)\n".encode('utf-8'))
+    return anzahl
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TeamFlow-Jahresplaner (Excel-Raster) aus der Datenbank")
+    parser.add_argument('database', help="Pfad zur TeamFlow-Datenbank")
+    parser.add_argument('jahr', type=int, help="Jahr des Planers")
+    parser.add_argument('output', help="Ausgabedatei (.xlsx)")
+    parser.add_argument('--abteilung', help="Nur diese Abteilung exportieren")
+    args = parser.parse_args()
+
+    try:
+        conn = open_database(args.database)
+    except sqlite3.Error as e:
+        sys.stderr.buffer.write(f"FEHLER beim Öffnen der Datenbank: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        planer = load_year_grid(conn, args.jahr, args.abteilung)
+        create_year_grid_excel(planer, args.output)
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Erstellen des Jahresplaners: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
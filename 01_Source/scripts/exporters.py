@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Export-Formate von TeamFlow: Registry und gemeinsame Kommandozeile
+
+Jedes Ausgabeformat ist in EXPORTERS mit Modul und Funktion eingetragen.
+Das Modul wird erst beim ersten Export dieses Formats importiert: ein
+CSV-Export lädt weder openpyxl noch reportlab, ein PDF-Export kein
+openpyxl, der Import dieses Moduls selbst nur die Standardbibliothek
+(geprüft von benchmarks/check_import_time.py).
+
+Formate:
+    xlsx                    export_to_excel.create_excel
+                            (Optionen streaming, departments, workers)
+    pdf                     export_to_pdf.create_pdf (Option workers)
+    detail                  export_employee_detail.create_detail_pdf
+                            (Eingabe {employee, vacation, absence})
+    csv, parquet, arrow     export_raw.create_raw
+
+Ohne --format wird das Format aus der Dateiendung der Ausgabe bestimmt
+(.pdf ist die Übersicht, die Detail-PDF braucht --format detail).
+Die Einzel-Scripts (export_to_excel.py, export_to_pdf.py, ...) bleiben
+mit ihren bisherigen Parametern erhalten.
+
+Der Fortschritt wird als JSON-Zeile {"event": "progress", ...} auf stdout
+gemeldet (siehe export_progress.print_progress), wie beim Export-Server.
+
+Usage: python exporters.py [--format xlsx|pdf|detail|csv|parquet|arrow]
+                           [--streaming] [--departments] [--single-process]
+                           [--profile|--profile-stats] <input.json|-> <output>
+"""
+
+import sys
+import importlib
+from pathlib import Path
+from collections import namedtuple
+
+from export_profile import start_profile, span, timed_iter, record
+from export_progress import progress_receiver, print_progress
+
+
+# module/function: Export-Funktion (data, output_path, **options)
+# reader:  'rows' (Übersichtszeilen) oder 'detail' (ein Mitarbeiter)
+# cache:   Export-Typ für den Ergebnis-Cache, None ohne Cache
+# options: erlaubte Optionen
+# label:   Bezeichnung in Meldungen
+Exporter = namedtuple('Exporter', 'module function reader cache options label')
+
+_RAW = Exporter('export_raw', 'create_raw', 'rows', None, (), 'Rohdaten')
+
+EXPORTERS = {
+    'xlsx': Exporter('export_to_excel', 'create_excel', 'rows', 'excel',
+                     ('streaming', 'departments', 'workers'), 'Excel'),
+    'pdf': Exporter('export_to_pdf', 'create_pdf', 'rows', 'pdf', ('workers',), 'PDF'),
+    'detail': Exporter('export_employee_detail', 'create_detail_pdf', 'detail', None, (), 'PDF'),
+    'csv': _RAW,
+    'parquet': _RAW,
+    'arrow': _RAW,
+}
+
+# Dateiendung -> Format (wie export_raw.RAW_FORMATS für die Rohdaten)
+EXTENSIONS = {
+    '.xlsx': 'xlsx',
+    '.pdf': 'pdf',
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+}
+
+# Schalter der Kommandozeile -> (Option, Wert)
+FLAGS = {
+    '--streaming': ('streaming', True),
+    '--departments': ('departments', True),
+    '--single-process': ('workers', 1),
+}
+
+
+def format_for(output_path):
+    """Format zur Dateiendung der Ausgabe, None wenn unbekannt"""
+    return EXTENSIONS.get(Path(output_path).suffix.lower())
+
+
+def load_exporter(fmt):
+    """Export-Funktion des Formats; importiert ihr Modul beim ersten Aufruf"""
+    try:
+        exporter = EXPORTERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unbekanntes Export-Format: {fmt}") from None
+    return getattr(importlib.import_module(exporter.module), exporter.function)
+
+
+def template_version(fmt):
+    """Layout-Version des Formats für den Ergebnis-Cache (None ohne Cache)"""
+    exporter = EXPORTERS[fmt]
+    if exporter.cache is None:
+        return None
+    return importlib.import_module(exporter.module).TEMPLATE_VERSION
+
+
+def export(fmt, data, output_path, **options):
+    """
+    Exportiert data im Format fmt, über den Ergebnis-Cache, falls das Format einen hat
+
+    Gibt (anzahl_zeilen, treffer) zurück wie cached_export.
+    """
+    exporter = EXPORTERS.get(fmt)
+    if exporter is None:
+        raise ValueError(f"Unbekanntes Export-Format: {fmt}")
+    unknown = set(options) - set(exporter.options)
+    if unknown:
+        raise ValueError(f"Option(en) für {fmt} nicht unterstützt: {', '.join(sorted(unknown))}")
+
+    create = load_exporter(fmt)
+    if exporter.cache is None:
+        return create(data, output_path, **options), False
+
+    from export_cache import cached_export
+    return cached_export(exporter.cache, template_version(fmt), create, data, output_path, **options)
+
+
+def _read_input(reader, input_file):
+    """Eingabe für den Reader des Formats und die Anzahl Zeilen (None bei Generatoren)"""
+    from export_input import read_rows, read_detail
+    from export_rows import OverviewRow
+
+    if reader == 'detail':
+        employee, vacation, absence = read_detail(input_file)
+        data = {'employee': employee, 'vacation': vacation, 'absence': absence}
+        return data, len(vacation) + len(absence)
+
+    data = timed_iter('json_parse', read_rows(input_file, OverviewRow))
+    return data, len(data) if isinstance(data, list) else None
+
+
+def main():
+    # Optional: --profile / --profile-stats für Zeitmessung (siehe export_profile.py)
+    args = start_profile(sys.argv[1:])
+    options = {}
+    for flag, (option, value) in FLAGS.items():
+        if flag in args:
+            args.remove(flag)
+            options[option] = value
+    fmt = None
+    if '--format' in args:
+        index = args.index('--format')
+        fmt = args[index + 1] if index + 1 < len(args) else ''
+        del args[index:index + 2]
+
+    if len(args) != 2 or fmt == '':
+        sys.stderr.buffer.write(b"FEHLER: Falsche Anzahl Parameter!\n")
+        sys.stderr.buffer.write(b"Usage: python exporters.py [--format xlsx|pdf|detail|csv|parquet|arrow] "
+                                b"[--streaming] [--departments] [--single-process] [--profile|--profile-stats] "
+                                b"<input.json|-> <output>\n")
+        sys.exit(1)
+
+    input_file, output_file = args
+    fmt = fmt or format_for(output_file)
+    exporter = EXPORTERS.get(fmt)
+    if exporter is None:
+        sys.stderr.buffer.write(f"FEHLER: Unbekanntes Export-Format für {output_file}\n".encode('utf-8'))
+        sys.exit(1)
+    unknown = [flag for flag, (option, _) in FLAGS.items() if option in options and option not in exporter.options]
+    if unknown:
+        sys.stderr.buffer.write(f"FEHLER: {', '.join(unknown)} wird für {fmt} nicht unterstützt\n".encode('utf-8'))
+        sys.exit(1)
+    record(output=output_file)
+
+    # Nur die Bibliothek dieses Formats laden (openpyxl, reportlab oder pyarrow)
+    with span('import'):
+        load_exporter(fmt)
+
+    # JSON lesen - bei "-" wird NDJSON zeilenweise von stdin gestreamt
+    try:
+        with span('json_parse'):
+            data, count = _read_input(exporter.reader, input_file)
+        if count is not None:
+            sys.stdout.buffer.write(f"JSON gelesen: {count} Eintraege\n".encode('utf-8'))
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Lesen der JSON: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        with progress_receiver(print_progress):
+            rows, _ = export(fmt, data, output_file, **options)
+        if count is None:
+            count = rows
+            sys.stdout.buffer.write(f"NDJSON gelesen: {count} Eintraege\n".encode('utf-8'))
+        record(rows=count)
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Erstellen der {exporter.label}: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vektorisierte Jahresstatistik für TeamFlow
+Berechnet Urlaubsanspruch, Übertrag, genommenen Urlaub, Krankheit, Schulung
+und Überstunden für alle Mitarbeiter und alle Jahre eines Zeitraums auf
+einmal (NumPy-Matrizen Mitarbeiter x Jahr).
+
+Die Rohtabellen werden je einmal gelesen und mit np.bincount gruppiert.
+Der Übertrag ist ein Scan über die Jahresachse (vektorisiert über alle
+Mitarbeiter) statt der Rekursion pro Mitarbeiter und Jahr in
+DataManager.berechneUebertrag.
+
+Ergebnisse entsprechen DataManager.getAlleStatistiken (data-manager.js),
+geprüft mit benchmarks/statistics_parity.js. Dies ist die einzige
+Umsetzung von Anspruch und Übertrag in den Scripts: auch Übersicht,
+Detail-PDFs und Dossier aus export_from_db rechnen hiermit.
+
+Usage: python statistics_engine.py <datenbank> <von_jahr> [bis_jahr]
+       (gibt {jahr: [zeilen]} als JSON auf stdout aus)
+"""
+
+import sys
+import json
+
+import numpy as np
+
+
+MAX_UEBERTRAG = 30
+MAX_UEBERTRAG_TIEFE = 50
+
+# Ergebnis-Spalten wie in renderer.js exportToExcel
+SPALTEN = (
+    'urlaub_anspruch',
+    'urlaub_uebertrag',
+    'urlaub_verfuegbar',
+    'urlaub_genommen',
+    'urlaub_rest',
+    'krankheit',
+    'schulung',
+    'ueberstunden',
+)
+
+
+def _load_mitarbeiter(conn):
+    """Alle aktiven Mitarbeiter, sortiert wie in getAlleStatistiken"""
+    return conn.execute("""
+        SELECT m.id, m.vorname, m.nachname, m.eintrittsdatum, m.austrittsdatum,
+               m.urlaubstage_jahr, a.name AS abteilung_name
+        FROM mitarbeiter m
+        LEFT JOIN abteilungen a ON m.abteilung_id = a.id
+        WHERE m.status = 'AKTIV'
+        ORDER BY m.nachname, m.vorname
+    """).fetchall()
+
+
+def _employee_index(ids, wanted):
+    """
+    Position jeder ID aus `wanted` in `ids` (-1 wenn unbekannt,
+    z.B. Einträge inaktiver Mitarbeiter)
+    """
+    if len(ids) == 0:
+        return np.full(len(wanted), -1)
+    sorter = np.argsort(ids)
+    pos = np.searchsorted(ids, wanted, sorter=sorter)
+    idx = sorter[np.minimum(pos, len(ids) - 1)]
+    return np.where(ids[idx] == wanted, idx, -1)
+
+
+def _grouped_sum(conn, sql, params, ids, erstes_jahr, anzahl_jahre, frueher=False):
+    """
+    Summe pro (Mitarbeiter, Jahr) als Matrix
+
+    sql muss (mitarbeiter_id, jahr, wert) liefern. Werte vor erstes_jahr
+    werden verworfen; mit frueher gibt es (matrix, vorher) zurück, vorher
+    ist ihre Summe pro Mitarbeiter (für kumulative Summen).
+    """
+    # Eine Spalte mehr vorne für die Werte vor erstes_jahr
+    breite = anzahl_jahre + 1
+    rows = conn.execute(sql, params).fetchall()
+    summen = np.zeros((len(ids), breite))
+    if rows:
+        mitarbeiter_ids, jahre, werte = zip(*rows)
+        emp = _employee_index(ids, np.array(mitarbeiter_ids, dtype=str))
+        spalte = np.maximum(np.array(jahre, dtype=np.int64) - erstes_jahr + 1, 0)
+
+        gueltig = (emp >= 0) & (spalte < breite)
+        summen = np.bincount(
+            emp[gueltig] * breite + spalte[gueltig],
+            weights=np.array(werte, dtype=np.float64)[gueltig],
+            minlength=len(ids) * breite
+        ).reshape(len(ids), breite)
+
+    if frueher:
+        return summen[:, 1:], summen[:, 0]
+    return summen[:, 1:]
+
+
+def _anspruch_matrix(urlaubstage, eintrittsjahr, eintrittsmonat, jahre):
+    """Wie DataManager.berechneAnteiligenUrlaub für alle Mitarbeiter und Jahre"""
+    anspruch = np.repeat(urlaubstage[:, None], len(jahre), axis=1)
+
+    # Im Eintrittsjahr anteilig, auf 0.5 Tage gerundet (Math.round(x * 2) / 2)
+    anteilig = np.floor(urlaubstage / 12 * (12 - eintrittsmonat + 1) * 2 + 0.5) / 2
+    spalte = eintrittsjahr - jahre[0]
+    im_zeitraum = (spalte >= 0) & (spalte < len(jahre))
+    zeilen = np.nonzero(im_zeitraum)[0]
+    anspruch[zeilen, spalte[zeilen]] = anteilig[zeilen]
+    return anspruch
+
+
+def _uebertrag_scan(anspruch, genommen, manuell, hat_manuell, eintrittsjahr, jahre):
+    """
+    Übertrag als Scan über die Jahre (entspricht berechneUebertrag)
+
+    uebertrag[j] = manuell[j]                                   falls gesetzt
+                 = 0                                            falls j - 1 < Eintrittsjahr
+                 = clip(anspruch[j-1] + uebertrag[j-1] - genommen[j-1], 0, 30)
+    """
+    uebertrag = np.zeros_like(anspruch)
+    uebertrag[:, 0] = np.where(hat_manuell[:, 0], manuell[:, 0], 0)
+
+    for j in range(1, len(jahre)):
+        rest = anspruch[:, j - 1] + uebertrag[:, j - 1] - genommen[:, j - 1]
+        berechnet = np.clip(rest, 0, MAX_UEBERTRAG)
+        berechnet = np.where(jahre[j] - 1 < eintrittsjahr, 0, berechnet)
+        uebertrag[:, j] = np.where(hat_manuell[:, j], manuell[:, j], berechnet)
+
+    return uebertrag
+
+
+def compute_statistics(conn, von_jahr, bis_jahr=None, mitarbeiter=None):
+    """
+    Statistik aller aktiven Mitarbeiter für die Jahre von_jahr..bis_jahr
+
+    mitarbeiter: statt aller aktiven nur diese Zeilen (Spalten wie
+    _load_mitarbeiter, z.B. export_from_db.load_employee); gelesen werden
+    dann nur ihre Einträge.
+
+    Rückgabe: dict mit
+        'jahre':       int-Array der Jahre (Spalten)
+        'mitarbeiter': Liste {id, name, abteilung, urlaubstage_jahr}
+                       (Zeilen, sortiert nach Name)
+        'sichtbar':    bool-Matrix, ob der Mitarbeiter im Jahr gelistet wird
+                       (kein Austritt vor dem Jahr)
+        je Spalte aus SPALTEN eine float-Matrix Mitarbeiter x Jahr
+        'ueberstunden_jahr': Überstunden nur des Jahres (statt kumulativ)
+    """
+    bis_jahr = bis_jahr or von_jahr
+    nur = ''
+    if mitarbeiter is None:
+        mitarbeiter = _load_mitarbeiter(conn)
+    elif mitarbeiter:
+        nur = f" AND mitarbeiter_id IN ({', '.join('?' * len(mitarbeiter))})"
+    nur_ids = tuple(ma['id'] for ma in mitarbeiter) if nur else ()
+
+    ids = np.array([ma['id'] for ma in mitarbeiter], dtype=str)
+    urlaubstage = np.array([ma['urlaubstage_jahr'] or 0 for ma in mitarbeiter], dtype=np.float64)
+    eintrittsjahr = np.array([int(ma['eintrittsdatum'][:4]) for ma in mitarbeiter], dtype=np.int64)
+    eintrittsmonat = np.array([int(ma['eintrittsdatum'][5:7]) for ma in mitarbeiter], dtype=np.int64)
+    austrittsjahr = np.array(
+        [int(ma['austrittsdatum'][:4]) if ma['austrittsdatum'] else 10000 for ma in mitarbeiter],
+        dtype=np.int64
+    )
+
+    # Der Scan beginnt beim frühesten Eintritt, höchstens aber so weit
+    # zurück wie die Rekursion in data-manager.js (Tiefe 50)
+    erstes_jahr = von_jahr - MAX_UEBERTRAG_TIEFE - 1
+    if len(eintrittsjahr):
+        erstes_jahr = max(erstes_jahr, min(int(eintrittsjahr.min()), von_jahr))
+    jahre = np.arange(erstes_jahr, bis_jahr + 1)
+    anzahl_jahre = len(jahre)
+    jahr_ende = f"{bis_jahr + 1:04d}-01-01"
+
+    def summe(sql, grenze, frueher=False):
+        return _grouped_sum(conn, sql + nur, (grenze, *nur_ids), ids, erstes_jahr, anzahl_jahre, frueher)
+
+    genommen = summe("""
+        SELECT mitarbeiter_id, CAST(substr(von_datum, 1, 4) AS INTEGER), COALESCE(tage, 0)
+        FROM urlaub
+        WHERE von_datum < ?
+    """, jahr_ende)
+
+    krankheit = summe("""
+        SELECT mitarbeiter_id, CAST(substr(von_datum, 1, 4) AS INTEGER), COALESCE(tage, 0)
+        FROM krankheit
+        WHERE von_datum < ?
+    """, jahr_ende)
+
+    schulung = summe("""
+        SELECT mitarbeiter_id, CAST(substr(datum, 1, 4) AS INTEGER), COALESCE(dauer_tage, 0)
+        FROM schulung
+        WHERE datum < ?
+    """, jahr_ende)
+
+    # Überstunden kumulativ bis einschließlich Jahr (mit allen früheren Jahren)
+    ueberstunden_jahr, ueberstunden_vorher = summe("""
+        SELECT mitarbeiter_id, CAST(substr(datum, 1, 4) AS INTEGER), COALESCE(stunden, 0)
+        FROM ueberstunden
+        WHERE datum < ?
+    """, jahr_ende, frueher=True)
+    ueberstunden = ueberstunden_vorher[:, None] + np.cumsum(ueberstunden_jahr, axis=1)
+
+    # Manuelle Überträge: Wert und Maske (jahr ist eindeutig pro Mitarbeiter)
+    manuell = summe("""
+        SELECT mitarbeiter_id, jahr, uebertrag_tage FROM uebertrag_manuell WHERE jahr <= ?
+    """, bis_jahr)
+    hat_manuell = summe("""
+        SELECT mitarbeiter_id, jahr, 1 FROM uebertrag_manuell WHERE jahr <= ?
+    """, bis_jahr) > 0
+
+    anspruch = _anspruch_matrix(urlaubstage, eintrittsjahr, eintrittsmonat, jahre)
+    uebertrag = _uebertrag_scan(anspruch, genommen, manuell, hat_manuell, eintrittsjahr, jahre)
+
+    # Nur den angefragten Zeitraum zurückgeben
+    ausschnitt = slice(von_jahr - erstes_jahr, None)
+    anspruch, uebertrag, genommen = anspruch[:, ausschnitt], uebertrag[:, ausschnitt], genommen[:, ausschnitt]
+    jahre = jahre[ausschnitt]
+
+    return {
+        'jahre': jahre,
+        'mitarbeiter': [
+            {'id': ma['id'], 'name': f"{ma['vorname']} {ma['nachname']}", 'abteilung': ma['abteilung_name'],
+             'urlaubstage_jahr': ma['urlaubstage_jahr']}
+            for ma in mitarbeiter
+        ],
+        'sichtbar': austrittsjahr[:, None] >= jahre[None, :],
+        'urlaub_anspruch': anspruch,
+        'urlaub_uebertrag': uebertrag,
+        'urlaub_verfuegbar': anspruch + uebertrag,
+        'urlaub_genommen': genommen,
+        'urlaub_rest': anspruch + uebertrag - genommen,
+        'krankheit': krankheit[:, ausschnitt],
+        'schulung': schulung[:, ausschnitt],
+        'ueberstunden': ueberstunden[:, ausschnitt],
+        'ueberstunden_jahr': ueberstunden_jahr[:, ausschnitt],
+    }
+
+
+def _zahl(value):
+    """float -> int, wenn ganzzahlig (wie die Zahlen aus JavaScript)"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def iter_overview_rows(statistik, jahr, abteilung=None):
+    """Zeilen der Urlaubsübersicht eines Jahres (Format von renderer.js exportToExcel)"""
+    spalte = int(jahr - statistik['jahre'][0])
+    matrizen = [statistik[name][:, spalte] for name in SPALTEN]
+    sichtbar = statistik['sichtbar'][:, spalte]
+
+    for i, ma in enumerate(statistik['mitarbeiter']):
+        if not sichtbar[i]:
+            continue
+        if abteilung and abteilung != 'Alle' and ma['abteilung'] != abteilung:
+            continue
+        row = {'mitarbeiter_id': ma['id'], 'mitarbeiter': ma['name'], 'abteilung': ma['abteilung']}
+        for name, werte in zip(SPALTEN, matrizen):
+            row[name] = _zahl(werte[i])
+        yield row
+
+
+def iter_employee_years(statistik, index):
+    """Werte eines Mitarbeiters (Zeile index) für jedes Jahr: {jahr, SPALTEN..., ueberstunden_jahr}"""
+    namen = SPALTEN + ('ueberstunden_jahr',)
+    for spalte, jahr in enumerate(statistik['jahre']):
+        werte = {'jahr': int(jahr)}
+        for name in namen:
+            werte[name] = _zahl(statistik[name][index, spalte])
+        yield werte
+
+
+def main():
+    if len(sys.argv) not in (3, 4):
+        sys.stderr.buffer.write(b"FEHLER: Falsche Anzahl Parameter!\n")
+        sys.stderr.buffer.write(b"Usage: python statistics_engine.py <datenbank> <von_jahr> [bis_jahr]\n")
+        sys.exit(1)
+
+    from export_from_db import open_database
+
+    try:
+        von_jahr = int(sys.argv[2])
+        bis_jahr = int(sys.argv[3]) if len(sys.argv) == 4 else von_jahr
+        conn = open_database(sys.argv[1])
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Öffnen der Datenbank: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    try:
+        statistik = compute_statistics(conn, von_jahr, bis_jahr)
+        result = {
+            str(jahr): list(iter_overview_rows(statistik, jahr))
+            for jahr in range(von_jahr, bis_jahr + 1)
+        }
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER bei der Berechnung: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    sys.stdout.buffer.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+    sys.stdout.buffer.write(b"\n")
+
+
+if __name__ == '__main__':
+    main()
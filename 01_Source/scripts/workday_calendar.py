@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arbeitstage-Kalender für TeamFlow
+Vorberechneter Tagesindex (NumPy) mit Feiertagsmaske und Präfixsummen pro
+Arbeitszeitmodell. Die Anzahl der Urlaubs-/Arbeitstage eines Zeitraums
+von-bis ist damit ein O(1)-Lookup statt einer Schleife über alle Tage.
+
+Die Zählung entspricht berechneUrlaubstageAsync (mit Arbeitszeitmodell)
+bzw. berechneArbeitstageAsync (Mo-Fr) in dialog-base.js:
+    VOLL = 1 Tag, HALB = 0.5 Tage, FREI = 0, Feiertage zählen nicht.
+Feiertage sind wie in der App nur die Einträge der Tabelle feiertage.
+
+Deutsche Standard-Feiertage werden lokal berechnet (Gaußsche Osterformel,
+wie FeiertagDialog.ladeStandardFeiertage), keine Netzwerkzugriffe. Als
+Ersatz für Jahre ohne eingetragene Feiertage nur auf Wunsch (siehe
+WorkdayCalendar.from_database), die Zählung weicht dann von der App ab.
+
+Usage: python workday_calendar.py <datenbank> [jahr]
+       (prüft die gespeicherten Tage von Urlaub und Krankheit)
+"""
+
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+
+
+# Wochentag 0 = Montag ... 6 = Sonntag (wie in der Tabelle arbeitszeitmodell)
+STANDARD_MODELL = ('VOLL', 'VOLL', 'VOLL', 'VOLL', 'VOLL', 'FREI', 'FREI')
+
+# Gewichte in halben Tagen, damit die Präfixsummen ganzzahlig bleiben
+_HALBE_TAGE = {'VOLL': 2, 'HALB': 1, 'FREI': 0}
+
+# 1970-01-01 (Tag 0 von datetime64) war ein Donnerstag
+_WOCHENTAG_EPOCHE = 3
+
+
+def ostersonntag(jahr):
+    """Osterdatum nach der Gaußschen Osterformel (wie berechneOstersonntag)"""
+    a = jahr % 19
+    b = jahr // 100
+    c = jahr % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    monat = (h + l - 7 * m + 114) // 31
+    tag = ((h + l - 7 * m + 114) % 31) + 1
+    return date(jahr, monat, tag)
+
+
+def standard_feiertage(jahr, bundesland=None):
+    """
+    Deutsche Standard-Feiertage eines Jahres als Liste (datum, name, bundesland)
+
+    Ohne bundesland alle Einträge wie in FeiertagDialog.ladeStandardFeiertage,
+    sonst nur die bundesweiten und die des Bundeslands.
+    """
+    ostern = ostersonntag(jahr)
+
+    def oster_offset(tage):
+        return (ostern + timedelta(days=tage)).isoformat()
+
+    def datum(monat, tag):
+        return f"{jahr:04d}-{monat:02d}-{tag:02d}"
+
+    feiertage = [
+        (datum(1, 1), 'Neujahr', None),
+        (oster_offset(-2), 'Karfreitag', None),
+        (oster_offset(0), 'Ostersonntag', None),
+        (oster_offset(1), 'Ostermontag', None),
+        (datum(5, 1), 'Tag der Arbeit', None),
+        (oster_offset(39), 'Christi Himmelfahrt', None),
+        (oster_offset(49), 'Pfingstsonntag', None),
+        (oster_offset(50), 'Pfingstmontag', None),
+        (datum(10, 3), 'Tag der Deutschen Einheit', None),
+        (datum(12, 25), '1. Weihnachtstag', None),
+        (datum(12, 26), '2. Weihnachtstag', None),
+        # Regionale Feiertage
+        (datum(1, 6), 'Heilige Drei Könige', 'BY'),
+        (oster_offset(60), 'Fronleichnam', 'NW'),
+        (datum(8, 15), 'Mariä Himmelfahrt', 'BY'),
+        (datum(10, 31), 'Reformationstag', 'SN'),
+        (datum(11, 1), 'Allerheiligen', 'NW'),
+    ]
+
+    if bundesland is None:
+        return feiertage
+    return [f for f in feiertage if f[2] is None or f[2] == bundesland]
+
+
+def normalize_model(eintraege):
+    """
+    Arbeitszeitmodell als Tupel mit 7 Einträgen (Mo-So)
+
+    eintraege: Zeilen (wochentag, arbeitszeit) aus der Tabelle arbeitszeitmodell.
+    Fehlende Tage wie in berechneUrlaubstageWert: Mo-Fr VOLL, Sa-So FREI.
+    """
+    modell = list(STANDARD_MODELL)
+    for wochentag, arbeitszeit in eintraege or ():
+        if 0 <= wochentag <= 6:
+            # Unbekannte Werte zählen als voller Tag (default im switch)
+            modell[wochentag] = arbeitszeit if arbeitszeit in _HALBE_TAGE else 'VOLL'
+    return tuple(modell)
+
+
+def load_work_models(conn):
+    """Arbeitszeitmodelle aller Mitarbeiter als {mitarbeiter_id: modell}"""
+    eintraege = {}
+    for mitarbeiter_id, wochentag, arbeitszeit in conn.execute(
+        "SELECT mitarbeiter_id, wochentag, arbeitszeit FROM arbeitszeitmodell"
+    ):
+        eintraege.setdefault(mitarbeiter_id, []).append((wochentag, arbeitszeit))
+    return {mitarbeiter_id: normalize_model(rows) for mitarbeiter_id, rows in eintraege.items()}
+
+
+def _to_days(datum):
+    """ISO-Datum(e) -> datetime64[D] (Strings, date oder Arrays)"""
+    return np.asarray(datum, dtype='datetime64[D]')
+
+
+class WorkdayCalendar:
+    """
+    Tagesindex für die Jahre erstes_jahr..letztes_jahr
+
+    Pro Tag werden Wochentag und Feiertagsmaske einmal berechnet; pro
+    Arbeitszeitmodell entsteht beim ersten Zugriff eine Präfixsumme der
+    Tageswerte (gecacht). Die Tage eines Jahres sind ein zusammenhängender
+    Ausschnitt dieses Index (siehe bitmap()).
+    """
+
+    def __init__(self, feiertage, erstes_jahr, letztes_jahr):
+        self.erstes_jahr = erstes_jahr
+        self.letztes_jahr = letztes_jahr
+        self._start = np.datetime64(f"{erstes_jahr:04d}-01-01", 'D')
+        ende = np.datetime64(f"{letztes_jahr + 1:04d}-01-01", 'D')
+        anzahl = int((ende - self._start).astype(np.int64))
+
+        tage = np.arange(anzahl, dtype=np.int64)
+        self._wochentag = (tage + self._start.astype(np.int64) + _WOCHENTAG_EPOCHE) % 7
+
+        self._feiertag = np.zeros(anzahl, dtype=bool)
+        feiertage = list(feiertage)
+        if feiertage:
+            index = (_to_days(feiertage) - self._start).astype(np.int64)
+            self._feiertag[index[(index >= 0) & (index < anzahl)]] = True
+
+        self._praefix = {}
+
+    @classmethod
+    def from_database(cls, conn, erstes_jahr, letztes_jahr, standard_ergaenzen=False, bundesland=None):
+        """
+        Kalender mit den Feiertagen aus der Tabelle feiertage (wie die App)
+
+        Mit standard_ergaenzen erhalten Jahre ohne eingetragene Feiertage die
+        lokal berechneten Standard-Feiertage: die bundesweiten und, falls
+        angegeben, die des Bundeslands. Die App kennt diesen Ersatz nicht,
+        die Zählung weicht für solche Jahre also von ihr ab.
+        """
+        von = f"{erstes_jahr:04d}-01-01"
+        bis = f"{letztes_jahr + 1:04d}-01-01"
+        feiertage = [row[0] for row in conn.execute(
+            "SELECT datum FROM feiertage WHERE datum >= ? AND datum < ?", (von, bis)
+        )]
+
+        if standard_ergaenzen:
+            vorhanden = {int(datum[:4]) for datum in feiertage}
+            for jahr in range(erstes_jahr, letztes_jahr + 1):
+                if jahr not in vorhanden:
+                    feiertage.extend(datum for datum, _, land in standard_feiertage(jahr)
+                                     if land is None or land == bundesland)
+
+        return cls(feiertage, erstes_jahr, letztes_jahr)
+
+    def _prefix(self, modell):
+        modell = modell or STANDARD_MODELL
+        praefix = self._praefix.get(modell)
+        if praefix is None:
+            gewichte = np.array([_HALBE_TAGE[modell[tag]] for tag in range(7)], dtype=np.int64)
+            halbe_tage = np.where(self._feiertag, 0, gewichte[self._wochentag])
+            praefix = np.concatenate(([0], np.cumsum(halbe_tage)))
+            self._praefix[modell] = praefix
+        return praefix
+
+    def _index(self, datum):
+        index = (_to_days(datum) - self._start).astype(np.int64)
+        if np.any((index < 0) | (index >= len(self._wochentag))):
+            raise ValueError(
+                f"Datum außerhalb des Kalenders ({self.erstes_jahr}-{self.letztes_jahr})"
+            )
+        return index
+
+    def bitmap(self, jahr, modell=None):
+        """Arbeitstage eines Jahres als bool-Array (Feiertage ausmaskiert)"""
+        start = int((np.datetime64(f"{jahr:04d}-01-01", 'D') - self._start).astype(np.int64))
+        ende = int((np.datetime64(f"{jahr + 1:04d}-01-01", 'D') - self._start).astype(np.int64))
+        return np.diff(self._prefix(modell)[start:ende + 1]) > 0
+
+    def day_values(self, von, bis, modell=None):
+        """Tageswerte von-bis (1, 0.5 oder 0 pro Tag, Feiertage 0) als Array"""
+        praefix = self._prefix(modell)
+        start = int(self._index(von))
+        ende = int(self._index(bis))
+        return np.diff(praefix[start:ende + 2]) / 2
+
+    def count(self, von, bis, modell=None):
+        """Urlaubs-/Arbeitstage von-bis (beide inklusive)"""
+        return float(self.count_many([von], [bis], modell)[0])
+
+    def count_many(self, von, bis, modell=None):
+        """Wie count(), vektorisiert für Arrays von Start- und Enddaten"""
+        praefix = self._prefix(modell)
+        start = self._index(von)
+        ende = self._index(bis)
+        halbe_tage = np.where(ende >= start, praefix[ende + 1] - praefix[start], 0)
+        return halbe_tage / 2
+
+
+def check_entries(entries, calendar, models=None):
+    """
+    Vergleicht gespeicherte Tage mit dem Kalender
+
+    entries: Zeilen (mitarbeiter_id, von, bis, tage)
+    models:  {mitarbeiter_id: modell}; ohne Angabe wird Mo-Fr gezählt
+    Liefert die abweichenden Einträge als (mitarbeiter_id, von, bis, tage, berechnet).
+
+    Ein halber Tag weniger als berechnet gilt als korrekt (Auswahl
+    "Halber Tag" im Dialog bucht 0.5 für einen ganzen Arbeitstag).
+    """
+    models = models or {}
+    nach_modell = {}
+    for entry in entries:
+        nach_modell.setdefault(models.get(entry[0], STANDARD_MODELL), []).append(entry)
+
+    abweichungen = []
+    for modell, gruppe in nach_modell.items():
+        berechnet = calendar.count_many([e[1] for e in gruppe], [e[2] for e in gruppe], modell)
+        gespeichert = np.array([e[3] or 0 for e in gruppe], dtype=np.float64)
+        differenz = berechnet - gespeichert
+        falsch = (differenz != 0) & (differenz != 0.5)
+        abweichungen.extend(
+            (*gruppe[i], float(berechnet[i])) for i in np.nonzero(falsch)[0]
+        )
+    return abweichungen
+
+
+def main():
+    if len(sys.argv) not in (2, 3):
+        sys.stderr.buffer.write(b"FEHLER: Falsche Anzahl Parameter!\n")
+        sys.stderr.buffer.write(b"Usage: python workday_calendar.py <datenbank> [jahr]\n")
+        sys.exit(1)
+
+    from export_from_db import open_database
+
+    try:
+        conn = open_database(sys.argv[1])
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER beim Öffnen der Datenbank: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+
+    jahr = int(sys.argv[2]) if len(sys.argv) == 3 else None
+    where = "WHERE von_datum >= ? AND von_datum < ?" if jahr else ""
+    params = (f"{jahr:04d}-01-01", f"{jahr + 1:04d}-01-01") if jahr else ()
+
+    try:
+        erstes, letztes = conn.execute(f"""
+            SELECT MIN(substr(von_datum, 1, 4)), MAX(substr(bis_datum, 1, 4))
+            FROM (SELECT von_datum, bis_datum FROM urlaub {where}
+                  UNION ALL SELECT von_datum, bis_datum FROM krankheit {where})
+        """, params * 2).fetchone()
+        if erstes is None:
+            sys.stdout.buffer.write("Keine Einträge vorhanden\n".encode('utf-8'))
+            return
+
+        calendar = WorkdayCalendar.from_database(conn, int(erstes), int(letztes))
+        pruefungen = [
+            # Urlaub mit Arbeitszeitmodell, Krankheit Mo-Fr (wie in den Dialogen)
+            ('Urlaub', 'urlaub', load_work_models(conn)),
+            ('Krankheit', 'krankheit', None),
+        ]
+
+        gesamt = 0
+        for label, tabelle, models in pruefungen:
+            entries = conn.execute(
+                f"SELECT mitarbeiter_id, von_datum, bis_datum, tage FROM {tabelle} {where}", params
+            ).fetchall()
+            abweichungen = check_entries(entries, calendar, models)
+            gesamt += len(abweichungen)
+            for mitarbeiter_id, von, bis, tage, berechnet in abweichungen:
+                sys.stdout.buffer.write(
+                    f"{label} {mitarbeiter_id} {von} - {bis}: gespeichert {tage}, berechnet {berechnet}\n".encode('utf-8')
+                )
+            sys.stdout.buffer.write(f"{label}: {len(entries)} Einträge geprüft, {len(abweichungen)} Abweichungen\n".encode('utf-8'))
+    except Exception as e:
+        sys.stderr.buffer.write(f"FEHLER bei der Prüfung: {str(e)}\n".encode('utf-8'))
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    sys.exit(1 if gesamt else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -492,6 +492,7 @@ async function exportToExcel() {
     }
     
     const exportData = stats.map(stat => ({
+      mitarbeiter_id: stat.mitarbeiter.id,
       mitarbeiter: `${stat.mitarbeiter.vorname} ${stat.mitarbeiter.nachname}`,
       abteilung: stat.mitarbeiter.abteilung_name,
       urlaub_anspruch: stat.urlaubsanspruch,